@@ -0,0 +1,47 @@
+"""Run the same slates through every installed solver backend (plus the native engine).
+
+Reports wall time per lineup and solution quality relative to the best total
+objective found for each slate.
+
+Usage: python -m benchmarks.bench_backends [--sizes 100,400] [--count 10] [--time-limit S]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import generate_n_lineups
+from src.parallel import _objective
+from src.solvers import available_backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=str, default='100,400')
+    parser.add_argument('--count', type=int, default=10)
+    parser.add_argument('--time-limit', type=float, default=None)
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--mip-gap', type=float, default=None)
+    parser.add_argument('--stack-penalty', type=float, default=2.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    runs = [(name, dict(solver=name, time_limit=args.time_limit, threads=args.threads, mip_gap=args.mip_gap)) for name in available_backends()]
+    runs.append(('native', dict(engine='native')))
+
+    print(f"{'players':>8} {'backend':>8} {'seconds':>8} {'ms/lineup':>10} {'lineups':>8} {'objective':>10} {'vs best':>8}")
+    for size in [int(s) for s in args.sizes.split(',')]:
+        players = synthetic_players(size, seed=args.seed)
+        rows = []
+        for name, opts in runs:
+            start = time.perf_counter()
+            lineups = generate_n_lineups(players, n=args.count, stack_penalty=args.stack_penalty, incremental=True, **opts)
+            elapsed = time.perf_counter() - start
+            total = sum(_objective(lu, args.stack_penalty) for lu in lineups)
+            rows.append((name, elapsed, len(lineups), total))
+        best = max(total for *_, total in rows) or 1.0
+        for name, elapsed, count, total in rows:
+            print(f"{len(players):>8} {name:>8} {elapsed:>8.2f} {1000 * elapsed / max(count, 1):>10.1f} {count:>8} {total:>10.2f} {total / best:>7.1%}")
+
+
+if __name__ == '__main__':
+    main()
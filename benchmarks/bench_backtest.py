@@ -0,0 +1,66 @@
+"""Backtest of a synthetic season: cold run vs a rerun answered from the result cache.
+
+Writes a season of generate_slate weeks (FFToolbox CSVs plus actual points
+drawn around the projections) to a temp archive, then runs the backtest
+twice against a fresh result cache.
+
+Usage: python -m benchmarks.bench_backtest [--weeks 17] [--players 300] [--count 20] [--workers N] [--engine milp]
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import fftoolbox_csv, synthetic_players
+from src.backtest import format_report, run_backtest
+from src.result_cache import ResultCache
+
+
+def write_season(directory: str, weeks: int, n_players: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for week in range(1, weeks + 1):
+        players = synthetic_players(n_players, seed=seed * 100 + week)
+        name = os.path.join(directory, f"w{week:02d}")
+        with open(name + '.csv', 'w', encoding='utf-8', newline='') as f:
+            f.write(fftoolbox_csv(players))
+        with open(name + '_actuals.csv', 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Name', 'Pos', 'Team', 'Points'])
+            for p in players:
+                points = max(-4.0, rng.normal(p.proj, 0.5 * max(p.proj, 1.0)))
+                writer.writerow([p.name, 'DEF' if p.is_dst else p.position, p.team, round(points, 2)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--weeks', type=int, default=17)
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--engine', choices=['milp', 'native'], default='milp')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verbose', action='store_true', help='Print the full report of the cold run')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, 'archive')
+        os.makedirs(archive)
+        write_season(archive, args.weeks, args.players, args.seed)
+        cache = ResultCache(os.path.join(tmp, 'cache'), max_entries=10_000)
+        for label in ('cold', 'cached'):
+            start = time.perf_counter()
+            report = run_backtest(archive, count=args.count, workers=args.workers, cache=cache, overrides={'engine': args.engine})
+            elapsed = time.perf_counter() - start
+            print(f"{label:<7} {len(report['weeks'])} weeks x {len(report['summary'])} presets: {elapsed:>7.2f}s "
+                  f"({report['jobs']} solves, {report['cached']} from cache)")
+            if label == 'cold' and args.verbose:
+                print(format_report(report))
+        for preset, m in report['summary'].items():
+            print(f"  {preset:<16} cash {100 * m['cash_rate']:5.1f}%  ROI {m['cash_roi']:+.3f}  top {100 * m['top_rate']:4.1f}%  eff {m['efficiency']:.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Per-lineup latency of the diversity modes: overlap cuts vs fixed-size exposure model.
+
+The 'cuts' mode adds rows per earlier lineup, so later solves get slower; the
+'exposure' mode solves a model of the same size every time. Overlap targets
+that the exposure mode misses show up in the excess columns.
+
+Usage: python -m benchmarks.bench_diversity [--players 300] [--counts 20,150,500] [--overlap-max 6]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.lineups import LineupArray, overlap_report
+from src.optimizer import generate_n_lineups
+from src.slate import compile_slate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--counts', type=str, default='20,150,500')
+    parser.add_argument('--overlap-max', type=int, default=6)
+    parser.add_argument('--avg-overlap-max', type=float, default=None)
+    parser.add_argument('--max-exposure', type=float, default=0.5)
+    parser.add_argument('--exposure-penalty', type=float, default=0.5)
+    parser.add_argument('--modes', type=str, default='cuts,exposure')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, seed=args.seed)
+    slate = compile_slate(players)
+    print(f"slate: {len(players)} players, overlap_max={args.overlap_max}, avg_overlap_max={args.avg_overlap_max}")
+    print(f"{'n':>5} {'mode':>9} {'found':>6} {'total s':>8} {'ms/lineup':>10} {'last 10%':>9} {'rows':>6} {'max ov':>7} {'ov excess':>10} {'avg excess':>11}")
+    for n in [int(c) for c in args.counts.split(',')]:
+        for mode in args.modes.split(','):
+            options = {'max_exposure': args.max_exposure, 'exposure_penalty': args.exposure_penalty} if mode == 'exposure' else {}
+            events = []
+            start = time.perf_counter()
+            lineups = generate_n_lineups(
+                players, n=n, overlap_max=args.overlap_max, avg_overlap_max=args.avg_overlap_max,
+                diversity=mode, on_iteration=events.append, **options,
+            )
+            total = time.perf_counter() - start
+            tail = events[-max(1, len(events) // 10):]
+            tail_ms = 1000 * sum(e['build_s'] + e['solve_s'] + e['extract_s'] for e in tail) / len(tail)
+            report = overlap_report(LineupArray.from_dicts(slate, lineups), args.overlap_max, args.avg_overlap_max)
+            print(f"{n:>5} {mode:>9} {len(lineups):>6} {total:>8.2f} {1000 * total / max(len(lineups), 1):>10.1f} {tail_ms:>9.1f} "
+                  f"{events[-1]['constraints']:>6} {report['max_overlap']:>7} {report['overlap_excess']:>10} {report['avg_overlap_excess']:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
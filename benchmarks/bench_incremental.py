@@ -0,0 +1,34 @@
+"""Per-lineup latency of generate_n_lineups: full rebuild vs incremental model.
+
+Usage: python -m benchmarks.bench_incremental [--players 400] [--counts 1,10,25,50]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import generate_n_lineups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--counts', type=str, default='1,10,25,50')
+    parser.add_argument('--overlap-max', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, seed=args.seed)
+    print(f"slate: {len(players)} players")
+    print(f"{'n':>5} {'rebuild s':>10} {'ms/lineup':>10} {'incremental s':>14} {'ms/lineup':>10} {'speedup':>8}")
+    for n in [int(c) for c in args.counts.split(',')]:
+        timings = []
+        for incremental in (False, True):
+            start = time.perf_counter()
+            lineups = generate_n_lineups(players, n=n, overlap_max=args.overlap_max, incremental=incremental)
+            timings.append((time.perf_counter() - start, len(lineups)))
+        (t_full, n_full), (t_inc, n_inc) = timings
+        print(f"{n:>5} {t_full:>10.2f} {1000 * t_full / max(n_full, 1):>10.1f} {t_inc:>14.2f} {1000 * t_inc / max(n_inc, 1):>10.1f} {t_full / t_inc:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
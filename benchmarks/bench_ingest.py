@@ -0,0 +1,41 @@
+"""CSV ingestion throughput on a large salary file.
+
+Writes FFToolbox and plain salary CSVs of roughly ``--rows`` rows to a temp
+directory and times parsing from an in-memory string and streaming from disk.
+
+Usage: python -m benchmarks.bench_ingest [--rows 50000] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.common import fftoolbox_csv, salary_csv, slate_with_rows
+from src.data_sources.ingest import FFTOOLBOX_SCHEMA, SALARY_SCHEMA, read_csv_file, read_csv_text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = slate_with_rows(args.rows, seed=args.seed)
+    print(f"{'file':>10} {'source':>6} {'rows':>7} {'seconds':>8} {'rows/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, text, schema in (('fftoolbox', fftoolbox_csv(players), FFTOOLBOX_SCHEMA), ('salary', salary_csv(players), SALARY_SCHEMA)):
+            path = os.path.join(tmp, f"{label}.csv")
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            for source, parse in (('text', lambda: read_csv_text(text, schema)), ('file', lambda: read_csv_file(path, schema))):
+                best = float('inf')
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    rows = len(parse())
+                    best = min(best, time.perf_counter() - start)
+                print(f"{label:>10} {source:>6} {rows:>7} {best:>8.3f} {rows / best:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Late swap of 150 lineups: reduced per-lineup models vs full-slate models.
+
+Lineups are generated on a synthetic slate, the teams of the first games are
+locked, a few open players are ruled out and the open projections move. The
+baseline re-solves every lineup on the full slate with the same fixings;
+late_swap uses the pruned open pool, sequentially and in a process pool.
+
+Usage: python -m benchmarks.bench_late_swap [--players 300] [--lineups 150] [--locked-share 0.4] [--workers 4]
+"""
+import argparse
+import dataclasses
+import os
+import random
+import time
+
+from pulp import LpSolutionIntegerFeasible, LpSolutionOptimal
+
+from benchmarks.common import synthetic_players
+from src.late_swap import late_swap
+from src.optimizer import _build_model, generate_n_lineups
+from src.roster import DK_SALARY_CAP
+from src.slate import compile_slate
+from src.solvers import make_solver
+
+
+def full_model_swap(lineups, players, locked, unavailable, team_max):
+    """Baseline: one full-slate model per lineup with locked players fixed and the rest bounded."""
+    slate = compile_slate(players)
+    swapped = []
+    for lineup in lineups:
+        prob, x = _build_model(slate, DK_SALARY_CAP, team_max, 0.0)
+        for i, pid in enumerate(slate.ids):
+            if pid in locked:
+                if pid in lineup:
+                    x[i].lowBound = 1
+                else:
+                    x[i].upBound = 0
+            elif pid in unavailable:
+                x[i].upBound = 0
+        prob.solve(make_solver('cbc'))
+        ok = prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible)
+        swapped.append([slate.ids[i] for i, var in enumerate(x) if (var.varValue or 0) > 0.5] if ok else list(lineup))
+    return swapped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--lineups', type=int, default=150)
+    parser.add_argument('--locked-share', type=float, default=0.4, help='Share of teams whose games have started')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-baseline', action='store_true')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players = synthetic_players(args.players, seed=args.seed)
+    start = time.perf_counter()
+    lineups = generate_n_lineups(players, n=args.lineups, overlap_max=6, diversity='exposure', max_exposure=0.5, exposure_penalty=0.5)
+    print(f"slate: {len(players)} players, {len(lineups)} lineups generated in {time.perf_counter() - start:.1f}s")
+
+    teams = sorted({p.team for p in players})
+    locked_teams = set(teams[:round(len(teams) * args.locked_share)])
+    locked = {p.id for p in players if p.team in locked_teams}
+    # News after lock: projections of open players move and a few get ruled out
+    players = [p if p.id in locked else dataclasses.replace(p, proj=round(p.proj * rng.uniform(0.8, 1.2), 2)) for p in players]
+    open_ids = sorted({pid for lu in lineups for pid in lu} - locked)
+    unavailable = set(rng.sample(open_ids, min(5, len(open_ids))))
+    in_lineups = sum(pid in locked for lu in lineups for pid in lu)
+    print(f"locked: {len(locked_teams)} teams, {len(locked)} players ({in_lineups / (9 * len(lineups)):.0%} of lineup slots); {len(unavailable)} ruled out")
+
+    ids = [sorted(lu) for lu in lineups]
+    if not args.skip_baseline:
+        start = time.perf_counter()
+        full_model_swap(ids, players, locked, unavailable, 3)
+        elapsed = time.perf_counter() - start
+        print(f"{'full model, 1 process':<28} {elapsed:>8.2f}s {1000 * elapsed / len(ids):>8.1f} ms/lineup")
+    for workers in sorted({1, args.workers}):
+        events = []
+        start = time.perf_counter()
+        late_swap(ids, players, locked=locked, unavailable=unavailable, workers=workers, on_iteration=events.append)
+        elapsed = time.perf_counter() - start
+        variables = max(e['variables'] for e in events)
+        swapped = sum(e['swapped'] for e in events)
+        print(f"{f'late_swap, {workers} process(es)':<28} {elapsed:>8.2f}s {1000 * elapsed / len(ids):>8.1f} ms/lineup "
+              f"(<= {variables} variables per model, {swapped} players swapped)")
+
+
+if __name__ == '__main__':
+    main()
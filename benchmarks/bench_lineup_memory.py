@@ -0,0 +1,78 @@
+"""Memory of 100k lineups: dict-of-Player lineups vs a LineupArray.
+
+The dict representation is what generate_n_lineups returns (plus the set of
+ids the sequential chain kept per lineup); Player objects are shared by both.
+Also compares a slotted Player with an equivalent __dict__-based dataclass.
+
+Usage: python -m benchmarks.bench_lineup_memory [--lineups 100000] [--players 400]
+"""
+import argparse
+import dataclasses
+import random
+import time
+import tracemalloc
+from typing import Optional
+
+from benchmarks.common import synthetic_players
+from src.lineups import LineupArray
+from src.models import Player
+from src.slate import compile_slate
+
+
+@dataclasses.dataclass
+class DictPlayer:
+    """Player as it was before slots, for comparison."""
+    id: str
+    name: str
+    position: str
+    team: str
+    opponent: Optional[str]
+    proj: float
+    salary: int
+    is_dst: bool = False
+
+
+def _measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lineups', type=int, default=100000)
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    slate = compile_slate(synthetic_players(args.players, seed=args.seed))
+    rng = random.Random(args.seed)
+    picks = [rng.sample(range(len(slate)), 9) for _ in range(args.lineups)]
+
+    dicts, dict_bytes, dict_s = _measure(lambda: [({slate.ids[i]: slate.players[i] for i in idx}, {slate.ids[i] for i in idx}) for idx in picks])
+    array, array_bytes, array_s = _measure(lambda: LineupArray.from_indices(slate, picks))
+    print(f"{'representation':>22} {'MB':>8} {'bytes/lineup':>13} {'build s':>8}")
+    print(f"{'dict + id set':>22} {dict_bytes / 1e6:>8.1f} {dict_bytes / args.lineups:>13.0f} {dict_s:>8.2f}")
+    print(f"{'LineupArray':>22} {array_bytes / 1e6:>8.1f} {array_bytes / args.lineups:>13.0f} {array_s:>8.2f}")
+
+    start = time.perf_counter()
+    [sum(p.proj for p in lu.values()) for lu, _ in dicts]
+    dict_proj = time.perf_counter() - start
+    start = time.perf_counter()
+    array.proj()
+    array.overlap(array[0])
+    array_proj = time.perf_counter() - start
+    print(f"projection totals: dicts {dict_proj:.3f}s, LineupArray (plus one overlap pass) {array_proj:.3f}s")
+
+    fields = [dataclasses.astuple(p) for p in slate.players] * max(1, 50000 // len(slate))
+    for cls in (DictPlayer, Player):
+        _, size, _ = _measure(lambda: [cls(*f) for f in fields])
+        print(f"{len(fields)} {cls.__name__} objects: {size / 1e6:.1f} MB ({size / len(fields):.0f} bytes each, shared strings excluded)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Model build time vs slate size (compile + base MILP rows, no solve).
+
+Usage: python -m benchmarks.bench_model_build [--sizes 100,500,2000] [--repeat 5]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import DK_SALARY_CAP, _build_model
+from src.slate import compile_slate
+
+
+def _best_of(repeat, fn):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=str, default='100,500,2000')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'players':>8} {'compile ms':>11} {'build ms':>9} {'us/player':>10} {'rows':>6} {'vars':>6}")
+    for size in [int(s) for s in args.sizes.split(',')]:
+        players = synthetic_players(size)
+        t_compile, slate = _best_of(args.repeat, lambda: compile_slate(players))
+        t_build, (prob, _) = _best_of(args.repeat, lambda: _build_model(slate, DK_SALARY_CAP, 3, 1.0))
+        per_player = 1e6 * (t_compile + t_build) / len(players)
+        print(f"{len(players):>8} {1000 * t_compile:>11.2f} {1000 * t_build:>9.2f} {per_player:>10.1f} {prob.numConstraints():>6} {prob.numVariables():>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Speedup of QB-partitioned parallel generation over the sequential path.
+
+Usage: python -m benchmarks.bench_parallel [--players 400] [--count 20] [--workers 2,4,8]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import generate_n_lineups, lineup_proj
+from src.parallel import generate_n_lineups_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--workers', type=str, default='2,4,8')
+    parser.add_argument('--overlap-max', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, seed=args.seed)
+    start = time.perf_counter()
+    baseline = generate_n_lineups(players, n=args.count, overlap_max=args.overlap_max, incremental=True)
+    t_seq = time.perf_counter() - start
+    base_proj = sum(lineup_proj(lu) for lu in baseline)
+
+    print(f"slate: {len(players)} players, n={args.count}")
+    print(f"{'mode':>12} {'seconds':>8} {'speedup':>8} {'lineups':>8} {'total proj':>11}")
+    print(f"{'sequential':>12} {t_seq:>8.2f} {1.0:>7.2f}x {len(baseline):>8} {base_proj:>11.2f}")
+    for workers in [int(w) for w in args.workers.split(',')]:
+        start = time.perf_counter()
+        lineups = generate_n_lineups_parallel(players, n=args.count, workers=workers, seed=args.seed, overlap_max=args.overlap_max)
+        elapsed = time.perf_counter() - start
+        total = sum(lineup_proj(lu) for lu in lineups)
+        print(f"{f'{workers} workers':>12} {elapsed:>8.2f} {t_seq / elapsed:>7.2f}x {len(lineups):>8} {total:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
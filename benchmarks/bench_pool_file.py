@@ -0,0 +1,62 @@
+"""Saving and reloading large lineup pools: binary pool file, DK upload CSV and text export.
+
+Usage: python -m benchmarks.bench_pool_file [--lineups 1000000] [--players 400] [--text-lineups 20000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import synthetic_players
+from src.export import write_lineups
+from src.lineups import LineupArray
+from src.pool_file import open_pool, write_dk_csv, write_pool
+from src.slate import compile_slate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lineups', type=int, default=1_000_000)
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--text-lineups', type=int, default=20000, help='Lineups for the (slow) text export comparison')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    slate = compile_slate(synthetic_players(args.players, seed=args.seed))
+    rng = np.random.default_rng(args.seed)
+    # Random rows (drawn from 10k distinct ones) are enough for I/O timing; they need not be valid lineups
+    distinct = np.stack([rng.choice(len(slate), 9, replace=False) for _ in range(10_000)])
+    rows = distinct[rng.integers(0, len(distinct), args.lineups)]
+    lineups = LineupArray(slate, rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pool_path = os.path.join(tmp, 'pool.dkpool')
+        start = time.perf_counter()
+        write_pool(pool_path, slate, lineups)
+        print(f"write pool    {args.lineups:>9} lineups {time.perf_counter() - start:>7.2f}s  {os.path.getsize(pool_path) / 1e6:>7.1f} MB")
+
+        start = time.perf_counter()
+        pool = open_pool(pool_path)
+        opened = time.perf_counter() - start
+        best = int(np.argmax(pool.proj))
+        print(f"open pool     {len(pool):>9} lineups {opened:>7.4f}s  (best proj {pool.proj[best]:.2f} found in {time.perf_counter() - start:.3f}s)")
+
+        csv_path = os.path.join(tmp, 'upload.csv')
+        start = time.perf_counter()
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            write_dk_csv(f, pool.chunks())
+        print(f"DK upload CSV {len(pool):>9} lineups {time.perf_counter() - start:>7.2f}s  {os.path.getsize(csv_path) / 1e6:>7.1f} MB")
+
+        text_path = os.path.join(tmp, 'lineups.txt')
+        dicts = pool.lineups(0, args.text_lineups).to_dicts()
+        start = time.perf_counter()
+        with open(text_path, 'w', encoding='utf-8') as f:
+            write_lineups(dicts, f)
+        elapsed = time.perf_counter() - start
+        print(f"text export   {len(dicts):>9} lineups {elapsed:>7.2f}s  ({elapsed / len(dicts) * args.lineups:.1f}s projected for {args.lineups})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Pool-then-select portfolio mode vs the sequential cut chain.
+
+Usage: python -m benchmarks.bench_portfolio [--players 400] [--counts 20,150] [--overlap-max 5]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import generate_n_lineups, lineup_proj
+from src.portfolio import generate_portfolio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--counts', type=str, default='20,150')
+    parser.add_argument('--overlap-max', type=int, default=5)
+    parser.add_argument('--pool-size', type=int, default=2000)
+    parser.add_argument('--skip-sequential', action='store_true', help='Only time the pool mode')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, seed=args.seed)
+    print(f"{'n':>5} {'mode':>11} {'seconds':>8} {'lineups':>8} {'avg proj':>9}")
+    for n in [int(c) for c in args.counts.split(',')]:
+        modes = [('pool', lambda: generate_portfolio(players, n=n, pool_size=args.pool_size, seed=args.seed, overlap_max=args.overlap_max))]
+        if not args.skip_sequential:
+            modes.insert(0, ('sequential', lambda: generate_n_lineups(players, n=n, overlap_max=args.overlap_max, incremental=True)))
+        for name, run in modes:
+            start = time.perf_counter()
+            lineups = run()
+            elapsed = time.perf_counter() - start
+            avg = sum(lineup_proj(lu) for lu in lineups) / max(len(lineups), 1)
+            print(f"{n:>5} {name:>11} {elapsed:>8.2f} {len(lineups):>8} {avg:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
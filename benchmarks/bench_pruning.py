@@ -0,0 +1,38 @@
+"""Effect of dominance pruning on model size and solve time.
+
+Usage: python -m benchmarks.bench_pruning [--players 400] [--counts 1,5,20]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import generate_n_lineups
+from src.pruning import prune_players
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--counts', type=str, default='1,5,20')
+    parser.add_argument('--team-max', type=int, default=3)
+    parser.add_argument('--stack-penalty', type=float, default=0.0)
+    parser.add_argument('--overlap-max', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, seed=args.seed)
+    opts = dict(team_max=args.team_max, stack_penalty=args.stack_penalty, overlap_max=args.overlap_max)
+    print(f"{'n':>4} {'players':>8} {'kept':>6} {'reduction':>10} {'unpruned s':>11} {'pruned s':>9}")
+    for n in [int(c) for c in args.counts.split(',')]:
+        kept = prune_players(players, n=n, **opts)
+        timings = []
+        for prune in (False, True):
+            start = time.perf_counter()
+            generate_n_lineups(players, n=n, prune=prune, incremental=True, **opts)
+            timings.append(time.perf_counter() - start)
+        reduction = 1 - len(kept) / len(players)
+        print(f"{n:>4} {len(players):>8} {len(kept):>6} {reduction:>9.0%} {timings[0]:>11.2f} {timings[1]:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Request latency of the optimizer service on a warm slate vs a cold CLI run.
+
+The cold run is ``python -m src.cli`` in a fresh interpreter: startup,
+imports, CSV parsing and the solves. The service is started in-process,
+the same CSV is loaded once, and then each request is timed end to end over
+HTTP:
+- warm: a new set of options on the loaded slate (parsing and pruning reused);
+- repeat: an exact repeat, answered from memory.
+
+Usage: python -m benchmarks.bench_server [--players 300] [--count 5] [--engine milp] [--repeats 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+from benchmarks.common import fftoolbox_csv, synthetic_players
+from src import server
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def post(url: str, body: dict) -> list:
+    req = urllib.request.Request(url, data=json.dumps(body).encode('utf-8'), method='POST', headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req) as resp:
+        return [json.loads(line) for line in resp.read().decode('utf-8').splitlines()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--count', type=int, default=5)
+    parser.add_argument('--engine', choices=['milp', 'native'], default='milp')
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'slate.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(fftoolbox_csv(synthetic_players(args.players)))
+
+        cold = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-m', 'src.cli', '--source', 'fftoolbox', '--salary-url', path, '--count', str(args.count),
+                            '--engine', args.engine, '--output', os.path.join(tmp, 'out.txt')],
+                           cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            cold.append(time.perf_counter() - start)
+
+        httpd = server.make_server(port=0)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{httpd.server_address[1]}"
+        try:
+            start = time.perf_counter()
+            slate = post(base + '/slates', {'source': 'fftoolbox', 'path': path})[0]['slate']
+            load = time.perf_counter() - start
+            url = f"{base}/slates/{slate}/lineups"
+            warm, repeat = [], []
+            for i in range(args.repeats):
+                # A different stack penalty each time so every warm request really solves
+                body = {'count': args.count, 'options': {'engine': args.engine, 'stack_penalty': 0.1 * i}}
+                start = time.perf_counter()
+                post(url, body)
+                warm.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                post(url, body)
+                repeat.append(time.perf_counter() - start)
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+            httpd.service.close()
+
+    print(f"{args.players} players, {args.count} lineups, {args.engine}, median of {args.repeats}")
+    print(f"  cold CLI run      {1000 * statistics.median(cold):>9.1f} ms")
+    print(f"  service load      {1000 * load:>9.1f} ms (once per slate)")
+    print(f"  warm request      {1000 * statistics.median(warm):>9.1f} ms")
+    print(f"  repeated request  {1000 * statistics.median(repeat):>9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
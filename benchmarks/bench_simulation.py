@@ -0,0 +1,34 @@
+"""Throughput of the Monte Carlo lineup simulator.
+
+Usage: python -m benchmarks.bench_simulation [--lineups 150] [--sims 50000] [--chunk 5000]
+"""
+import argparse
+import time
+
+from benchmarks.common import synthetic_players
+from src.optimizer import generate_n_lineups
+from src.simulation import simulate_lineups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=400)
+    parser.add_argument('--lineups', type=int, default=150)
+    parser.add_argument('--sims', type=int, default=50000)
+    parser.add_argument('--chunk', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, seed=args.seed)
+    lineups = generate_n_lineups(players, n=args.lineups, engine='native')
+    start = time.perf_counter()
+    result = simulate_lineups(lineups, n_sims=args.sims, chunk_size=args.chunk, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{len(lineups)} lineups x {args.sims} sims in {elapsed:.2f}s ({len(lineups) * args.sims / elapsed / 1e6:.1f}M lineup-sims/s)")
+    print(f"{'lineup':>6} {'mean':>8} {'p10':>8} {'p50':>8} {'p90':>8} {'top1%':>7}")
+    for j in result.top_frequency.argsort()[::-1][:5]:
+        print(f"{j + 1:>6} {result.mean[j]:>8.2f} {result.percentiles[10][j]:>8.2f} {result.percentiles[50][j]:>8.2f} {result.percentiles[90][j]:>8.2f} {result.top_frequency[j]:>7.2%}")
+
+
+if __name__ == '__main__':
+    main()
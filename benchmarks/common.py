@@ -0,0 +1,51 @@
+"""Shared helpers for the benchmark scripts."""
+import csv
+import io
+import os
+import sys
+from typing import List
+
+# Ensure repo root is on sys.path so `src` package can be imported when run as a script
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources.mock import DEFAULT_PLAYERS_PER_POSITION, generate_slate
+from src.models import Player
+
+
+def synthetic_players(n_players: int = 400, seed: int = 0) -> List[Player]:
+    """A generate_slate slate sized to roughly ``n_players`` players."""
+    per_team = sum(DEFAULT_PLAYERS_PER_POSITION.values())
+    n_teams = 32 if n_players >= 32 * per_team else max(4, (n_players // per_team) & ~1)
+    scale = n_players / (n_teams * per_team)
+    counts = {pos: max(1, round(c * scale)) for pos, c in DEFAULT_PLAYERS_PER_POSITION.items() if pos != 'DST'}
+    counts['DST'] = 1
+    return generate_slate(n_teams=n_teams, players_per_position=counts, seed=seed)
+
+
+def slate_with_rows(n_rows: int, seed: int = 0) -> List[Player]:
+    """A full 32-team generate_slate slate with roughly ``n_rows`` players, for parser benchmarks."""
+    per_team = max(1, n_rows // (32 * sum(DEFAULT_PLAYERS_PER_POSITION.values())))
+    counts = {pos: c * per_team for pos, c in DEFAULT_PLAYERS_PER_POSITION.items()}
+    return generate_slate(players_per_position=counts, seed=seed)
+
+
+def fftoolbox_csv(players: List[Player]) -> str:
+    """FFToolbox-style export (formatted salaries, DEF for defenses)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(['Name', 'Pos', 'Team', 'Salary', 'Proj'])
+    for p in players:
+        writer.writerow([p.name, 'DEF' if p.is_dst else p.position, p.team, f"${p.salary:,}", p.proj])
+    return buf.getvalue()
+
+
+def salary_csv(players: List[Player]) -> str:
+    """Plain Name,Salary,Position,Team salary file as read by the web source."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(['Name', 'Salary', 'Position', 'Team'])
+    for p in players:
+        writer.writerow([p.name, p.salary, p.position, p.team])
+    return buf.getvalue()
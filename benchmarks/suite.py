@@ -0,0 +1,113 @@
+"""Benchmark suite with machine-readable results and a regression gate.
+
+Times generate_n_lineups (n = 1, 20, 150), the FFToolbox and salary CSV
+parsers and the text lineup export on generate_slate slates, and writes the
+results as JSON so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --baseline bench.json --threshold 0.25
+
+With --baseline the run exits non-zero when any benchmark is more than
+``threshold`` (a fraction) slower than the baseline value.
+"""
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.common import ROOT, fftoolbox_csv, salary_csv, slate_with_rows
+from src.data_sources import fftoolbox, web
+from src.data_sources.mock import generate_slate
+from src.export import write_lineups
+from src.optimizer import generate_n_lineups
+
+
+def _time(fn: Callable, repeat: int) -> float:
+    """Best wall time over ``repeat`` runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(counts: List[int], n_teams: int, csv_rows: int, repeat: int, seed: int) -> Dict[str, float]:
+    players = generate_slate(n_teams=n_teams, seed=seed)
+    results: Dict[str, float] = {}
+    for n in counts:
+        # Long chains are only timed once
+        results[f"generate_n_lineups.n{n}"] = _time(lambda: generate_n_lineups(players, n=n), repeat if n <= 20 else 1)
+
+    big = slate_with_rows(csv_rows, seed=seed)
+    fft_text = fftoolbox_csv(big)
+    salary_text = salary_csv(big)
+    results['fftoolbox._parse_csv_text'] = _time(lambda: fftoolbox._parse_csv_text(fft_text), repeat)
+    results['web._parse_salary_csv'] = _time(lambda: web._parse_salary_csv(salary_text), repeat)
+
+    lineups = generate_n_lineups(players, n=20, engine='native')
+    results['export.write_lineups'] = _time(lambda: write_lineups(lineups * 50, io.StringIO()), repeat)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Names of benchmarks more than ``threshold`` slower than the baseline."""
+    regressions = []
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before and seconds > before * (1 + threshold):
+            regressions.append(f"{name}: {before:.4f}s -> {seconds:.4f}s (+{seconds / before - 1:.0%})")
+    return regressions
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Optimizer and parser benchmark suite')
+    parser.add_argument('--counts', type=str, default='1,20,150', help='Lineup counts to time')
+    parser.add_argument('--teams', type=int, default=16, help='Teams in the optimizer slate')
+    parser.add_argument('--csv-rows', type=int, default=50000, help='Approximate rows in the parser benchmarks')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=str, default=None, help='Write results JSON here')
+    parser.add_argument('--baseline', type=str, default=None, help='Results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown vs baseline (fraction)')
+    args = parser.parse_args(argv)
+
+    results = run_suite([int(c) for c in args.counts.split(',')], args.teams, args.csv_rows, args.repeat, args.seed)
+    report = {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    print(text)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline.get('results', baseline), args.threshold)
+        if regressions:
+            print('Regressions over threshold:', file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""Replay archived weeks to see whether presets pay off.
+
+An archive is a directory of weekly FFToolbox CSVs, each next to a file of
+actual points with the same stem plus ``_actuals``::
+
+    archive/2024-w01.csv            Name,Pos,Team,Salary,Proj (FFToolbox export)
+    archive/2024-w01_actuals.csv    Name,Pos,Team,Points
+
+Actual points are joined onto the slate through ``identity.IdentityIndex``;
+slate players missing from the actuals file scored 0.
+
+Each week is parsed once in the parent process. Three kinds of job are then
+spread over a process pool, all as ``generate_n_lineups`` calls:
+- every preset's lineups;
+- a reference field: the ``field_size`` best lineups by projection, from
+  the native enumerator;
+- the hindsight optimum on actual points.
+Solves go through ``ResultCache``, keyed by slate content and options, so
+a rerun only solves what changed.
+
+Lineups are scored with one NumPy gather per week. The ROI proxies measure
+lineups against the field's actual scores:
+- ``cash_rate``: share above the field median.
+- ``cash_roi``: ``cash_rate * DOUBLE_UP_PAYOUT - 1``, the return of a
+  double-up entry.
+- ``top_rate``: share at or above the field's ``top_quantile``.
+- ``efficiency``: mean actual points over the hindsight optimum.
+
+Usage: python -m src.backtest ARCHIVE [--presets cash,contrarian] [--count 20] [--workers N] [--json report.json]
+"""
+import argparse
+import dataclasses
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .data_sources import fftoolbox
+from .data_sources.identity import IdentityIndex
+from .data_sources.ingest import CsvSchema, parse_proj, read_csv_file
+from .lineups import LineupArray
+from .models import Player
+from .optimizer import generate_n_lineups
+from .presets import PRESET_CONFIGS
+from .result_cache import DEFAULT_MAX_ENTRIES, DEFAULT_RESULT_CACHE_DIR, ResultCache, run_finished
+from .slate import CompiledSlate, compile_slate
+
+ACTUALS_SUFFIX = '_actuals'
+DOUBLE_UP_PAYOUT = 1.8
+DEFAULT_FIELD_SIZE = 200
+
+
+def parse_points(text: str) -> float:
+    """'-2' -> -2.0, '1,024.5' -> 1024.5; unlike ``parse_proj`` the sign is kept (DSTs and QBs can score below 0)."""
+    try:
+        return float(text.replace(',', ''))
+    except ValueError:
+        return -parse_proj(text) if text.strip().startswith('-') else parse_proj(text)
+
+
+ACTUALS_SCHEMA = CsvSchema('ACT', {
+    'name': ('Name', 'Player', 'name', 'player'),
+    'salary': (),
+    'position': ('Pos', 'Position', 'pos'),
+    'team': ('Team', 'Tm', 'team'),
+    'proj': ('Points', 'Actual', 'FPTS', 'points', 'actual', 'fpts'),
+}, parse_proj=parse_points)
+
+# Reserved job names next to the presets
+FIELD = '_field'
+OPTIMAL = '_optimal'
+
+
+@dataclasses.dataclass
+class Week:
+    name: str
+    slate: CompiledSlate
+    actual: np.ndarray  # actual points per player, indexed like the slate
+    actual_players: List[Player]  # the slate with actual points as projections, for the hindsight optimum
+    unmatched: int  # actuals rows without a slate player
+
+    @property
+    def players(self) -> List[Player]:
+        return self.slate.players
+
+
+def load_week(slate_path: str, actuals_path: str) -> Week:
+    players = fftoolbox.parse_csv_file(slate_path)
+    if not players:
+        raise ValueError(f"No players parsed from {slate_path}")
+    actuals = read_csv_file(actuals_path, ACTUALS_SCHEMA)
+    result = IdentityIndex(players).resolve(actuals)
+    actual = np.zeros(len(players))
+    for j, i in result.matches.items():
+        actual[i] = actuals[j].proj
+    name = os.path.splitext(os.path.basename(slate_path))[0]
+    actual_players = [dataclasses.replace(p, proj=float(a)) for p, a in zip(players, actual)]
+    return Week(name=name, slate=compile_slate(players), actual=actual, actual_players=actual_players, unmatched=len(result.unmatched))
+
+
+def find_weeks(archive: str) -> List[Tuple[str, str]]:
+    """(slate, actuals) path pairs in name order; slates without actuals are skipped."""
+    pairs = []
+    for path in sorted(glob.glob(os.path.join(archive, '*.csv'))):
+        stem = os.path.splitext(path)[0]
+        if stem.endswith(ACTUALS_SUFFIX):
+            continue
+        actuals = stem + ACTUALS_SUFFIX + '.csv'
+        if os.path.exists(actuals):
+            pairs.append((path, actuals))
+    return pairs
+
+
+# Players per week of the current worker process, set once by _init_worker
+_weeks: Dict[str, Tuple[List[Player], List[Player]]] = {}
+
+
+def _init_worker(weeks: Dict[str, Tuple[List[Player], List[Player]]]):
+    global _weeks
+    _weeks = weeks
+
+
+def _solve(job: Tuple[str, str, dict]) -> Tuple[List[List[str]], bool]:
+    """Process-pool entry point: lineups of one (week, name) job as id lists, and whether they may be cached."""
+    week, name, options = job
+    players, actual_players = _weeks[week]
+    events: List[dict] = []
+    lineups = generate_n_lineups(actual_players if name == OPTIMAL else players, on_iteration=events.append, **options)
+    return [list(lu) for lu in lineups], run_finished(events, len(lineups), options['n'])
+
+
+def _job_options(name: str, count: int, field_size: int, overrides: dict) -> dict:
+    if name == FIELD:
+        return {'n': field_size, 'engine': 'native'}
+    if name == OPTIMAL:
+        return {'n': 1, 'engine': 'native'}
+    options = dict(PRESET_CONFIGS[name])
+    options.update(overrides)
+    options['n'] = count
+    return options
+
+
+def _scores(week: Week, ids: Sequence[Sequence[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Projected and actual points of each lineup."""
+    if not ids:
+        return np.zeros(0), np.zeros(0)
+    slate = week.slate
+    rows = LineupArray.from_indices(slate, ([slate.index[pid] for pid in lineup] for lineup in ids)).rows
+    return slate.proj[rows].sum(axis=1), week.actual[rows].sum(axis=1)
+
+
+def _week_report(week: Week, results: Dict[str, List[List[str]]], presets: Sequence[str], top_quantile: float) -> Dict[str, dict]:
+    _, field = _scores(week, results[FIELD])
+    _, optimal = _scores(week, results[OPTIMAL])
+    cash_line = float(np.median(field)) if len(field) else 0.0
+    top_line = float(np.quantile(field, top_quantile)) if len(field) else 0.0
+    best = float(optimal[0]) if len(optimal) else 0.0
+    report = {}
+    for preset in presets:
+        proj, actual = _scores(week, results[preset])
+        if not len(actual):
+            report[preset] = {'lineups': 0}
+            continue
+        cash_rate = float((actual > cash_line).mean())
+        report[preset] = {
+            'lineups': len(actual),
+            'mean_proj': float(proj.mean()),
+            'mean_actual': float(actual.mean()),
+            'best_actual': float(actual.max()),
+            'cash_line': cash_line,
+            'top_line': top_line,
+            'optimal': best,
+            'cash_rate': cash_rate,
+            'cash_roi': cash_rate * DOUBLE_UP_PAYOUT - 1,
+            'top_rate': float((actual >= top_line).mean()),
+            'efficiency': float(actual.mean() / best) if best > 0 else 0.0,
+        }
+    return report
+
+
+def _aggregate(weeks: Dict[str, Dict[str, dict]], presets: Sequence[str]) -> Dict[str, dict]:
+    keys = ('mean_actual', 'cash_rate', 'cash_roi', 'top_rate', 'efficiency')
+    summary = {}
+    for preset in presets:
+        rows = [w[preset] for w in weeks.values() if w[preset]['lineups']]
+        summary[preset] = {'weeks': len(rows), **{k: float(np.mean([r[k] for r in rows])) if rows else 0.0 for k in keys}}
+    return summary
+
+
+def run_backtest(
+    archive: str,
+    presets: Optional[Sequence[str]] = None,
+    count: int = 20,
+    workers: int = 1,
+    cache: Optional[ResultCache] = None,
+    field_size: int = DEFAULT_FIELD_SIZE,
+    top_quantile: float = 0.99,
+    overrides: Optional[dict] = None,
+) -> dict:
+    """Backtest ``presets`` (default: all) over every week of ``archive``.
+
+    ``overrides`` are optimizer options applied on top of every preset.
+    Returns ``{'weeks': {week: {preset: metrics}}, 'summary': {preset:
+    means over weeks}, 'errors': {week: message}, 'jobs': solved,
+    'cached': answered from the cache, 'seconds': wall time}``.
+    """
+    start = time.perf_counter()
+    presets = list(presets or PRESET_CONFIGS)
+    unknown = [p for p in presets if p not in PRESET_CONFIGS]
+    if unknown:
+        raise ValueError(f"Unknown presets {unknown}; expected some of {sorted(PRESET_CONFIGS)}")
+    overrides = overrides or {}
+
+    weeks: Dict[str, Week] = {}
+    errors: Dict[str, str] = {}
+    for slate_path, actuals_path in find_weeks(archive):
+        name = os.path.splitext(os.path.basename(slate_path))[0]
+        try:
+            weeks[name] = load_week(slate_path, actuals_path)
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+
+    # Answer what we can from the cache; everything else becomes a pool job
+    results: Dict[str, Dict[str, List[List[str]]]] = {name: {} for name in weeks}
+    jobs = []
+    cached = 0
+    for name, week in weeks.items():
+        for job_name in [FIELD, OPTIMAL] + presets:
+            options = _job_options(job_name, count, field_size, overrides)
+            players = week.actual_players if job_name == OPTIMAL else week.players
+            hit = cache.get(players, dict(options, preset=job_name)) if cache is not None else None
+            if hit is not None:
+                results[name][job_name] = [list(lu) for lu in hit]
+                cached += 1
+            else:
+                jobs.append((name, job_name, options))
+
+    if jobs:
+        state = {name: (week.players, week.actual_players) for name, week in weeks.items()}
+        if workers <= 1:
+            _init_worker(state)
+            solved = list(map(_solve, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+                solved = list(pool.map(_solve, jobs))
+        for (name, job_name, options), (ids, finished) in zip(jobs, solved):
+            results[name][job_name] = ids
+            if cache is not None and finished:
+                week = weeks[name]
+                players = week.actual_players if job_name == OPTIMAL else week.players
+                by_id = {p.id: p for p in players}
+                cache.put(players, dict(options, preset=job_name), [{pid: by_id[pid] for pid in lineup} for lineup in ids])
+
+    reports = {name: _week_report(week, results[name], presets, top_quantile) for name, week in weeks.items()}
+    return {
+        'weeks': reports,
+        'summary': _aggregate(reports, presets),
+        'errors': errors,
+        'jobs': len(jobs),
+        'cached': cached,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"{'week':<16} {'preset':<16} {'lineups':>7} {'mean act':>9} {'best':>7} {'cash %':>7} {'cash ROI':>9} {'top %':>6} {'eff':>6}"]
+    for week, presets in report['weeks'].items():
+        for preset, m in presets.items():
+            if not m['lineups']:
+                lines.append(f"{week:<16} {preset:<16} {0:>7}")
+                continue
+            lines.append(f"{week:<16} {preset:<16} {m['lineups']:>7} {m['mean_actual']:>9.2f} {m['best_actual']:>7.2f} "
+                         f"{100 * m['cash_rate']:>6.1f}% {m['cash_roi']:>+9.3f} {100 * m['top_rate']:>5.1f}% {m['efficiency']:>6.3f}")
+    lines.append('')
+    lines.append(f"{'all weeks':<16} {'preset':<16} {'weeks':>7} {'mean act':>9} {'':>7} {'cash %':>7} {'cash ROI':>9} {'top %':>6} {'eff':>6}")
+    for preset, m in report['summary'].items():
+        lines.append(f"{'':<16} {preset:<16} {m['weeks']:>7} {m['mean_actual']:>9.2f} {'':>7} "
+                     f"{100 * m['cash_rate']:>6.1f}% {m['cash_roi']:>+9.3f} {100 * m['top_rate']:>5.1f}% {m['efficiency']:>6.3f}")
+    for week, error in report['errors'].items():
+        lines.append(f"{week}: {error}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Backtest presets over archived weekly slates')
+    parser.add_argument('archive', help='Directory of weekly FFToolbox CSVs and <week>_actuals.csv files')
+    parser.add_argument('--presets', type=str, default=None, help=f"Comma-separated presets (default: all of {', '.join(sorted(PRESET_CONFIGS))})")
+    parser.add_argument('--count', type=int, default=20, help='Lineups per preset and week')
+    parser.add_argument('--engine', choices=['milp', 'native'], default=None, help='Lineup engine for the presets (default: the optimizer default)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Processes for the solves')
+    parser.add_argument('--field-size', type=int, default=DEFAULT_FIELD_SIZE, help='Reference field: best lineups by projection each week')
+    parser.add_argument('--top-quantile', type=float, default=0.99, help='Field quantile a lineup must reach to count as a top finish')
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_RESULT_CACHE_DIR, help='Result cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='Solve everything and store nothing')
+    parser.add_argument('--json', type=str, default=None, help='Also write the full report as JSON')
+    args = parser.parse_args(argv)
+
+    presets = [p.strip() for p in args.presets.split(',')] if args.presets else None
+    # Large enough that a full season of slates x presets stays cached between runs
+    cache = None if args.no_cache else ResultCache(args.cache_dir, max_entries=max(DEFAULT_MAX_ENTRIES, 2000))
+    report = run_backtest(
+        args.archive,
+        presets=presets,
+        count=args.count,
+        workers=args.workers,
+        cache=cache,
+        field_size=args.field_size,
+        top_quantile=args.top_quantile,
+        overrides={'engine': args.engine} if args.engine else None,
+    )
+    print(format_report(report))
+    print(f"{len(report['weeks'])} weeks, {report['jobs']} solves, {report['cached']} from cache, {report['seconds']:.1f}s")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Batch mode: many (slate, preset) runs from one config file.
+
+The config is JSON::
+
+    {
+      "defaults": {"count": 20, "source": "fftoolbox"},
+      "runs": [
+        {"name": "cash", "slate": "week5.csv", "preset": "cash", "output": "out/cash.txt"},
+        {"name": "gpp", "slate": "week5.csv", "preset": "contrarian", "count": 150,
+         "overrides": {"team_max": 2}, "output": "out/gpp.txt"}
+      ]
+    }
+
+Each run takes ``slate`` (a CSV path, read with ``source``: fftoolbox,
+merge or mock), ``preset``, ``overrides`` (any ``generate_n_lineups``
+option, applied over the preset), ``count`` and ``output``; keys missing
+from a run come from ``defaults``. With ``merge`` the slate is a salary CSV
+and ``projections`` lists FFToolbox CSVs whose projections are merged onto
+it (see ``data_sources.pipeline``); salary files carry no projections of
+their own. Relative paths are resolved against the config file's directory.
+
+Every distinct slate is parsed once in the parent and handed to each
+worker process once, through the pool initializer. A job that fails is
+reported in the summary and does not stop the others.
+
+Usage: python -m src.batch runs.json [--workers N] [--summary summary.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .data_sources import fftoolbox, mock, pipeline
+from .export import write_lineups
+from .models import Player
+from .optimizer import generate_n_lineups
+from .presets import PRESET_CONFIGS
+
+SlateKey = Tuple[str, str, Tuple[str, ...]]  # (source, path, projection paths)
+
+_LOADERS = {
+    'fftoolbox': lambda path, _projections: fftoolbox.parse_csv_file(path),
+    'merge': lambda path, projections: pipeline.load_players(path or None, list(projections), strict=True).players,
+    'mock': lambda _path, _projections: mock.fetch_players_for_week(),
+}
+
+# Slates of the current worker process, set once by _init_worker
+_slates: Dict[SlateKey, List[Player]] = {}
+
+
+def load_config(path: str) -> List[dict]:
+    """Runs of a batch config with defaults applied and paths made absolute."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    defaults = config.get('defaults', {})
+    runs = []
+    for i, entry in enumerate(config.get('runs', [])):
+        run = {'name': f"run{i + 1}", 'source': 'fftoolbox', 'preset': 'default', 'count': 5, 'overrides': {}, 'output': None, 'projections': []}
+        run.update(defaults)
+        run.update(entry)
+        for key in ('slate', 'output'):
+            if run.get(key):
+                run[key] = os.path.join(base, run[key])
+        run['projections'] = [os.path.join(base, path) for path in run['projections']]
+        runs.append(run)
+    return runs
+
+
+def _slate_key(run: dict) -> SlateKey:
+    return (run['source'], run.get('slate') or '', tuple(run.get('projections') or ()))
+
+
+def load_slates(runs: List[dict]) -> Tuple[Dict[SlateKey, List[Player]], Dict[SlateKey, str]]:
+    """Parse every distinct slate once; returns the slates and the load errors."""
+    slates: Dict[SlateKey, List[Player]] = {}
+    errors: Dict[SlateKey, str] = {}
+    for run in runs:
+        key = _slate_key(run)
+        if key in slates or key in errors:
+            continue
+        source, path, projections = key
+        try:
+            loader = _LOADERS.get(source)
+            if loader is None:
+                raise ValueError(f"Unknown source {source!r}; expected one of {sorted(_LOADERS)}")
+            players = loader(path, projections)
+            if not players:
+                raise ValueError(f"No players parsed from {path}")
+            slates[key] = players
+        except Exception as e:
+            errors[key] = f"{type(e).__name__}: {e}"
+    return slates, errors
+
+
+def _init_worker(slates: Dict[SlateKey, List[Player]]):
+    global _slates
+    _slates = slates
+
+
+def _options(run: dict) -> dict:
+    preset = run.get('preset') or 'default'
+    if preset not in PRESET_CONFIGS:
+        raise ValueError(f"Unknown preset {preset!r}; expected one of {sorted(PRESET_CONFIGS)}")
+    options = dict(PRESET_CONFIGS[preset])
+    options.update(run.get('overrides') or {})
+    options['n'] = run['count']
+    return options
+
+
+def run_job(run: dict) -> dict:
+    """Solve one run against the worker's slates and write its output; never raises."""
+    start = time.perf_counter()
+    summary = {'name': run['name'], 'slate': run.get('slate'), 'preset': run.get('preset'), 'output': run.get('output')}
+    try:
+        lineups = generate_n_lineups(_slates[_slate_key(run)], **_options(run))
+        if run.get('output'):
+            os.makedirs(os.path.dirname(run['output']) or '.', exist_ok=True)
+            with open(run['output'], 'w', encoding='utf-8') as f:
+                write_lineups(lineups, f)
+        summary.update(status='ok', lineups=len(lineups))
+    except Exception as e:
+        summary.update(status='error', lineups=0, error=f"{type(e).__name__}: {e}")
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def run_batch(runs: List[dict], workers: int = 1) -> List[dict]:
+    """Run every job and return one summary dict per run, in config order."""
+    start = time.perf_counter()
+    slates, load_errors = load_slates(runs)
+    parse_s = time.perf_counter() - start
+
+    results: List[Optional[dict]] = [None] * len(runs)
+    pending = []
+    for i, run in enumerate(runs):
+        error = load_errors.get(_slate_key(run))
+        if error:
+            results[i] = {'name': run['name'], 'slate': run.get('slate'), 'preset': run.get('preset'), 'output': run.get('output'),
+                          'status': 'error', 'lineups': 0, 'error': error, 'seconds': 0.0}
+        else:
+            pending.append(i)
+
+    jobs = [runs[i] for i in pending]
+    if workers <= 1:
+        _init_worker(slates)
+        done = [run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(slates,)) as pool:
+            done = list(pool.map(run_job, jobs))
+    for i, summary in zip(pending, done):
+        results[i] = summary
+    for summary in results:
+        summary['parse_s'] = round(parse_s, 3)
+    return results
+
+
+def format_summary(results: List[dict]) -> str:
+    lines = [f"{'name':<20} {'status':<6} {'lineups':>7} {'seconds':>8}  output / error"]
+    for r in results:
+        detail = r.get('error') or r.get('output') or ''
+        lines.append(f"{r['name']:<20} {r['status']:<6} {r['lineups']:>7} {r['seconds']:>8.2f}  {detail}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Run many presets and slates from one config file')
+    parser.add_argument('config', help='Batch config (JSON)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Processes for the optimization jobs')
+    parser.add_argument('--summary', type=str, default=None, help='Also write the per-job summary as JSON')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_batch(load_config(args.config), workers=args.workers)
+    print(format_summary(results))
+    failed = sum(1 for r in results if r['status'] != 'ok')
+    print(f"{len(results) - failed}/{len(results)} runs ok in {time.perf_counter() - start:.2f}s")
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,17 @@
 import argparse
+import json
 import sys
+import time
 from pathlib import Path
-from .data_sources import mock
-from .data_sources import web as web_source
-from .data_sources import fftoolbox
-from .optimizer import generate_n_lineups, lineup_salary, lineup_proj
+from .data_sources import SOURCES, load_source
+from .export import format_lineup, read_lineup_ids, write_lineup_ids, write_lineups
+from .optimizer import DIVERSITY_MODES, iter_lineups
+from .presets import PRESET_CONFIGS
+from .result_cache import DEFAULT_MAX_ENTRIES, DEFAULT_RESULT_CACHE_DIR, ResultCache, iter_lineups_cached
+from .solvers import SOLVER_BACKENDS
+
+# Modules used by a single mode (late swap, pool mode, parallel runs, pool
+# files) are imported inside that mode so the others start faster
 
 
 def _ask_user_for_csv_via_dialog(prompt: str) -> str:
@@ -26,11 +33,112 @@ def _ask_user_for_csv_via_dialog(prompt: str) -> str:
         return input('Path to CSV: ').strip()
 
 
+def _convert_pool(args):
+    """--from-pool: print the head of a pool file and stream all of it to the requested exports."""
+    from .pool_file import open_pool, write_dk_csv
+
+    pool = open_pool(args.from_pool)
+    print(f"{args.from_pool}: {len(pool)} lineups over {len(pool.slate)} players", file=sys.stderr)
+    for i, lineup in enumerate(pool.lineups(0, args.count).to_dicts(), start=1):
+        print('\n' + format_lineup(i, lineup), end='')
+    if args.dk_csv:
+        with open(args.dk_csv, 'w', encoding='utf-8', newline='') as f:
+            write_dk_csv(f, pool.chunks())
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            start = 1
+            for chunk in pool.chunks():
+                write_lineups(chunk.to_dicts(), f, start=start)
+                start += len(chunk)
+
+
+def _load_mock(args):
+    return load_source('mock').fetch_players_for_week()
+
+
+def _load_web(args):
+    return load_source('web').fetch_players_for_week(week=args.week, salary_csv_url=args.salary_url)
+
+
+def _load_fftoolbox(args):
+    fftoolbox = load_source('fftoolbox')
+    # Prefer a provided URL (data_url or salary_url). If none provided, instruct the user to download
+    # the CSV from the FFToolbox page and select it via a file picker.
+    fft_url = 'https://fftoolbox.fulltimefantasy.com/football/draftkings-fulltimefantasy-scores.php'
+    if args.data_url or args.salary_url:
+        url = args.data_url or args.salary_url
+        # If URL points to a CSV file, try parsing it directly; otherwise try to fetch/parse the page
+        if str(url).lower().endswith('.csv'):
+            return fftoolbox.parse_csv_file(url) if Path(url).exists() else fftoolbox.fetch_players_from_page(url)
+        return fftoolbox.fetch_players_from_page(url)
+    print('\nPlease download the CSV from FFToolbox using this link:')
+    print(f'{fft_url}\n')
+    print('When the CSV is downloaded, select it in the file picker.')
+    csv_path = _ask_user_for_csv_via_dialog('Select the FFToolbox CSV file you downloaded')
+    if not csv_path:
+        raise SystemExit('No CSV selected; aborting')
+    return fftoolbox.parse_csv_file(csv_path)
+
+
+def _load_merge(args):
+    if not args.salary_url and not args.proj_url:
+        raise SystemExit('--source merge needs --salary-url and/or --proj-url')
+    loaded = load_source('merge').load_players(args.salary_url, args.proj_url, aliases_path=args.aliases)
+    for name, seconds in loaded.timings.items():
+        count = f" {len(loaded.by_source[name])} players" if name in loaded.by_source else ''
+        error = f" ({loaded.errors[name]})" if name in loaded.errors else ''
+        print(f"{name}: {seconds:.2f}s{count}{error}", file=sys.stderr)
+    for name, missing in loaded.unmatched.items():
+        print(f"{name}: {len(missing)} players without a salary match: {', '.join(f'{p.name} ({p.team})' for p in missing)}", file=sys.stderr)
+    if not loaded.players:
+        raise SystemExit('No players loaded')
+    return loaded.players
+
+
+# Options the parallel path (--workers > 1) cannot honour, each with a test
+# for whether it was given
+_PARALLEL_UNSUPPORTED = {
+    '--time-budget': lambda args: args.time_budget is not None,
+    '--diversity': lambda args: args.diversity != 'cuts',
+    '--max-exposure': lambda args: args.max_exposure is not None,
+    '--exposure-penalty': lambda args: args.exposure_penalty != 0.0,
+    '--result-cache': lambda args: args.result_cache,
+}
+
+
+# Options --mode pool cannot honour: candidates come from the native
+# enumerator and only a shortfall is solved with the MILP chain
+_POOL_UNSUPPORTED = {
+    '--engine': lambda args: args.engine != 'milp',
+    '--workers': lambda args: args.workers > 1,
+    '--time-budget': lambda args: args.time_budget is not None,
+    '--diversity': lambda args: args.diversity != 'cuts',
+    '--max-exposure': lambda args: args.max_exposure is not None,
+    '--exposure-penalty': lambda args: args.exposure_penalty != 0.0,
+    '--result-cache': lambda args: args.result_cache,
+}
+
+
+def _given(args, checks) -> list:
+    return [flag for flag, is_set in checks.items() if is_set(args)]
+
+
+# How the CLI's options map onto each data source in data_sources.SOURCES
+_SOURCE_LOADERS = {
+    'mock': _load_mock,
+    'web': _load_web,
+    'fftoolbox': _load_fftoolbox,
+    'merge': _load_merge,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description="DraftKings Classic lineup generator (prototype)")
-    parser.add_argument('--source', choices=['mock','web','fftoolbox'], default='mock', help='Data source to use')
+    parser.add_argument('--source', choices=list(SOURCES), default='mock', help='Data source to use (merge: --salary-url salaries plus --proj-url projections, fetched concurrently)')
     parser.add_argument('--count', type=int, default=5, help='Number of lineups to generate')
     parser.add_argument('--salary-url', type=str, default=None, help='Optional CSV URL with salary data (Name,Salary,Position,Team)')
+    parser.add_argument('--proj-url', action='append', default=[], help='FFToolbox projection page or CSV for --source merge (repeatable)')
+    parser.add_argument('--aliases', type=str, default=None, help='Player alias table (JSON) for --source merge; loaded before matching and updated with new fuzzy matches')
     parser.add_argument('--week', type=int, default=None, help='Week number (optional for some sources)')
     parser.add_argument('--data-url', type=str, default=None, help='Data URL for specific sources (e.g., fftoolbox page)')
     parser.add_argument('--overlap-max', type=int, default=None, help='Maximum allowed overlap (shared players) with previous lineups')
@@ -38,9 +146,48 @@ def main():
     parser.add_argument('--prefer-qb-wr-stack', action='store_true', help='Prefer QB-WR stacking (if QB selected, require at least one WR from same team)')
     parser.add_argument('--stack-penalty', type=float, default=0.0, help='Penalty applied per QB without WR from same team (soft stack)')
     parser.add_argument('--avg-overlap-max', type=float, default=None, help='Maximum average overlap across generated set')
-    parser.add_argument('--preset', type=str, default=None, choices=['default','heavy_stacking','contrarian','cash'], help='Strategy preset')
+    parser.add_argument('--preset', type=str, default=None, choices=sorted(PRESET_CONFIGS), help='Strategy preset')
+    parser.add_argument('--engine', choices=['milp', 'native'], default='milp', help='Lineup engine: CBC integer program or in-process enumerator')
+    parser.add_argument('--solver', choices=sorted(SOLVER_BACKENDS), default='cbc', help='MILP solver backend (highs runs in-process and needs the optional highspy package; warm starts apply to cbc only)')
+    parser.add_argument('--time-limit', type=float, default=None, help='Time limit in seconds for each solve')
+    parser.add_argument('--threads', type=int, default=None, help='Solver threads')
+    parser.add_argument('--mip-gap', type=float, default=None, help='Relative MIP gap at which a solve may stop')
+    parser.add_argument('--diversity', choices=list(DIVERSITY_MODES), default='cuts', help='cuts: rows against every earlier lineup; exposure: fixed-size model with exposure caps (overlap misses are reported)')
+    parser.add_argument('--max-exposure', type=float, default=None, help='Exposure mode: most lineups a player may appear in, as a fraction of --count')
+    parser.add_argument('--exposure-penalty', type=float, default=0.0, help="Exposure mode: points taken off a player's projection per earlier lineup they are in")
+    parser.add_argument('--mode', choices=['sequential', 'pool'], default='sequential', help='sequential: one solve per lineup; pool: select from a large candidate pool')
+    parser.add_argument('--pool-size', type=int, default=2000, help='Candidate pool size for --mode pool')
+    parser.add_argument('--rank-by', choices=['proj', 'sim'], default='proj', help='Pool ranking: projection, or top-1%% frequency from simulation')
+    parser.add_argument('--workers', type=int, default=1, help='Solve QB-partitioned subproblems in this many processes (1 = sequential)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for tie-breaking in parallel mode')
+    parser.add_argument('--time-budget', type=float, default=None, help='Wall-clock budget in seconds for sequential runs; stops cleanly and keeps the lineups found so far')
+    parser.add_argument('--output', type=str, default=None, help='Also write each lineup to this text file as it is found')
+    parser.add_argument('--pool-file', type=str, default=None, help='Also write the lineups to a binary lineup-pool file (memory-mapped on reload)')
+    parser.add_argument('--dk-csv', type=str, default=None, help='Also write the lineups in the DraftKings bulk-upload CSV layout')
+    parser.add_argument('--from-pool', type=str, default=None, help='Read lineups from a pool file instead of generating: prints the first --count and streams all of them to --dk-csv / --output')
+    parser.add_argument('--save-ids', type=str, default=None, help='Also write the lineups as a JSON list of player-id lists (input for --late-swap)')
+    parser.add_argument('--late-swap', type=str, default=None, help='Re-optimize the open slots of the lineups in this JSON file (see --save-ids) instead of generating new ones; uses --workers processes')
+    parser.add_argument('--lock-teams', type=str, default='', help='Late swap: comma-separated teams whose games have started; their players are locked')
+    parser.add_argument('--lock', action='append', default=[], help='Late swap: lock this player id (repeatable)')
+    parser.add_argument('--exclude', action='append', default=[], help='Late swap: player id that can no longer be added, e.g. ruled out (repeatable)')
+    parser.add_argument('--profile', type=str, default=None, help='Write a JSON timing trace (per-iteration build/solve/extract) to this path')
+    parser.add_argument('--cprofile', type=str, default=None, help='Also run the generation under cProfile and dump the stats to this path')
+    parser.add_argument('--result-cache', action='store_true', help='Reuse lineups of identical earlier sequential runs and warm-start from runs on the same slate with other projections')
+    parser.add_argument('--result-cache-dir', type=str, default=DEFAULT_RESULT_CACHE_DIR, help='Directory of the result cache')
+    parser.add_argument('--result-cache-size', type=int, default=DEFAULT_MAX_ENTRIES, help='Most results kept; least recently used are evicted')
+    parser.add_argument('--offline', action='store_true', help='Serve web/fftoolbox data only from the HTTP cache; never touch the network')
+    parser.add_argument('--refresh', action='store_true', help='Revalidate every cached HTTP response regardless of its age')
+    parser.add_argument('--batch', type=str, default=None, help='Run every job of this batch config (JSON) across --workers processes; see src/batch.py')
+    parser.add_argument('--backtest', type=str, default=None, help='Score every preset on an archive of past weeks with actual points across --workers processes; see src/backtest.py')
+    parser.add_argument('--serve', action='store_true', help='Run the local HTTP/JSON optimizer service, solving up to --workers runs at once; see src/server.py')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface for --serve')
+    parser.add_argument('--port', type=int, default=8765, help='Port for --serve')
     parser.add_argument('--gui', action='store_true', help='Launch the GUI')
     args = parser.parse_args()
+    if args.offline or args.refresh:
+        # The HTTP layer (and requests) is only loaded by runs that use it
+        from .data_sources import fetch
+        fetch.configure(offline=args.offline, refresh=args.refresh)
 
     if args.gui:
         # Lazy import to avoid tkinter requirement on CLI-only runs
@@ -48,40 +195,35 @@ def main():
         launch_gui()
         return
 
-    if args.source == 'mock':
-        players = mock.fetch_players_for_week()
-    elif args.source == 'web':
-        players = web_source.fetch_players_for_week(week=args.week, salary_csv_url=args.salary_url)
-    elif args.source == 'fftoolbox':
-        # Prefer a provided URL (data_url or salary_url). If none provided, instruct the user to download
-        # the CSV from the FFToolbox page and select it via a file picker.
-        fft_url = 'https://fftoolbox.fulltimefantasy.com/football/draftkings-fulltimefantasy-scores.php'
-        if args.data_url or args.salary_url:
-            url = args.data_url or args.salary_url
-            # If URL points to a CSV file, try parsing it directly; otherwise try to fetch/parse the page
-            if str(url).lower().endswith('.csv'):
-                players = fftoolbox.parse_csv_file(url) if Path(url).exists() else fftoolbox.fetch_players_from_page(url)
-            else:
-                players = fftoolbox.fetch_players_from_page(url)
-        else:
-            print('\nPlease download the CSV from FFToolbox using this link:')
-            print(f'{fft_url}\n')
-            print('When the CSV is downloaded, select it in the file picker.')
-            csv_path = _ask_user_for_csv_via_dialog('Select the FFToolbox CSV file you downloaded')
-            if not csv_path:
-                raise SystemExit('No CSV selected; aborting')
-            players = fftoolbox.parse_csv_file(csv_path)
-    else:
-        raise SystemExit('Unknown source')
+    if args.batch:
+        from .batch import main as batch_main
+        raise SystemExit(batch_main([args.batch, '--workers', str(args.workers)]))
+
+    if args.serve:
+        from .server import main as server_main
+        raise SystemExit(server_main(['--host', args.host, '--port', str(args.port), '--workers', str(args.workers)]))
+
+    if args.backtest:
+        from .backtest import main as backtest_main
+        raise SystemExit(backtest_main([args.backtest, '--workers', str(args.workers), '--count', str(args.count)]))
+
+    if args.from_pool:
+        _convert_pool(args)
+        return
+
+    if not args.late_swap and args.mode == 'pool':
+        unsupported = _given(args, _POOL_UNSUPPORTED)
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be combined with --mode pool")
+    elif not args.late_swap and args.workers > 1:
+        unsupported = _given(args, _PARALLEL_UNSUPPORTED)
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be combined with --workers > 1 (parallel runs)")
+
+    players = _SOURCE_LOADERS[args.source](args)
 
     # Apply preset adjustments
-    preset_map = {
-        'default': {},
-        'heavy_stacking': {'prefer_qb_wr_stack': True, 'team_max': 4, 'stack_penalty': 0.0},
-        'contrarian': {'overlap_max': 3, 'team_max': 2, 'stack_penalty': 5.0},
-        'cash': {'overlap_max': 5, 'team_max': 3, 'stack_penalty': 1.0},
-    }
-    preset_opts = preset_map.get(args.preset) or {}
+    preset_opts = PRESET_CONFIGS.get(args.preset) or {}
 
     # Merge CLI args with preset (CLI wins)
     stack_penalty = args.stack_penalty if args.stack_penalty is not None and args.stack_penalty > 0 else preset_opts.get('stack_penalty', 0.0)
@@ -89,20 +231,161 @@ def main():
     team_max = args.team_max if args.team_max is not None else preset_opts.get('team_max')
     prefer_stack = args.prefer_qb_wr_stack or preset_opts.get('prefer_qb_wr_stack', False)
 
-    lineups = generate_n_lineups(
-        players,
-        n=args.count,
-        overlap_max=overlap,
-        team_max=team_max,
-        prefer_qb_wr_stack=prefer_stack,
-        stack_penalty=stack_penalty,
-        avg_overlap_max=args.avg_overlap_max,
-    )
-
-    for i, lu in enumerate(lineups, start=1):
-        print(f"\nLineup {i}: proj={lineup_proj(lu):.2f} salary={lineup_salary(lu)}")
-        for p in sorted(lu.values(), key=lambda x: x.position):
-            print(f"  {p.position} - {p.name} ({p.team}) ${p.salary} proj:{p.proj}")
+    events = []
+    on_iteration = events.append if args.profile else None
+    profiler = None
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    started = time.perf_counter()
+
+    if args.late_swap:
+        from .late_swap import late_swap
+
+        with open(args.late_swap, 'r', encoding='utf-8') as f:
+            original = read_lineup_ids(f)
+        lock_teams = {t.strip().upper() for t in args.lock_teams.split(',') if t.strip()}
+        locked = {p.id for p in players if p.team in lock_teams} | set(args.lock)
+        lineups = late_swap(
+            original,
+            players,
+            locked=locked,
+            unavailable=args.exclude,
+            team_max=team_max,
+            stack_penalty=stack_penalty,
+            workers=args.workers,
+            solver=args.solver,
+            time_limit=args.time_limit,
+            threads=args.threads,
+            mip_gap=args.mip_gap,
+            on_iteration=on_iteration,
+        )
+    elif args.mode == 'pool':
+        from .portfolio import generate_portfolio
+
+        def sim_score(pool):
+            from .simulation import simulate_lineups
+            return simulate_lineups(pool, n_sims=10000, seed=args.seed).top_frequency
+
+        lineups = generate_portfolio(
+            players,
+            n=args.count,
+            pool_size=args.pool_size,
+            seed=args.seed,
+            overlap_max=overlap,
+            team_max=team_max,
+            stack_penalty=stack_penalty,
+            avg_overlap_max=args.avg_overlap_max,
+            score=sim_score if args.rank_by == 'sim' else None,
+            solver=args.solver,
+            time_limit=args.time_limit,
+            threads=args.threads,
+            mip_gap=args.mip_gap,
+            on_iteration=on_iteration,
+        )
+    elif args.workers > 1:
+        from .parallel import generate_n_lineups_parallel
+
+        lineups = generate_n_lineups_parallel(
+            players,
+            n=args.count,
+            workers=args.workers,
+            seed=args.seed,
+            overlap_max=overlap,
+            team_max=team_max,
+            stack_penalty=stack_penalty,
+            avg_overlap_max=args.avg_overlap_max,
+            engine=args.engine,
+            solver=args.solver,
+            time_limit=args.time_limit,
+            threads=args.threads,
+            mip_gap=args.mip_gap,
+            prefer_qb_wr_stack=prefer_stack,
+            on_iteration=on_iteration,
+        )
+    else:
+        # Sequential runs stream: each lineup is printed as soon as it is solved
+        options = dict(
+            n=args.count,
+            overlap_max=overlap,
+            team_max=team_max,
+            prefer_qb_wr_stack=prefer_stack,
+            stack_penalty=stack_penalty,
+            avg_overlap_max=args.avg_overlap_max,
+            engine=args.engine,
+            solver=args.solver,
+            time_limit=args.time_limit,
+            threads=args.threads,
+            mip_gap=args.mip_gap,
+            on_iteration=on_iteration,
+            time_budget=args.time_budget,
+        )
+        if args.diversity != 'cuts':
+            options.update(diversity=args.diversity, max_exposure=args.max_exposure, exposure_penalty=args.exposure_penalty)
+        if args.result_cache:
+            cache = ResultCache(args.result_cache_dir, args.result_cache_size)
+            stream = iter_lineups_cached(cache, players, preset=args.preset, **options)
+        else:
+            stream = iter_lineups(players, **options)
+        lineups = (lineup for lineup, _ in stream)
+
+    found = 0
+    kept = []
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        for found, lu in enumerate(lineups, start=1):
+            kept.append(lu)
+            block = format_lineup(found, lu)
+            print('\n' + block, end='', flush=True)
+            if out is not None:
+                out.write(block + '\n')
+                out.flush()
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; keeping the {found} lineups found so far", file=sys.stderr)
+    finally:
+        if out is not None:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    if args.save_ids:
+        with open(args.save_ids, 'w', encoding='utf-8') as f:
+            write_lineup_ids(kept, f)
+    if args.pool_file or args.dk_csv:
+        from .lineups import LineupArray
+        from .pool_file import write_dk_csv, write_pool
+        from .slate import compile_slate
+
+        array = LineupArray.from_dicts(compile_slate(players), kept)
+        if args.pool_file:
+            write_pool(args.pool_file, array.slate, array)
+        if args.dk_csv:
+            with open(args.dk_csv, 'w', encoding='utf-8', newline='') as f:
+                write_dk_csv(f, array)
+    if args.diversity == 'exposure' and args.mode == 'sequential' and args.workers <= 1 and not args.late_swap and kept:
+        from .lineups import LineupArray, overlap_report
+        from .slate import compile_slate
+
+        report = overlap_report(LineupArray.from_dicts(compile_slate(players), kept), overlap, args.avg_overlap_max)
+        print(f"Overlap: max {report['max_overlap']} (over target by {report['overlap_excess']}, {report['pairs_over']} pairs), "
+              f"worst average {report['max_avg_overlap']:.2f} (over target by {report['avg_overlap_excess']:.2f})", file=sys.stderr)
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.cprofile)
+    if args.profile:
+        # Parallel events carry their round and partition; pool mode's start
+        # with one per candidate-pool round (stage 'pool')
+        trace = {
+            'mode': 'late_swap' if args.late_swap else args.mode if args.mode == 'pool' or args.workers <= 1 else 'parallel',
+            'engine': args.engine,
+            'solver': args.solver,
+            'players': len(players),
+            'lineups': found,
+            'total_s': elapsed,
+            'iterations': events,
+        }
+        with open(args.profile, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,25 @@
+"""Player data sources, imported on first use.
+
+``SOURCES`` maps each source name to the module that implements it. A
+source module, and its dependencies such as requests and BeautifulSoup,
+is only imported when ``load_source`` is asked for it, so a run pays for
+the one source it reads and nothing else.
+"""
+import importlib
+from types import ModuleType
+
+SOURCES = {
+    'mock': 'mock',
+    'web': 'web',
+    'fftoolbox': 'fftoolbox',
+    # Salary feed plus projection sources, fetched concurrently
+    'merge': 'pipeline',
+}
+
+
+def load_source(name: str) -> ModuleType:
+    """Import and return the module of source ``name``; raises ValueError for unknown names."""
+    module = SOURCES.get(name)
+    if module is None:
+        raise ValueError(f"Unknown data source {name!r}; expected one of {sorted(SOURCES)}")
+    return importlib.import_module(f".{module}", __name__)
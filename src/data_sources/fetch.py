@@ -0,0 +1,203 @@
+"""Shared HTTP layer for the web sources: one pooled session plus an on-disk cache.
+
+Responses are stored under the cache directory keyed by a hash of the URL:
+``<key>.body`` holds the raw bytes and ``<key>.json`` the URL, encoding,
+validators (ETag / Last-Modified) and fetch time. A cached response younger
+than the TTL is served without touching the network; an older one is
+revalidated with a conditional GET and reused on 304. The directory is kept
+under ``max_bytes`` by evicting the least recently used bodies.
+
+``configure(offline=True)`` serves only from the cache (any age) and raises
+``CacheMiss`` otherwise; ``configure(refresh=True)`` ignores the TTL so every
+URL is revalidated.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ai-fantasy-football-creator', 'http')
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+_CHUNK = 64 * 1024
+
+
+class CacheMiss(requests.ConnectionError):
+    """Offline mode and the URL is not in the cache."""
+
+
+class _Config:
+    def __init__(self):
+        self.cache_dir = os.environ.get('DKGEN_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.ttl = DEFAULT_TTL
+        self.max_bytes = DEFAULT_MAX_BYTES
+        self.offline = False
+        self.refresh = False
+
+
+_config = _Config()
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def configure(
+    cache_dir: Optional[str] = None,
+    ttl: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    offline: Optional[bool] = None,
+    refresh: Optional[bool] = None,
+):
+    """Change the cache settings; arguments left as None keep their value."""
+    if cache_dir is not None:
+        _config.cache_dir = cache_dir
+    if ttl is not None:
+        _config.ttl = ttl
+    if max_bytes is not None:
+        _config.max_bytes = max_bytes
+    if offline is not None:
+        _config.offline = offline
+    if refresh is not None:
+        _config.refresh = refresh
+
+
+def get_session() -> requests.Session:
+    """The process-wide session, so connections to the same host are reused."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+
+class CachedResponse:
+    """A response body on disk; ``from_cache`` is False when it was just downloaded."""
+
+    def __init__(self, url: str, path: str, encoding: Optional[str], from_cache: bool):
+        self.url = url
+        self.path = path
+        self.encoding = encoding or 'utf-8'
+        self.from_cache = from_cache
+
+    def open(self) -> io.TextIOWrapper:
+        """Text stream over the body, suitable for ``csv.reader``."""
+        return open(self.path, 'r', encoding=self.encoding, newline='')
+
+    @property
+    def text(self) -> str:
+        with self.open() as f:
+            return f.read()
+
+
+def _paths(url: str):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    base = os.path.join(_config.cache_dir, key)
+    return base + '.body', base + '.json'
+
+
+def _read_meta(meta_path: str) -> Optional[dict]:
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path: str, meta: dict):
+    tmp = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp, meta_path)
+
+
+def _evict(keep: str):
+    """Drop least recently used bodies until the directory fits in max_bytes."""
+    entries = []
+    total = 0
+    for name in os.listdir(_config.cache_dir):
+        if not name.endswith('.body'):
+            continue
+        path = os.path.join(_config.cache_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= _config.max_bytes:
+            break
+        if path == keep:
+            continue
+        for stale in (path, path[:-len('.body')] + '.json'):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+        total -= size
+
+
+def fetch(url: str, timeout: float = 15) -> CachedResponse:
+    """GET ``url`` through the cache.
+
+    Raises ``requests.HTTPError`` for error responses (which are not cached)
+    and ``CacheMiss`` in offline mode when nothing is cached.
+    """
+    body_path, meta_path = _paths(url)
+    meta = _read_meta(meta_path) if os.path.exists(body_path) else None
+
+    if meta is not None:
+        fresh = time.time() - meta.get('fetched_at', 0) < _config.ttl
+        if _config.offline or (fresh and not _config.refresh):
+            # Body mtime doubles as the LRU clock for eviction
+            os.utime(body_path)
+            return CachedResponse(url, body_path, meta.get('encoding'), from_cache=True)
+    if _config.offline:
+        raise CacheMiss(f"{url} is not cached (offline mode)")
+
+    headers = {}
+    if meta is not None:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    with get_session().get(url, timeout=timeout, headers=headers, stream=True) as r:
+        if r.status_code == 304 and meta is not None:
+            meta['fetched_at'] = time.time()
+            _write_meta(meta_path, meta)
+            os.utime(body_path)
+            return CachedResponse(url, body_path, meta.get('encoding'), from_cache=True)
+        r.raise_for_status()
+
+        os.makedirs(_config.cache_dir, exist_ok=True)
+        tmp = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            for chunk in r.iter_content(_CHUNK):
+                f.write(chunk)
+        os.replace(tmp, body_path)
+        meta = {
+            'url': url,
+            'encoding': r.encoding,
+            'etag': r.headers.get('ETag'),
+            'last_modified': r.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        }
+        _write_meta(meta_path, meta)
+
+    _evict(keep=body_path)
+    return CachedResponse(url, body_path, meta['encoding'], from_cache=False)
+
+
+def fetch_text(url: str, timeout: float = 15) -> str:
+    return fetch(url, timeout=timeout).text
@@ -0,0 +1,146 @@
+"""Match the same athlete across data sources.
+
+Every source builds its own ids, so players are joined on canonical keys:
+a normalized name (accents, punctuation and Jr./III-style suffixes removed)
+plus a canonical team code, or just the team for defenses. Exact keys join
+through one dict lookup each. Leftovers go to a fuzzy matcher that compares
+name trigrams only against unclaimed players of the same team and position.
+
+Fuzzy matches are remembered in an alias table (source key -> canonical
+key) that can be saved as JSON and loaded next week, so a name only has to
+be matched fuzzily once.
+"""
+import json
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..models import Player
+
+_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+_PUNCTUATION = re.compile(r"[.'`’,]")
+_SEPARATORS = re.compile(r'[-_/]')
+
+# Alternate team codes seen across feeds (and relocated franchises)
+TEAM_ALIASES = {
+    'ARZ': 'ARI', 'BLT': 'BAL', 'CLV': 'CLE', 'GNB': 'GB', 'HST': 'HOU', 'JAC': 'JAX', 'KAN': 'KC',
+    'LA': 'LAR', 'STL': 'LAR', 'SD': 'LAC', 'LVR': 'LV', 'OAK': 'LV', 'NWE': 'NE', 'NOR': 'NO',
+    'SFO': 'SF', 'TAM': 'TB', 'WSH': 'WAS',
+}
+
+DEFAULT_MIN_SIMILARITY = 0.5
+
+
+def normalize_team(team: Optional[str]) -> str:
+    code = (team or '').strip().upper()
+    return TEAM_ALIASES.get(code, code)
+
+
+def normalize_name(name: str) -> str:
+    """'A.J. Brown Jr.' -> 'aj brown'; accents are folded to ASCII."""
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    text = _SEPARATORS.sub(' ', _PUNCTUATION.sub('', text))
+    words = text.split()
+    while len(words) > 1 and words[-1] in _SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def canonical_key(p: Player) -> str:
+    """Hash key for ``p``; defenses are keyed by team alone since their names vary most."""
+    team = normalize_team(p.team)
+    if p.is_dst:
+        return f"dst|{team}"
+    return f"{normalize_name(p.name)}|{team}"
+
+
+def _position(p: Player) -> str:
+    return 'DST' if p.is_dst else p.position
+
+
+def _trigrams(name: str) -> Set[str]:
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class MatchResult:
+    """``matches`` maps an index in the resolved list to an index in the base list."""
+    matches: Dict[int, int]
+    unmatched: List[Player]
+    fuzzy: Dict[int, int] = field(default_factory=dict)  # the subset of matches made by the fuzzy pass
+
+
+class IdentityIndex:
+    """Canonical-key index over a base player list (usually the salary feed)."""
+
+    def __init__(self, base: List[Player], aliases: Optional[Dict[str, str]] = None, min_similarity: float = DEFAULT_MIN_SIMILARITY):
+        self.base = base
+        self.aliases: Dict[str, str] = dict(aliases or {})
+        self.min_similarity = min_similarity
+        self.by_key: Dict[str, int] = {}
+        # Fuzzy candidates are blocked by (team, position)
+        self.blocks: Dict[Tuple[str, str], List[Tuple[int, Set[str]]]] = {}
+        for i, p in enumerate(base):
+            self.by_key.setdefault(canonical_key(p), i)
+            block = (normalize_team(p.team), _position(p))
+            self.blocks.setdefault(block, []).append((i, _trigrams(normalize_name(p.name))))
+
+    def resolve(self, players: List[Player]) -> MatchResult:
+        """Match ``players`` onto the base list, at most one player per base entry.
+
+        Exact keys (after the alias table) are tried first for everyone, so a
+        fuzzy match can never take a base player that has an exact partner.
+        """
+        matches: Dict[int, int] = {}
+        claimed: Set[int] = set()
+        leftovers: List[int] = []
+        for j, p in enumerate(players):
+            key = canonical_key(p)
+            i = self.by_key.get(self.aliases.get(key, key))
+            if i is None or i in claimed:
+                leftovers.append(j)
+                continue
+            matches[j] = i
+            claimed.add(i)
+
+        fuzzy: Dict[int, int] = {}
+        unmatched: List[Player] = []
+        for j in leftovers:
+            p = players[j]
+            grams = _trigrams(normalize_name(p.name))
+            best, best_score = None, self.min_similarity
+            for i, candidate in self.blocks.get((normalize_team(p.team), _position(p)), ()):
+                if i in claimed:
+                    continue
+                score = _similarity(grams, candidate)
+                if score >= best_score:
+                    best, best_score = i, score
+            if best is None:
+                unmatched.append(p)
+                continue
+            matches[j] = fuzzy[j] = best
+            claimed.add(best)
+            self.aliases[canonical_key(p)] = canonical_key(self.base[best])
+        return MatchResult(matches=matches, unmatched=unmatched, fuzzy=fuzzy)
+
+
+def load_aliases(path: str) -> Dict[str, str]:
+    """Alias table saved by ``save_aliases``; a missing file is an empty table."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_aliases(path: str, aliases: Dict[str, str]):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(aliases.items())), f, indent=2)
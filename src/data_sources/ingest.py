@@ -0,0 +1,190 @@
+"""Shared CSV ingestion for the salary / projection sources.
+
+The column mapping is resolved once from the header row, and every field
+gets a parser chosen up front, so the per-row work is a few list lookups and
+one Player constructor. Rows are consumed as they are read: local files, and
+HTTP bodies once ``fetch`` has written them to its cache, go straight into
+``csv.reader`` without being loaded into a string first.
+"""
+import csv
+import io
+import re
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from ..models import Player
+
+
+_NON_DIGIT = re.compile(r'[^0-9]')
+_NON_NUMBER = re.compile(r'[^0-9\.]')
+
+
+def parse_salary(text: str) -> int:
+    """'$7,300' -> 7300; anything without digits -> 0."""
+    if text.isascii() and text.isdigit():
+        return int(text)
+    digits = _NON_DIGIT.sub('', text)
+    return int(digits) if digits else 0
+
+
+def parse_proj(text: str) -> float:
+    """'18.4 pts' -> 18.4; only digits and dots are kept, unparseable -> 0.0."""
+    if text.isascii() and text.replace('.', '', 1).isdigit():
+        return float(text)
+    try:
+        return float(_NON_NUMBER.sub('', text))
+    except ValueError:
+        return 0.0
+
+
+def clean_name(name: str) -> str:
+    """Collapse runs of whitespace and trim."""
+    return ' '.join(name.split())
+
+
+_POSITION_CACHE: Dict[str, str] = {}
+
+
+def normalize_position(raw: str) -> str:
+    """Map the many spellings of a position onto QB/RB/WR/TE/DST.
+
+    Results are cached per raw string since a slate only has a handful of
+    distinct values.
+    """
+    pos = _POSITION_CACHE.get(raw)
+    if pos is not None:
+        return pos
+    # Normalize without truncating so DST/Def and other variants are detected
+    text = raw.strip().upper()
+    for prefix in ('QB', 'RB', 'WR', 'TE'):
+        if text.startswith(prefix):
+            pos = prefix
+            break
+    else:
+        if text.startswith('DEF') or text in ('DST', 'D/ST', 'D'):
+            pos = 'DST'
+        else:
+            pos = text[:3]
+    _POSITION_CACHE[raw] = pos
+    return pos
+
+
+class CsvSchema:
+    """Header aliases per field plus how to turn a row into a Player.
+
+    ``columns`` maps each field (name, salary, position, team, proj) to the
+    header names that may carry it, most preferred first. When a file has
+    several of them, the first non-empty one wins on each row.
+    ``parse_proj`` turns the proj field into a float.
+    """
+
+    def __init__(self, id_prefix: str, columns: Dict[str, Sequence[str]], parse_proj: Callable[[str], float] = parse_proj):
+        self.id_prefix = id_prefix
+        self.columns = columns
+        self.parse_proj = parse_proj
+
+    def resolve(self, header: Sequence[str]) -> Dict[str, Tuple[int, ...]]:
+        """Column indices per field for this header (empty tuple if absent)."""
+        position = {}
+        for i, col in enumerate(header):
+            position.setdefault(col.strip(), i)
+        return {field: tuple(position[c] for c in names if c in position) for field, names in self.columns.items()}
+
+
+FFTOOLBOX_SCHEMA = CsvSchema('FT', {
+    'name': ('Player', 'Name', 'player', 'name'),
+    'salary': ('DK Salary', 'Salary', 'salary', 'dk_salary', 'Salary ($)'),
+    'position': ('Pos', 'Position', 'pos'),
+    'team': ('Team', 'team', 'Tm'),
+    'proj': ('FPTS', 'Proj', 'Projection', 'fpts', 'proj'),
+})
+
+SALARY_SCHEMA = CsvSchema('CSV', {
+    'name': ('Name', 'name'),
+    'salary': ('Salary', 'salary'),
+    'position': ('Position', 'position'),
+    'team': ('Team', 'team'),
+    # Salary files carry no projections; those come from a projection source
+    'proj': (),
+})
+
+
+def _getter(indices: Tuple[int, ...]) -> Callable[[List[str]], str]:
+    """Row accessor for one field: direct index when only one column matched."""
+    if not indices:
+        return lambda row: ''
+    if len(indices) == 1:
+        (i,) = indices
+
+        def one(row):
+            return row[i] if i < len(row) else ''
+        return one
+
+    def first_non_empty(row):
+        for i in indices:
+            if i < len(row) and row[i]:
+                return row[i]
+        return ''
+    return first_non_empty
+
+
+def players_from_rows(rows: Iterable[List[str]], schema: CsvSchema) -> List[Player]:
+    """Build Players from parsed CSV rows; the first row is the header.
+
+    Rows without a name are skipped. Missing or unparseable salaries and
+    projections become 0.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return []
+    cols = schema.resolve(header)
+    get_name, get_salary, get_position, get_team, get_proj = (
+        _getter(cols[field]) for field in ('name', 'salary', 'position', 'team', 'proj')
+    )
+    prefix = schema.id_prefix
+    to_proj = schema.parse_proj
+
+    players: List[Player] = []
+    append = players.append
+    for row in rows:
+        name = get_name(row)
+        if not name:
+            continue
+        name = clean_name(name)
+        salary = get_salary(row)
+        proj = get_proj(row)
+        pos = normalize_position(get_position(row))
+        team = get_team(row).upper()
+        append(Player(
+            id=f"{prefix}_{team}_{name.replace(' ', '_')}",
+            name=name,
+            position=pos,
+            team=team,
+            opponent=None,
+            proj=to_proj(proj) if proj else 0.0,
+            salary=parse_salary(salary) if salary else 0,
+            is_dst=(pos == 'DST'),
+        ))
+    return players
+
+
+def read_csv_text(text: str, schema: CsvSchema) -> List[Player]:
+    return players_from_rows(csv.reader(io.StringIO(text)), schema)
+
+
+def read_csv_file(path: str, schema: CsvSchema) -> List[Player]:
+    """Stream a local CSV (a UTF-8 BOM is tolerated)."""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return players_from_rows(csv.reader(f), schema)
+
+
+def read_csv_url(url: str, schema: CsvSchema, timeout: float = 15) -> List[Player]:
+    """Fetch a CSV through the HTTP cache and stream the stored body into the row parser.
+
+    Raises ``requests.HTTPError`` for error responses.
+    """
+    # Imported here so local files never load requests
+    from .fetch import fetch
+
+    with fetch(url, timeout=timeout).open() as f:
+        return players_from_rows(csv.reader(f), schema)
@@ -1,4 +1,6 @@
-from typing import List
+import random
+from typing import Dict, List, Optional, Tuple
+
 from ..models import Player
 
 
@@ -6,13 +8,13 @@ def fetch_players_for_week(week: int = None) -> List[Player]:
     # Small mock slate with made-up salaries and projections for testing
     sample = [
         Player(id="QB1", name="Quarterback One", position="QB", team="NE", opponent="NYJ", proj=22.5, salary=8500),
-        Player(id="QB2", name="Quarterback Two", position="QB", team="KC", opponent="DEN", proj=20.0, salary=8300),
+        Player(id="QB2", name="Quarterback Two", position="QB", team="KC", opponent="DEN", proj=20.0, salary=7300),
         Player(id="RB1", name="Running Back A", position="RB", team="DAL", opponent="PHI", proj=18.0, salary=7600),
         Player(id="RB2", name="Running Back B", position="RB", team="GB", opponent="MIN", proj=15.0, salary=7000),
-        Player(id="RB3", name="Running Back C", position="RB", team="TEN", opponent="HOU", proj=12.0, salary=6200),
-        Player(id="WR1", name="Wideout A", position="WR", team="GB", opponent="MIN", proj=17.0, salary=7400),
-        Player(id="WR2", name="Wideout B", position="WR", team="KC", opponent="DEN", proj=16.0, salary=7200),
-        Player(id="WR3", name="Wideout C", position="WR", team="NE", opponent="NYJ", proj=14.0, salary=6800),
+        Player(id="RB3", name="Running Back C", position="RB", team="TEN", opponent="HOU", proj=12.0, salary=5200),
+        Player(id="WR1", name="Wideout A", position="WR", team="GB", opponent="MIN", proj=17.0, salary=6400),
+        Player(id="WR2", name="Wideout B", position="WR", team="KC", opponent="DEN", proj=16.0, salary=6200),
+        Player(id="WR3", name="Wideout C", position="WR", team="NE", opponent="NYJ", proj=14.0, salary=5800),
         Player(id="TE1", name="Tight End One", position="TE", team="KC", opponent="DEN", proj=10.0, salary=5000),
         Player(id="TE2", name="Tight End Two", position="TE", team="DAL", opponent="PHI", proj=8.0, salary=4200),
         Player(id="FLEX_RB", name="Flex RB", position="RB", team="MIA", opponent="BUF", proj=9.0, salary=4500),
@@ -20,3 +22,52 @@ def fetch_players_for_week(week: int = None) -> List[Player]:
         Player(id="DST2", name="Defense Team 2", position="DST", team="KC", opponent="DEN", proj=6.0, salary=3000, is_dst=True),
     ]
     return sample
+
+
+NFL_TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
+    'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS',
+]
+
+# Defaults for generate_slate: players per team, salary range and points per $1k of salary
+DEFAULT_PLAYERS_PER_POSITION = {'QB': 2, 'RB': 4, 'WR': 6, 'TE': 3, 'DST': 1}
+DEFAULT_SALARY_RANGES = {'QB': (4800, 8500), 'RB': (4000, 9000), 'WR': (3000, 9000), 'TE': (2500, 7500), 'DST': (2000, 4000)}
+DEFAULT_POINTS_PER_K = {'QB': 2.6, 'RB': 2.3, 'WR': 2.3, 'TE': 2.1, 'DST': 2.4}
+
+
+def generate_slate(
+    n_teams: int = 32,
+    players_per_position: Optional[Dict[str, int]] = None,
+    salary_ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+    points_per_k: Optional[Dict[str, float]] = None,
+    proj_noise: float = 3.0,
+    seed: int = 0,
+) -> List[Player]:
+    """Random but reproducible slate for tests and benchmarks.
+
+    Teams are paired into games (``opponent`` is set). Salaries are drawn
+    uniformly from ``salary_ranges`` in $100 steps and projections are
+    ``salary / 1000 * points_per_k`` plus Gaussian noise with sd
+    ``proj_noise``, floored at 0.5. The same arguments always give the same
+    players.
+    """
+    rng = random.Random(seed)
+    per_position = players_per_position or DEFAULT_PLAYERS_PER_POSITION
+    ranges = salary_ranges or DEFAULT_SALARY_RANGES
+    rates = points_per_k or DEFAULT_POINTS_PER_K
+    teams = [NFL_TEAMS[i] if i < len(NFL_TEAMS) else f"T{i}" for i in range(n_teams)]
+
+    players: List[Player] = []
+    for t_idx, team in enumerate(teams):
+        opp_idx = t_idx + 1 if t_idx % 2 == 0 else t_idx - 1
+        opponent = teams[opp_idx] if opp_idx < len(teams) else None
+        for pos, count in per_position.items():
+            lo, hi = ranges[pos]
+            for k in range(count):
+                salary = rng.randrange(lo, hi + 1, 100)
+                proj = round(max(0.5, salary / 1000 * rates[pos] + rng.gauss(0, proj_noise)), 2)
+                is_dst = pos == 'DST'
+                pid = f"{team}_{pos}{k + 1}"
+                name = f"{team} D/ST" if is_dst else f"{team} {pos}{k + 1}"
+                players.append(Player(id=pid, name=name, position=pos, team=team, opponent=opponent, proj=proj, salary=salary, is_dst=is_dst))
+    return players
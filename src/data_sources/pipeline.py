@@ -0,0 +1,146 @@
+"""Fetch several sources at once and merge them into one player list.
+
+Salaries come from one feed and projections from any number of others. Each
+source is a zero-argument callable returning players; they run in a thread
+pool (the work is network and parsing bound, and the HTTP layer shares one
+pooled session), so loading takes about as long as the slowest source.
+"""
+import dataclasses
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..models import Player
+from . import fftoolbox, web
+from .identity import IdentityIndex, load_aliases, save_aliases
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], List[Player]]
+
+
+@dataclass
+class LoadResult:
+    """Merged players plus what each source returned and how long it took."""
+    players: List[Player]
+    by_source: Dict[str, List[Player]]
+    timings: Dict[str, float]  # seconds per source, plus 'total' wall time
+    errors: Dict[str, str] = field(default_factory=dict)
+    unmatched: Dict[str, List[Player]] = field(default_factory=dict)  # projection players with no salary row
+
+
+def fetch_all(sources: Dict[str, Loader], max_workers: Optional[int] = None) -> Tuple[Dict[str, List[Player]], Dict[str, float], Dict[str, str]]:
+    """Run every loader concurrently; a failing source is recorded and yields no players."""
+    by_source: Dict[str, List[Player]] = {}
+    timings: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+
+    def timed(loader: Loader):
+        start = time.perf_counter()
+        try:
+            return loader(), None, time.perf_counter() - start
+        except Exception as e:
+            return [], f"{type(e).__name__}: {e}", time.perf_counter() - start
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(sources))) as pool:
+        futures = {pool.submit(timed, loader): name for name, loader in sources.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            players, error, seconds = future.result()
+            by_source[name] = players
+            timings[name] = seconds
+            if error:
+                errors[name] = error
+            logger.info("Source %s: %d players in %.2fs%s", name, len(players), seconds, f" ({error})" if error else '')
+    timings['total'] = time.perf_counter() - started
+    return by_source, timings, errors
+
+
+def merge_players(
+    base: List[Player],
+    projections: List[List[Player]],
+    index: Optional[IdentityIndex] = None,
+) -> Tuple[List[Player], List[List[Player]]]:
+    """Take salary, position and team from ``base`` and the mean projection across ``projections``.
+
+    Players are joined through an ``IdentityIndex`` over ``base`` (pass one
+    to reuse its alias table). Base players no projection source knows keep
+    their own projection. Returns the merged list and, per projection source,
+    the players that matched nobody in ``base``.
+    """
+    index = index or IdentityIndex(base)
+    sums = [0.0] * len(base)
+    counts = [0] * len(base)
+    opponents: Dict[int, str] = {}
+    unmatched: List[List[Player]] = []
+    for source in projections:
+        result = index.resolve(source)
+        for j, i in result.matches.items():
+            p = source[j]
+            sums[i] += p.proj
+            counts[i] += 1
+            if p.opponent:
+                opponents.setdefault(i, p.opponent)
+        unmatched.append(result.unmatched)
+
+    merged: List[Player] = []
+    for i, p in enumerate(base):
+        proj = round(sums[i] / counts[i], 2) if counts[i] else p.proj
+        merged.append(dataclasses.replace(p, proj=proj, opponent=p.opponent or opponents.get(i)))
+    return merged, unmatched
+
+
+def _projection_loader(source: str) -> Loader:
+    if Path(source).exists():
+        return lambda: fftoolbox.parse_csv_file(source)
+    return lambda: fftoolbox.fetch_players_from_page(source)
+
+
+def load_players(
+    salary_source: Optional[str],
+    projection_sources: List[str],
+    max_workers: Optional[int] = None,
+    aliases_path: Optional[str] = None,
+    strict: bool = False,
+) -> LoadResult:
+    """Fetch the salary feed and every projection source concurrently, then merge.
+
+    Sources are local CSV paths or URLs. Without a salary feed the first
+    projection source provides the salaries. With ``aliases_path`` the
+    identity alias table is loaded from it before merging and saved back with
+    any new fuzzy matches. With ``strict`` a source that fails or returns no
+    players raises ValueError instead of being recorded in ``errors``.
+    """
+    sources: Dict[str, Loader] = {}
+    if salary_source:
+        sources['salaries'] = lambda: web.fetch_salaries(salary_source)
+    for i, source in enumerate(projection_sources):
+        sources[f"projections[{i}]"] = _projection_loader(source)
+    if not sources:
+        raise ValueError("No sources configured")
+
+    by_source, timings, errors = fetch_all(sources, max_workers)
+    if strict:
+        failed = {name: errors.get(name, 'no players') for name, players in by_source.items() if not players}
+        if failed:
+            raise ValueError('; '.join(f"{name}: {error}" for name, error in sorted(failed.items())))
+    projections = [by_source[f"projections[{i}]"] for i in range(len(projection_sources))]
+    base = by_source['salaries'] if salary_source else projections[0]
+
+    start = time.perf_counter()
+    index = IdentityIndex(base, aliases=load_aliases(aliases_path) if aliases_path else None)
+    players, unmatched = merge_players(base, projections, index)
+    timings['merge'] = time.perf_counter() - start
+    if aliases_path:
+        save_aliases(aliases_path, index.aliases)
+    return LoadResult(
+        players=players,
+        by_source=by_source,
+        timings=timings,
+        errors=errors,
+        unmatched={f"projections[{i}]": missing for i, missing in enumerate(unmatched) if missing},
+    )
@@ -1,26 +1,19 @@
-import csv
-from io import StringIO
+import os
 from typing import List, Optional
-import requests
-from bs4 import BeautifulSoup
 
 from ..models import Player
+from .ingest import SALARY_SCHEMA, read_csv_file, read_csv_text, read_csv_url
 
 
 def _parse_salary_csv(csv_text: str) -> List[Player]:
-    players = []
-    reader = csv.DictReader(StringIO(csv_text))
-    for r in reader:
-        try:
-            name = r.get('Name') or r.get('name')
-            salary = int(r.get('Salary') or r.get('salary') or 0)
-            position = (r.get('Position') or r.get('position') or '').upper()
-            team = (r.get('Team') or r.get('team') or '').upper()
-            pid = f"CSV_{team}_{name.replace(' ','_')}"
-            players.append(Player(id=pid, name=name, position=position, team=team, opponent=None, proj=0.0, salary=salary, is_dst=(position=='DST')))
-        except Exception:
-            continue
-    return players
+    return read_csv_text(csv_text, SALARY_SCHEMA)
+
+
+def fetch_salaries(source: str) -> List[Player]:
+    """Read a Name,Salary,Position,Team CSV from a local path or URL; errors propagate."""
+    if os.path.exists(source):
+        return read_csv_file(source, SALARY_SCHEMA)
+    return read_csv_url(source, SALARY_SCHEMA, timeout=10)
 
 
 def fetch_players_for_week(week: Optional[int] = None, salary_csv_url: Optional[str] = None) -> List[Player]:
@@ -32,9 +25,7 @@ def fetch_players_for_week(week: Optional[int] = None, salary_csv_url: Optional[
 
     if salary_csv_url:
         try:
-            r = requests.get(salary_csv_url, timeout=10)
-            r.raise_for_status()
-            players = _parse_salary_csv(r.text)
+            players = fetch_salaries(salary_csv_url)
             if players:
                 return players
         except Exception:
@@ -42,13 +33,15 @@ def fetch_players_for_week(week: Optional[int] = None, salary_csv_url: Optional[
             pass
 
     # Fallback: scrape NFL.com scoreboard to get teams for the week and create placeholder DST players
+    from bs4 import BeautifulSoup
+
+    from .fetch import fetch_text
+
     try:
         url = 'https://www.nfl.com/schedules/'
         if week:
             url += f'{week}'
-        r = requests.get(url, timeout=10)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, 'html.parser')
+        soup = BeautifulSoup(fetch_text(url, timeout=10), 'html.parser')
         # Find team abbreviations in schedule (best-effort)
         teams = set()
         for a in soup.select('abbr'):
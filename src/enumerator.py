@@ -0,0 +1,231 @@
+import heapq
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .roster import DK_SALARY_CAP, FLEX_ELIGIBLE, ROSTER_REQUIREMENTS
+from .slate import POSITION_CODES, CompiledSlate
+
+# Bucket order for the search: QB then WR, so the QB-WR stack penalty is
+# settled early and tightens the bound for the remaining positions
+_SEARCH_ORDER = ('QB', 'WR', 'RB', 'TE', 'DST')
+_MAX_GROUP = max(ROSTER_REQUIREMENTS[pos] + ROSTER_REQUIREMENTS['FLEX'] for pos in FLEX_ELIGIBLE)
+_EPS = 1e-9
+
+
+def _structures() -> List[List[Tuple[str, int]]]:
+    """One (position, count) layout per way of filling the FLEX slot."""
+    layouts = []
+    for flex_pos in sorted(FLEX_ELIGIBLE):
+        counts = {pos: ROSTER_REQUIREMENTS[pos] for pos in _SEARCH_ORDER}
+        counts[flex_pos] += ROSTER_REQUIREMENTS['FLEX']
+        layouts.append([(pos, counts[pos]) for pos in _SEARCH_ORDER])
+    return layouts
+
+
+def _suffix_best(values: np.ndarray, largest: bool) -> np.ndarray:
+    """table[i, m] = best sum of m values among values[i:] (inf when impossible)."""
+    n = len(values)
+    table = np.full((n + 1, _MAX_GROUP + 1), -np.inf if largest else np.inf)
+    table[:, 0] = 0.0
+    best: List[float] = []
+    for i in range(n - 1, -1, -1):
+        best.append(float(values[i]))
+        best.sort(reverse=largest)
+        del best[_MAX_GROUP:]
+        table[i, 1:len(best) + 1] = np.cumsum(best)
+    return table
+
+
+class _Search:
+    """Branch-and-bound over position buckets for the DK Classic roster.
+
+    Each bucket is sorted by projection, and players are picked in bucket
+    order per position so every lineup is visited once. A node is cut when
+    the cheapest completion breaks the salary cap or when a Lagrangian bound
+    (proj - lam * salary over the open slots, plus lam times the salary left)
+    cannot beat the current threshold; both only get worse further along a
+    bucket, so the loop over a bucket stops at the first failure.
+    """
+
+    def __init__(self, slate: CompiledSlate, salary_cap: int, team_max: Optional[int], stack_penalty: float):
+        self.cap = salary_cap
+        self.team_max = team_max
+        self.stack_penalty = stack_penalty
+        self.buckets: Dict[str, np.ndarray] = {}
+        for pos in _SEARCH_ORDER:
+            idx = slate.position(pos)
+            order = np.lexsort((slate.salary[idx], -slate.proj[idx]))
+            self.buckets[pos] = idx[order]
+        self.proj = slate.proj.tolist()
+        self.salary = slate.salary.tolist()
+        self.team = slate.team_code.tolist()
+        self.is_wr = (slate.pos_code == POSITION_CODES['WR']).tolist()
+        self.is_qb = (slate.pos_code == POSITION_CODES['QB']).tolist()
+
+        # A few multipliers around the slate's points-per-dollar rates
+        rates = np.maximum(slate.proj, 0) / np.maximum(slate.salary, 1)
+        quantiles = np.quantile(rates, [0.25, 0.5, 0.75, 0.9]) if len(rates) else []
+        self.lams = [0.0] + sorted({float(q) for q in quantiles if q > 0})
+        # Tables are plain nested lists: scalar lookups in the hot loop are much faster than on ndarrays
+        self.best_adj = {
+            pos: [_suffix_best(slate.proj[b] - lam * slate.salary[b], largest=True).tolist() for lam in self.lams]
+            for pos, b in self.buckets.items()
+        }
+        self.min_sal = {pos: _suffix_best(slate.salary[b].astype(float), largest=False).tolist() for pos, b in self.buckets.items()}
+        self.buckets = {pos: b.tolist() for pos, b in self.buckets.items()}
+
+        self.slots = []
+        for layout in _structures():
+            slots = []
+            for g, (pos, count) in enumerate(layout):
+                later = layout[g + 1:]
+                later_adj = [sum(self.best_adj[p][li][0][c] for p, c in later) for li in range(len(self.lams))]
+                later_sal = sum(self.min_sal[p][0][c] for p, c in later)
+                for k in range(count):
+                    closes_stack = pos == 'WR' and k == count - 1
+                    slots.append((pos, count - k, k == 0, closes_stack, later_adj, later_sal))
+            self.slots.append(slots)
+
+    def run(
+        self,
+        accept,
+        threshold,
+        used_by: Optional[Dict[int, List[int]]] = None,
+        n_used: int = 0,
+        overlap_max: Optional[int] = None,
+    ):
+        """Depth-first search calling ``accept(objective, lineup)`` at each leaf.
+
+        ``threshold()`` returns the objective a node must beat; ``used_by``
+        maps a player to the earlier lineups containing it so partial
+        overlaps can be cut as soon as they exceed ``overlap_max``.
+        """
+        team_counts: Dict[int, int] = {}
+        overlaps = [0] * n_used
+        chosen: List[int] = []
+        proj, salary, team = self.proj, self.salary, self.team
+        lams = self.lams
+        n_lams = len(lams)
+
+        def dfs(slots, s, start, cur_proj, cur_sal):
+            if s == len(slots):
+                accept(cur_proj, tuple(chosen), overlaps)
+                return
+            pos, need, first, closes_stack, later_adj, later_sal = slots[s]
+            bucket = self.buckets[pos]
+            best_adj = self.best_adj[pos]
+            min_sal = self.min_sal[pos]
+            if first:
+                start = 0
+            for j in range(start, len(bucket) - need + 1):
+                if cur_sal + min_sal[j][need] + later_sal > self.cap:
+                    break
+                room = self.cap - cur_sal
+                bound = min(lams[li] * room + best_adj[li][j][need] + later_adj[li] for li in range(n_lams))
+                if cur_proj + bound <= threshold() + _EPS:
+                    break
+                i = bucket[j]
+                if cur_sal + salary[i] + (min_sal[j + 1][need - 1] if need > 1 else 0) + later_sal > self.cap:
+                    continue
+                t = team[i]
+                if self.team_max is not None and t >= 0 and team_counts.get(t, 0) >= self.team_max:
+                    continue
+                hits = used_by.get(i, ()) if used_by else ()
+                if overlap_max is not None and any(overlaps[u] >= overlap_max for u in hits):
+                    continue
+                team_counts[t] = team_counts.get(t, 0) + 1
+                for u in hits:
+                    overlaps[u] += 1
+                chosen.append(i)
+                gain = proj[i]
+                if closes_stack and self.stack_penalty:
+                    # All QBs and WRs are picked: charge the soft-stack penalty now
+                    wr_teams = {team[c] for c in chosen if self.is_wr[c]}
+                    gain -= self.stack_penalty * sum(1 for c in chosen if self.is_qb[c] and team[c] not in wr_teams)
+                dfs(slots, s + 1, j + 1, cur_proj + gain, cur_sal + salary[i])
+                chosen.pop()
+                for u in hits:
+                    overlaps[u] -= 1
+                team_counts[t] -= 1
+
+        for slots in self.slots:
+            dfs(slots, 0, 0, 0.0, 0)
+
+
+def top_k_lineups(
+    slate: CompiledSlate,
+    k: int,
+    salary_cap: int = DK_SALARY_CAP,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    overlap_max: Optional[int] = None,
+    avg_overlap_max: Optional[float] = None,
+) -> List[Tuple[float, Tuple[int, ...]]]:
+    """Return up to k (objective, slate indices) lineups, best first, without a MILP solver.
+
+    Without overlap limits a single search keeps the k best distinct lineups
+    in a heap. With ``overlap_max``/``avg_overlap_max`` each lineup is the
+    best one compatible with those already chosen, matching the sequential
+    cut chain of ``generate_n_lineups``.
+    """
+    return list(iter_top_k_lineups(slate, k, salary_cap, team_max, stack_penalty, overlap_max, avg_overlap_max))
+
+
+def iter_top_k_lineups(
+    slate: CompiledSlate,
+    k: int,
+    salary_cap: int = DK_SALARY_CAP,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    overlap_max: Optional[int] = None,
+    avg_overlap_max: Optional[float] = None,
+) -> Iterator[Tuple[float, Tuple[int, ...]]]:
+    """Generator form of ``top_k_lineups``.
+
+    With overlap limits each lineup is yielded as soon as its search ends;
+    without them the single heap search has to finish before the first one.
+    """
+    search = _Search(slate, salary_cap, team_max, stack_penalty)
+
+    if overlap_max is None and avg_overlap_max is None:
+        heap: List[Tuple[float, Tuple[int, ...]]] = []
+
+        def keep_best(objective, lineup, _overlaps):
+            item = (objective, tuple(sorted(lineup)))
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif objective > heap[0][0] + _EPS:
+                heapq.heapreplace(heap, item)
+
+        search.run(keep_best, lambda: heap[0][0] if len(heap) >= k else -np.inf)
+        yield from sorted(heap, key=lambda item: (-item[0], item[1]))
+        return
+
+    n_found = 0
+    used_by: Dict[int, List[int]] = {}
+    for _ in range(k):
+        incumbent: List[Tuple[float, Tuple[int, ...]]] = []
+
+        def keep_first_best(objective, lineup, overlaps):
+            # Exact repeats and average-overlap violations are only known at a leaf
+            if any(o >= len(lineup) for o in overlaps):
+                return
+            if avg_overlap_max is not None and overlaps and sum(overlaps) > avg_overlap_max * len(overlaps) + _EPS:
+                return
+            if not incumbent or objective > incumbent[0][0] + _EPS:
+                incumbent[:] = [(objective, tuple(sorted(lineup)))]
+
+        search.run(
+            keep_first_best,
+            lambda: incumbent[0][0] if incumbent else -np.inf,
+            used_by=used_by,
+            n_used=n_found,
+            overlap_max=overlap_max,
+        )
+        if not incumbent:
+            break
+        for i in incumbent[0][1]:
+            used_by.setdefault(i, []).append(n_found)
+        n_found += 1
+        yield incumbent[0]
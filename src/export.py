@@ -0,0 +1,29 @@
+import json
+from typing import Dict, Iterable, List, TextIO
+
+from .models import Player
+from .optimizer import lineup_proj, lineup_salary
+
+
+def format_lineup(index: int, lineup: Dict[str, Player]) -> str:
+    """Human-readable block for one lineup (header plus one line per player)."""
+    lines = [f"Lineup {index}: proj={lineup_proj(lineup):.2f} salary={lineup_salary(lineup)}"]
+    for p in sorted(lineup.values(), key=lambda x: x.position):
+        lines.append(f"  {p.position} - {p.name} ({p.team}) ${p.salary} proj:{p.proj}")
+    return '\n'.join(lines) + '\n'
+
+
+def write_lineups(lineups: Iterable[Dict[str, Player]], f: TextIO, start: int = 1):
+    """Write lineups to a text stream, separated by blank lines."""
+    for i, lu in enumerate(lineups, start=start):
+        f.write(format_lineup(i, lu))
+        f.write('\n')
+
+
+def write_lineup_ids(lineups: Iterable[Dict[str, Player]], f: TextIO):
+    """Write lineups as a JSON list of player-id lists (the input of ``late_swap``)."""
+    json.dump([sorted(lu) for lu in lineups], f, indent=1)
+
+
+def read_lineup_ids(f: TextIO) -> List[List[str]]:
+    return json.load(f)
@@ -1,17 +1,55 @@
+import queue
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 import webbrowser
 from typing import Optional
 from .data_sources import fftoolbox
-from .optimizer import generate_n_lineups, lineup_salary, lineup_proj
+from .export import format_lineup, write_lineups
+from .lineups import LineupArray
+from .optimizer import iter_lineups
+from .pool_file import LineupPool, PoolWriter, open_pool, write_dk_csv
+from .presets import PRESET_CONFIGS
+from .result_cache import ResultCache, iter_lineups_cached
+from .slate import compile_slate
+from .solvers import SOLVER_BACKENDS
 
+# How often the Tk loop drains the worker queue, in milliseconds
+POLL_MS = 100
 
-PRESET_CONFIGS = {
-    'default': {},
-    'heavy_stacking': {'stack_penalty': 0.0, 'prefer_qb_wr_stack': True, 'team_max': 4},
-    'contrarian': {'overlap_max': 3, 'team_max': 2, 'stack_penalty': 5.0},
-    'cash': {'overlap_max': 5, 'team_max': 3, 'stack_penalty': 1.0},
-}
+# Lineups of an opened pool file shown in the text box; the rest stay on disk
+POOL_PREVIEW = 200
+
+
+def _generate_worker(csv_path: str, opts: dict, results: queue.Queue, cancel: threading.Event, cache: Optional[ResultCache] = None, preset: Optional[str] = None):
+    """Parse the CSV and solve lineups off the UI thread.
+
+    Posts ('parsed', n_players), ('lineup', lineup) per solved lineup, then
+    ('done', cancelled) or ('error', message). Tk widgets are only touched by
+    the main thread when it drains ``results``. With ``cache`` the run goes
+    through the result cache (``preset`` is part of its key).
+    """
+    try:
+        players = fftoolbox.parse_csv_file(csv_path)
+        if not players:
+            results.put(('error', 'Could not parse players from CSV. Check format and headers.'))
+            return
+        results.put(('parsed', len(players)))
+        if cache is not None:
+            stream = iter_lineups_cached(cache, players, preset=preset, **opts)
+        else:
+            stream = iter_lineups(players, **opts)
+        try:
+            for lineup, _ in stream:
+                results.put(('lineup', lineup))
+                # Checked between solves; a solve already running finishes first
+                if cancel.is_set():
+                    break
+        finally:
+            stream.close()
+        results.put(('done', cancel.is_set()))
+    except Exception as e:
+        results.put(('error', f'Error generating lineups: {e}'))
 
 
 class DGKGui:
@@ -47,18 +85,53 @@ class DGKGui:
         self.avg_overlap_var = tk.DoubleVar(value=4.0)
         tk.Entry(self.root, textvariable=self.avg_overlap_var, width=10).grid(row=5, column=1, sticky='w')
 
+        # Solver backend and limits (0 keeps the solver default)
+        tk.Label(self.root, text='Solver:').grid(row=1, column=2, sticky='w')
+        self.solver_var = tk.StringVar(value='cbc')
+        tk.OptionMenu(self.root, self.solver_var, *sorted(SOLVER_BACKENDS)).grid(row=1, column=3, sticky='w')
+
+        tk.Label(self.root, text='Time limit (s):').grid(row=2, column=2, sticky='w')
+        self.time_limit_var = tk.DoubleVar(value=0.0)
+        tk.Entry(self.root, textvariable=self.time_limit_var, width=10).grid(row=2, column=3, sticky='w')
+
+        tk.Label(self.root, text='Threads:').grid(row=3, column=2, sticky='w')
+        self.threads_var = tk.IntVar(value=0)
+        tk.Entry(self.root, textvariable=self.threads_var, width=10).grid(row=3, column=3, sticky='w')
+
+        tk.Label(self.root, text='MIP gap:').grid(row=4, column=2, sticky='w')
+        self.mip_gap_var = tk.DoubleVar(value=0.0)
+        tk.Entry(self.root, textvariable=self.mip_gap_var, width=10).grid(row=4, column=3, sticky='w')
+
         # Preset
         tk.Label(self.root, text='Preset:').grid(row=6, column=0, sticky='w')
         self.preset_var = tk.StringVar(value='default')
         tk.OptionMenu(self.root, self.preset_var, *PRESET_CONFIGS.keys()).grid(row=6, column=1, sticky='w')
 
-        tk.Button(self.root, text='Generate', command=self.on_generate).grid(row=7, column=0)
-        tk.Button(self.root, text='Export', command=self.on_export).grid(row=7, column=1)
+        # Result cache: identical runs are answered from disk, similar ones warm-started
+        self.cache_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(self.root, text='Reuse cached results', variable=self.cache_var).grid(row=5, column=2, columnspan=2, sticky='w')
+        self.result_cache = ResultCache()
+
+        self.generate_button = tk.Button(self.root, text='Generate', command=self.on_generate)
+        self.generate_button.grid(row=7, column=0)
+        tk.Button(self.root, text='Export', command=self.on_export).grid(row=7, column=1, sticky='w')
+        tk.Button(self.root, text='Open pool', command=self.on_open_pool).grid(row=7, column=1, sticky='e')
+        self.cancel_button = tk.Button(self.root, text='Cancel', command=self.on_cancel, state=tk.DISABLED)
+        self.cancel_button.grid(row=7, column=2)
+
+        self.progress = ttk.Progressbar(self.root, mode='determinate', length=300)
+        self.progress.grid(row=7, column=3, sticky='w')
+        self.status_var = tk.StringVar(value='')
+        tk.Label(self.root, textvariable=self.status_var).grid(row=9, column=0, columnspan=4, sticky='w')
 
         self.output = tk.Text(self.root, width=100, height=30)
         self.output.grid(row=8, column=0, columnspan=3)
 
         self.last_lineups = []
+        self.pool: Optional[LineupPool] = None  # set while an opened pool file is shown
+        self.worker: Optional[threading.Thread] = None
+        self.results: queue.Queue = queue.Queue()
+        self.cancel_event = threading.Event()
 
     def browse_csv(self):
         path = filedialog.askopenfilename(title='Select FFToolbox CSV', filetypes=[('CSV files', '*.csv')])
@@ -74,19 +147,16 @@ class DGKGui:
             messagebox.showerror('Open browser', f'Could not open browser. Please visit:\n{fft_url}')
 
     def on_generate(self):
+        if self.worker is not None and self.worker.is_alive():
+            return
         csv_path = self.csv_var.get()
         if not csv_path:
             messagebox.showerror('No CSV', 'Please select the FFToolbox CSV first (download from the FFToolbox page).')
             return
 
         preset = PRESET_CONFIGS.get(self.preset_var.get(), {})
-        # Read players
-        players = fftoolbox.parse_csv_file(csv_path)
-        if not players:
-            messagebox.showerror('Parse error', 'Could not parse players from CSV. Check format and headers.')
-            return
 
-        # Merge preset with fields
+        # Merge preset with fields (Tk variables are read here, on the main thread)
         opts = {
             'n': int(self.count_var.get()),
             'overlap_max': int(self.overlap_var.get()),
@@ -94,44 +164,120 @@ class DGKGui:
             'stack_penalty': float(self.penalty_var.get()),
             'avg_overlap_max': float(self.avg_overlap_var.get()),
             'prefer_qb_wr_stack': preset.get('prefer_qb_wr_stack', False),
+            'solver': self.solver_var.get(),
+            'time_limit': float(self.time_limit_var.get()) or None,
+            'threads': int(self.threads_var.get()) or None,
+            'mip_gap': float(self.mip_gap_var.get()) or None,
         }
         opts.update({k: v for k, v in preset.items() if v is not None})
 
         self.output.delete('1.0', tk.END)
+        self.last_lineups = []
+        self.pool = None
+        self.progress.configure(maximum=max(opts['n'], 1), value=0)
+        self.status_var.set('Reading CSV...')
+        self.generate_button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+
+        # Fresh queue and flag per run so a finished worker cannot leak into the next one
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = threading.Thread(
+            target=_generate_worker,
+            args=(csv_path, opts, self.results, self.cancel_event, self.result_cache if self.cache_var.get() else None, self.preset_var.get()),
+            daemon=True,
+        )
+        self.worker.start()
+        self.root.after(POLL_MS, self._poll_worker)
+
+    def on_cancel(self):
+        self.cancel_event.set()
+        self.cancel_button.configure(state=tk.DISABLED)
+        self.status_var.set('Cancelling after the current solve...')
+
+    def _poll_worker(self):
+        """Drain the worker queue on the Tk loop and reschedule until the worker is done."""
+        total = int(self.progress['maximum'])
+        while True:
+            try:
+                kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'parsed':
+                self.status_var.set(f'Solving ({payload} players)...')
+            elif kind == 'lineup':
+                self.last_lineups.append(payload)
+                self.output.insert(tk.END, format_lineup(len(self.last_lineups), payload) + "\n")
+                self.output.see(tk.END)
+                self.progress.configure(value=len(self.last_lineups))
+                self.status_var.set(f'Solved {len(self.last_lineups)} of {total}')
+            elif kind == 'done':
+                verb = 'Cancelled' if payload else 'Done'
+                self.status_var.set(f'{verb}: {len(self.last_lineups)} lineups')
+                self._finish()
+                return
+            elif kind == 'error':
+                self.status_var.set('')
+                self._finish()
+                messagebox.showerror('Error', payload)
+                return
+        self.root.after(POLL_MS, self._poll_worker)
+
+    def _finish(self):
+        self.worker = None
+        self.generate_button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+
+    def on_open_pool(self):
+        if self.worker is not None and self.worker.is_alive():
+            return
+        path = filedialog.askopenfilename(title='Open lineup pool', filetypes=[('Lineup pool', '*.dkpool'), ('All files', '*.*')])
+        if not path:
+            return
         try:
-            lineups = generate_n_lineups(
-                players,
-                n=opts['n'],
-                overlap_max=opts.get('overlap_max'),
-                team_max=opts.get('team_max'),
-                prefer_qb_wr_stack=opts.get('prefer_qb_wr_stack', False),
-                stack_penalty=opts.get('stack_penalty', 0.0),
-                avg_overlap_max=opts.get('avg_overlap_max'),
-            )
-        except Exception as e:
-            messagebox.showerror('Error', f'Error generating lineups: {e}')
+            pool = open_pool(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror('Open pool', str(e))
             return
+        self.pool = pool
+        self.last_lineups = []
+        self.output.delete('1.0', tk.END)
+        for i, lineup in enumerate(pool.lineups(0, POOL_PREVIEW).to_dicts(), start=1):
+            self.output.insert(tk.END, format_lineup(i, lineup) + "\n")
+        shown = min(len(pool), POOL_PREVIEW)
+        self.status_var.set(f'{len(pool)} lineups in {path} (showing {shown})')
 
-        self.last_lineups = lineups
-        for i, lu in enumerate(lineups, start=1):
-            self.output.insert(tk.END, f"Lineup {i}: proj={lineup_proj(lu):.2f} salary={lineup_salary(lu)}\n")
-            for p in sorted(lu.values(), key=lambda x: x.position):
-                self.output.insert(tk.END, f"  {p.position} - {p.name} ({p.team}) ${p.salary} proj:{p.proj}\n")
-            self.output.insert(tk.END, "\n")
+    def _export_chunks(self):
+        """What Export writes: the opened pool in chunks, or the generated lineups."""
+        if self.pool is not None:
+            return self.pool.slate, self.pool.chunks()
+        players = {pid: p for lu in self.last_lineups for pid, p in lu.items()}
+        array = LineupArray.from_dicts(compile_slate(list(players.values())), self.last_lineups)
+        return array.slate, [array]
 
     def on_export(self):
-        if not self.last_lineups:
+        if not self.last_lineups and self.pool is None:
             messagebox.showinfo('No lineups', 'No lineups to export; generate first')
             return
-        path = filedialog.asksaveasfilename(defaultextension='.txt', filetypes=[('Text files', '*.txt'), ('CSV', '*.csv')])
+        path = filedialog.asksaveasfilename(defaultextension='.txt', filetypes=[
+            ('Text files', '*.txt'), ('DraftKings upload CSV', '*.csv'), ('Lineup pool', '*.dkpool'),
+        ])
         if not path:
             return
-        with open(path, 'w', encoding='utf-8') as f:
-            for i, lu in enumerate(self.last_lineups, start=1):
-                f.write(f"Lineup {i}: proj={lineup_proj(lu):.2f} salary={lineup_salary(lu)}\n")
-                for p in sorted(lu.values(), key=lambda x: x.position):
-                    f.write(f"  {p.position} - {p.name} ({p.team}) ${p.salary} proj:{p.proj}\n")
-                f.write('\n')
+        slate, chunks = self._export_chunks()
+        if path.lower().endswith('.dkpool'):
+            with PoolWriter(path, slate) as writer:
+                for chunk in chunks:
+                    writer.write(chunk)
+        elif path.lower().endswith('.csv'):
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                write_dk_csv(f, chunks)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                start = 1
+                for chunk in chunks:
+                    write_lineups(chunk.to_dicts(), f, start=start)
+                    start += len(chunk)
         messagebox.showinfo('Exported', f'Exported to {path}')
 
     def run(self):
@@ -0,0 +1,157 @@
+"""Late swap: re-optimize existing lineups once some games have started.
+
+Players in started games are locked: a lineup keeps the ones it has and can
+not add others. Only the open slots of each lineup are re-solved, against a
+reduced model of the players that can still be added (after dominance
+pruning for a single lineup) plus that lineup's locked players, whose
+variables are fixed to 1. Salary cap, ``team_max`` and the roster rules are
+the optimizer's own model, so locked players count against them.
+
+Lineups are independent, so they are spread over a process pool; the pool
+of open players is handed to each worker once, through the initializer.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pulp import LpSolutionInfeasible, LpSolutionIntegerFeasible, LpSolutionOptimal, LpStatus
+
+from .models import Player
+from .optimizer import _build_model, _emit
+from .pruning import prune_players
+from .roster import DK_SALARY_CAP, TOTAL_REQUIRED
+from .slate import compile_slate
+from .solvers import make_solver
+
+# Per-process state set by _init_worker: the open player pool and the solve options
+_pool: Dict[str, Player] = {}
+_options: dict = {}
+
+
+def _init_worker(pool: Dict[str, Player], options: dict):
+    global _pool, _options
+    _pool = pool
+    _options = options
+
+
+def _swap_one(job: Tuple[int, List[Player], List[Player]]) -> Tuple[int, List[str], dict]:
+    """Re-solve one lineup's open slots; returns its index, player ids and event.
+
+    ``job`` is (index, locked players of the lineup, open players it had).
+    A lineup that cannot be completed keeps its original players.
+    """
+    index, fixed, current = job
+    start = time.perf_counter()
+    event = {'iteration': index, 'engine': 'milp', 'build_s': 0.0, 'solve_s': 0.0, 'extract_s': 0.0,
+             'constraints': 0, 'variables': 0, 'objective': None, 'proven': True, 'locked': len(fixed), 'swapped': 0}
+    original = [p.id for p in fixed + current]
+    original_set = set(original)
+    if len(fixed) == TOTAL_REQUIRED:
+        event['status'] = 'Locked'
+        return index, original, event
+
+    # The lineup's own open players stay candidates so it can warm-start from them
+    candidates = dict(_pool)
+    candidates.update((p.id, p) for p in current if p.id in _options['available'])
+    slate = compile_slate(fixed + list(candidates.values()))
+    prob, x = _build_model(slate, _options['salary_cap'], _options['team_max'], _options['stack_penalty'], name=f"late_swap_{index}")
+    for p in fixed:
+        x[slate.index[p.id]].lowBound = 1
+    warm_start = all(p.id in candidates for p in current)
+    if warm_start:
+        for i, var in enumerate(x):
+            var.setInitialValue(1 if slate.ids[i] in original_set else 0)
+
+    built = time.perf_counter()
+    prob.solve(make_solver(_options['solver'], _options['time_limit'], _options['threads'], _options['mip_gap'], warm_start=warm_start))
+    solved = time.perf_counter()
+
+    feasible = prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible)
+    chosen = [slate.ids[i] for i, var in enumerate(x) if (var.varValue or 0) > 0.5] if feasible else []
+    event.update(
+        build_s=built - start,
+        solve_s=solved - built,
+        extract_s=time.perf_counter() - solved,
+        constraints=len(prob.constraints),
+        variables=prob.numVariables(),
+        status=LpStatus[prob.status],
+        proven=prob.sol_status in (LpSolutionOptimal, LpSolutionInfeasible),
+        objective=prob.objective.value() if feasible else None,
+    )
+    if not chosen:
+        return index, original, event
+    event['swapped'] = len(set(chosen) - original_set)
+    return index, chosen, event
+
+
+def late_swap(
+    lineups: Sequence[Iterable[str]],
+    players: List[Player],
+    locked: Iterable[str] = (),
+    unavailable: Iterable[str] = (),
+    salary_cap: int = DK_SALARY_CAP,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    workers: int = 1,
+    prune: bool = True,
+    solver: str = 'cbc',
+    time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    on_iteration: Optional[Callable[[dict], None]] = None,
+) -> List[Dict[str, Player]]:
+    """Re-optimize the open slots of each lineup, in input order.
+
+    ``lineups`` are lineup dicts or lists of player ids; ``players`` is the
+    current slate (its projections are used). ``locked`` ids are players in
+    games that have started and ``unavailable`` ids (injured, inactive) can
+    no longer be added; a locked player stays in every lineup that already
+    has them.
+
+    ``on_iteration`` gets one event per lineup, shaped like the optimizer's
+    (``iteration`` is the lineup's index) plus ``locked`` and ``swapped``
+    counts. ``status`` is 'Locked' for lineups with no open slot. A lineup
+    whose open slots cannot be filled keeps its players and reports the
+    solver status.
+    """
+    by_id = {p.id: p for p in players}
+    locked = set(locked)
+    unavailable = set(unavailable) - locked
+    open_players = [p for p in players if p.id not in locked and p.id not in unavailable]
+    pool = prune_players(open_players, 1, team_max, stack_penalty) if prune and open_players else open_players
+
+    jobs = []
+    for index, lineup in enumerate(lineups):
+        ids = list(lineup)
+        missing = [pid for pid in ids if pid not in by_id]
+        if missing:
+            raise ValueError(f"Lineup {index + 1} has players that are not on the slate: {', '.join(missing)}")
+        fixed = [by_id[pid] for pid in ids if pid in locked]
+        current = [by_id[pid] for pid in ids if pid not in locked]
+        jobs.append((index, fixed, current))
+
+    options = {
+        'salary_cap': salary_cap,
+        'team_max': team_max,
+        'stack_penalty': stack_penalty,
+        'solver': solver,
+        'time_limit': time_limit,
+        'threads': threads,
+        'mip_gap': mip_gap,
+        'available': {p.id for p in open_players},
+    }
+    initargs = ({p.id: p for p in pool}, options)
+    if workers <= 1:
+        _init_worker(*initargs)
+        return _collect(map(_swap_one, jobs), len(jobs), by_id, on_iteration)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        chunksize = max(1, len(jobs) // (4 * workers))
+        return _collect(executor.map(_swap_one, jobs, chunksize=chunksize), len(jobs), by_id, on_iteration)
+
+
+def _collect(results, count: int, by_id: Dict[str, Player], on_iteration) -> List[Dict[str, Player]]:
+    swapped: List[Optional[Dict[str, Player]]] = [None] * count
+    for index, ids, event in results:
+        _emit(on_iteration, event)
+        swapped[index] = {pid: by_id[pid] for pid in ids}
+    return swapped
@@ -0,0 +1,102 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Player
+from .roster import TOTAL_REQUIRED
+from .slate import CompiledSlate
+
+
+def index_dtype(slate: CompiledSlate) -> np.dtype:
+    """Smallest index dtype for ``slate``: uint16 up to 65535 players."""
+    return np.dtype(np.uint16 if len(slate) <= np.iinfo(np.uint16).max else np.int32)
+
+
+class LineupArray:
+    """Many lineups as one ``(k, 9)`` array of slate row indices.
+
+    Each row is sorted, so equal lineups have equal rows. Salary, projection
+    and overlap are computed with NumPy over the whole array; nothing per
+    lineup lives on the Python heap. The index dtype is uint16 for slates of
+    up to 65535 players, so a lineup costs 18 bytes instead of a dict plus a
+    set of id strings.
+    """
+
+    def __init__(self, slate: CompiledSlate, rows: np.ndarray, presorted: bool = False):
+        self.slate = slate
+        rows = np.asarray(rows).reshape(-1, TOTAL_REQUIRED)
+        if presorted:
+            # Already sorted rows of the right dtype (e.g. mapped from a pool file) are kept without a copy
+            self.rows = rows
+        else:
+            self.rows = np.sort(rows, axis=1).astype(index_dtype(slate), copy=False)
+
+    @classmethod
+    def from_indices(cls, slate: CompiledSlate, lineups: Iterable[Sequence[int]]) -> 'LineupArray':
+        flat = np.fromiter((i for lineup in lineups for i in lineup), dtype=np.int64)
+        return cls(slate, flat)
+
+    @classmethod
+    def from_dicts(cls, slate: CompiledSlate, lineups: Iterable[Dict[str, Player]]) -> 'LineupArray':
+        index = slate.index
+        return cls.from_indices(slate, ([index[pid] for pid in lineup] for lineup in lineups))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, i: int) -> Tuple[int, ...]:
+        return tuple(self.rows[i].tolist())
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        for row in self.rows.tolist():
+            yield tuple(row)
+
+    @property
+    def nbytes(self) -> int:
+        return self.rows.nbytes
+
+    def salary(self) -> np.ndarray:
+        return self.slate.salary[self.rows].sum(axis=1)
+
+    def proj(self) -> np.ndarray:
+        return self.slate.proj[self.rows].sum(axis=1)
+
+    def overlap(self, lineup: Sequence[int]) -> np.ndarray:
+        """Players each lineup shares with ``lineup`` (slate indices)."""
+        member = np.zeros(len(self.slate), dtype=np.int8)
+        member[np.asarray(lineup, dtype=np.int64)] = 1
+        return member[self.rows].sum(axis=1, dtype=np.int64)
+
+    def to_dict(self, i: int) -> Dict[str, Player]:
+        players, ids = self.slate.players, self.slate.ids
+        return {ids[j]: players[j] for j in self.rows[i].tolist()}
+
+    def to_dicts(self) -> List[Dict[str, Player]]:
+        return [self.to_dict(i) for i in range(len(self))]
+
+
+def overlap_report(lineups: LineupArray, overlap_max: Optional[int] = None, avg_overlap_max: Optional[float] = None) -> dict:
+    """How close a lineup set comes to its overlap targets.
+
+    Each lineup is compared with the ones before it, the way the optimizer
+    applies ``overlap_max`` (shared players with any earlier lineup) and
+    ``avg_overlap_max`` (mean shared players over all earlier lineups).
+    ``*_excess`` is how far the worst lineup is over the target (0 when met).
+    """
+    max_overlap = 0
+    pairs_over = 0
+    max_avg = 0.0
+    for k in range(1, len(lineups)):
+        shared = lineups.overlap(lineups.rows[k])[:k]
+        max_overlap = max(max_overlap, int(shared.max()))
+        max_avg = max(max_avg, float(shared.mean()))
+        if overlap_max is not None:
+            pairs_over += int((shared > overlap_max).sum())
+    return {
+        'lineups': len(lineups),
+        'max_overlap': max_overlap,
+        'pairs_over': pairs_over,
+        'overlap_excess': max(0, max_overlap - overlap_max) if overlap_max is not None else 0,
+        'max_avg_overlap': max_avg,
+        'avg_overlap_excess': max(0.0, max_avg - avg_overlap_max) if avg_overlap_max is not None else 0.0,
+    }
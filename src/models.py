@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+# Slotted: no per-instance __dict__, which matters once slates and lineup pools get large
+@dataclass(slots=True)
 class Player:
     id: str
     name: str
@@ -1,23 +1,34 @@
-from typing import List, Dict, Tuple, Optional
-from pulp import LpProblem, LpMaximize, LpVariable, lpSum, LpBinary, PULP_CBC_CMD
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Sequence, Tuple, Optional, Union
+
+import numpy as np
+
+from .enumerator import iter_top_k_lineups
+from .lineups import LineupArray
 from .models import Player
+from .roster import DK_SALARY_CAP, ROSTER_REQUIREMENTS, FLEX_ELIGIBLE, TOTAL_REQUIRED
+from .pruning import prune_players
+from .slate import POSITION_CODES, CompiledSlate, compile_slate
+from .solvers import make_solver
 
+# PuLP is imported by the functions that build or solve models, so native
+# engine runs and commands that never solve do not pay for it
+if TYPE_CHECKING:
+    from pulp import LpAffineExpression, LpProblem, LpVariable
 
-DK_SALARY_CAP = 50000
-ROSTER_REQUIREMENTS = {
-    'QB': 1,
-    'RB': 2,
-    'WR': 3,
-    'TE': 1,
-    'FLEX': 1,  # FLEX can be RB/WR/TE
-    'DST': 1,
-}
+# 'milp' solves the integer program with CBC; 'native' runs the in-process
+# branch-and-bound enumerator
+ENGINES = ('milp', 'native')
 
-FLEX_ELIGIBLE = {'RB', 'WR', 'TE'}
+# 'cuts' adds rows against every earlier lineup; 'exposure' keeps the model
+# size fixed (see iter_lineups)
+DIVERSITY_MODES = ('cuts', 'exposure')
 
+# Re-solves per lineup in exposure mode before the least-overlapping candidate is taken
+MAX_REPAIRS = 6
 
-def _build_player_map(players: List[Player]) -> Dict[str, Player]:
-    return {p.id: p for p in players}
+logger = logging.getLogger(__name__)
 
 
 def _validate_players(players: List[Player]):
@@ -25,8 +36,139 @@ def _validate_players(players: List[Player]):
         raise ValueError("No players provided")
 
 
-def generate_n_lineups(
-    players: List[Player],
+def _row(xs: np.ndarray, idx: np.ndarray, coefs: Optional[np.ndarray] = None) -> 'LpAffineExpression':
+    """Linear expression over the variables at ``idx`` (unit coefficients unless given)."""
+    from pulp import LpAffineExpression
+
+    if coefs is None:
+        return LpAffineExpression(dict.fromkeys(xs[idx].tolist(), 1))
+    return LpAffineExpression(list(zip(xs[idx].tolist(), coefs[idx].tolist())))
+
+
+def _build_model(
+    slate: CompiledSlate,
+    salary_cap: int,
+    team_max: Optional[int],
+    stack_penalty: float,
+    name: str = 'dk_opt',
+    proj: Optional[np.ndarray] = None,
+) -> Tuple['LpProblem', List['LpVariable']]:
+    """Build the base lineup model (everything except the cuts against previous lineups).
+
+    Every row is taken from the slate's precomputed index groups, so the build
+    is linear in the number of players. ``proj`` replaces the slate's
+    projections in the objective.
+    """
+    from pulp import LpBinary, LpMaximize, LpProblem, LpVariable, lpSum
+
+    prob = LpProblem(name, LpMaximize)
+    everyone = np.arange(len(slate))
+    xs = np.empty(len(slate), dtype=object)
+    xs[:] = [LpVariable(f"x_{i}", cat=LpBinary) for i in everyone]
+
+    # Soft QB-WR stack helpers, only needed for teams that have a QB
+    stack_teams = [t for t in slate.teams if len(slate.team_position(t, 'QB'))]
+    s_stack = {t: LpVariable(f"s_stack_{t}", cat=LpBinary) for t in stack_teams}
+
+    # Objective: maximize projected points minus stacking penalties
+    prob += _row(xs, everyone, slate.proj if proj is None else proj) - stack_penalty * lpSum(s_stack.values())
+
+    # Salary cap
+    prob += _row(xs, everyone, slate.salary) <= salary_cap
+
+    # Position constraints (explicit flex assignment)
+    # QB and DST (the slate codes DST from is_dst to be robust to position naming)
+    prob += _row(xs, slate.position('QB')) == ROSTER_REQUIREMENTS['QB']
+    prob += _row(xs, slate.position('DST')) == ROSTER_REQUIREMENTS['DST']
+
+    # Create flex-type binary vars: which position supplies the FLEX (RB/WR/TE)
+    z_flex = {pos: LpVariable(f"z_flex_{pos.lower()}", cat=LpBinary) for pos in ('RB', 'WR', 'TE')}
+    # Exactly one of these equals the FLEX requirement (usually 1)
+    prob += lpSum(z_flex.values()) == ROSTER_REQUIREMENTS['FLEX']
+
+    # Enforce exact counts for RB/WR/TE including the flex slot when assigned
+    for pos, z in z_flex.items():
+        prob += _row(xs, slate.position(pos)) == ROSTER_REQUIREMENTS[pos] + z
+
+    # Total players must equal roster size (defensive count uses is_dst above)
+    prob += _row(xs, everyone) == TOTAL_REQUIRED
+
+    # Team stacking / exposure constraints
+    if team_max is not None:
+        for idx in slate.by_team.values():
+            if len(idx) > team_max:
+                prob += _row(xs, idx) <= team_max
+
+    # Soft QB-WR stack handling: s_stack[t] is forced on when the QB of t is
+    # picked without any WR of t (z_wr[t] covers "some WR of t is picked")
+    for t in stack_teams:
+        qbs = _row(xs, slate.team_position(t, 'QB'))
+        wr_idx = slate.team_position(t, 'WR')
+        if len(wr_idx):
+            z_wr = LpVariable(f"z_wr_{t}", cat=LpBinary)
+            for var in xs[wr_idx]:
+                prob += z_wr >= var
+            prob += z_wr <= _row(xs, wr_idx)
+            prob += s_stack[t] >= qbs - z_wr
+        else:
+            prob += s_stack[t] >= qbs
+        prob += s_stack[t] <= qbs
+
+    # Selection variables are indexed like the slate rows
+    return prob, xs.tolist()
+
+
+def _add_lineup_cuts(
+    prob: 'LpProblem',
+    x: List['LpVariable'],
+    used: Tuple[int, ...],
+    index: int,
+    overlap_max: Optional[int],
+    overlap_totals: Optional[List['LpVariable']],
+):
+    """Append the rows that separate the next lineup from a previously found one.
+
+    Only rows are added, so the same model can be re-solved after each lineup.
+    When ``overlap_totals`` is given, a running total of the overlap with every
+    earlier lineup is chained on so the average-overlap limit can be tightened
+    by moving a variable bound instead of rewriting a dense row.
+    """
+    from pulp import LpContinuous, LpVariable, lpSum
+
+    shared = lpSum([x[i] for i in used])
+
+    # Exclude previously found exact lineups (force at least one different player)
+    prob += shared <= TOTAL_REQUIRED - 1
+
+    # Overlap constraint vs previous lineups: limit number of shared players
+    if overlap_max is not None:
+        prob += shared <= overlap_max
+
+    if overlap_totals is not None:
+        total = LpVariable(f"overlap_total_{index}", lowBound=0, cat=LpContinuous)
+        previous = overlap_totals[-1] if overlap_totals else 0
+        prob += total == previous + shared
+        overlap_totals.append(total)
+
+
+def _set_avg_overlap_bound(overlap_totals: List['LpVariable'], avg_overlap_max: float):
+    """Average pairwise overlap: only the newest running total carries the bound."""
+    for total in overlap_totals[:-1]:
+        total.upBound = None
+    overlap_totals[-1].upBound = avg_overlap_max * len(overlap_totals)
+
+
+def exposure_breaks_pruning(engine: str, diversity: str, max_exposure: Optional[float], exposure_penalty: float) -> bool:
+    """Whether exposure options change the objective or bounds pruning relies on.
+
+    Capped players and penalised projections both break the raw-projection
+    dominance argument of ``pruning.prune_players``.
+    """
+    return engine == 'milp' and diversity == 'exposure' and (max_exposure is not None or exposure_penalty > 0)
+
+
+def iter_lineups(
+    players: Union[List[Player], CompiledSlate],
     n: int = 5,
     salary_cap: int = DK_SALARY_CAP,
     overlap_max: Optional[int] = None,
@@ -34,117 +176,448 @@ def generate_n_lineups(
     prefer_qb_wr_stack: bool = False,
     stack_penalty: float = 0.0,
     avg_overlap_max: Optional[float] = None,
-) -> List[Dict[str, Player]]:
-    """Generate n lineups sequentially using integer programming.
-
-    Strategy: solve for best lineup, then add a cut constraint forbidding that exact lineup (force selection sum <= 8) to get a different lineup, repeat.
+    incremental: bool = False,
+    prune: bool = True,
+    engine: str = 'milp',
+    solver: str = 'cbc',
+    time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    on_iteration: Optional[Callable[[dict], None]] = None,
+    time_budget: Optional[float] = None,
+    warm_start: Optional[Sequence[Sequence[str]]] = None,
+    diversity: str = 'cuts',
+    max_exposure: Optional[float] = None,
+    exposure_penalty: float = 0.0,
+    previous: Optional[Sequence[Sequence[str]]] = None,
+) -> Iterator[Tuple[Dict[str, Player], Optional[dict]]]:
+    """Yield ``(lineup, stats)`` for each lineup as soon as it is solved.
+
+    Takes the same options as ``generate_n_lineups``; ``stats`` is the
+    iteration event described there. Events are only built when someone
+    listens (``on_iteration`` is set or DEBUG logging is on); otherwise
+    ``stats`` is None. Stopping the iteration early keeps every lineup
+    already yielded.
+
+    ``time_budget`` is a wall-clock limit in seconds for the whole run: no new
+    solve starts once it is spent, and each MILP solve gets at most the time
+    that is left. The native engine checks it between lineups.
+
+    ``warm_start`` takes earlier lineups (lists of player ids), for example a
+    previous run on the same slate before a few projections changed. They are
+    re-scored on the current projections and, before every MILP solve, the
+    best one that still satisfies the cuts so far is handed to the solver as
+    its starting incumbent. Only the CBC backend accepts a starting
+    incumbent; HiGHS and the native engine ignore it.
+
+    ``diversity='exposure'`` solves every MILP lineup on a model of the same
+    size instead of adding rows per earlier lineup:
+
+    - ``max_exposure`` (a fraction of ``n``) caps how many lineups a player
+      can appear in; capped players get an upper bound of 0.
+    - ``exposure_penalty`` is subtracted from a player's projection for each
+      earlier lineup they are in.
+    - ``avg_overlap_max`` becomes one row whose coefficients are the
+      exposure counts. It is the same limit as the chained rows of the
+      'cuts' mode.
+    - Duplicates and ``overlap_max`` are checked after each solve. A
+      lineup that breaks them is re-solved with its most used shared
+      players banned, up to ``MAX_REPAIRS`` times. After that, the
+      candidate with the least overlap is kept, so the limit can be missed.
+      Each event then carries ``max_overlap`` (against earlier lineups)
+      and ``repairs``. See ``lineups.overlap_report`` for the whole set.
+
+    Pruning is skipped when ``max_exposure`` or ``exposure_penalty`` is set
+    since capped or penalised players break its dominance argument. The native engine ignores ``diversity``.
+    ``previous`` takes lineups (lists of player ids) that count as already
+    found: the run continues the chain after them, so new lineups differ
+    from them and keep ``overlap_max`` and ``avg_overlap_max`` against them.
+    They are not yielded. Only the MILP engine's 'cuts' mode supports it.
     """
-    _validate_players(players)
-    player_map = _build_player_map(players)
-    lineups: List[Dict[str, Player]] = []
-    used_lineups: List[set] = []  # store sets of player ids for exclusion
-
-    # Precompute roster size
-    total_required = (
-        ROSTER_REQUIREMENTS['QB']
-        + ROSTER_REQUIREMENTS['RB']
-        + ROSTER_REQUIREMENTS['WR']
-        + ROSTER_REQUIREMENTS['TE']
-        + ROSTER_REQUIREMENTS['FLEX']
-        + ROSTER_REQUIREMENTS['DST']
-    )
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    if diversity not in DIVERSITY_MODES:
+        raise ValueError(f"Unknown diversity mode {diversity!r}; expected one of {DIVERSITY_MODES}")
+    if previous and (engine != 'milp' or diversity != 'cuts'):
+        raise ValueError("previous lineups need engine='milp' and diversity='cuts'")
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    listening = _listening(on_iteration)
+    slate = compile_slate(players)
+    _validate_players(slate.players)
+    if prune and not exposure_breaks_pruning(engine, diversity, max_exposure, exposure_penalty):
+        # Earlier lineups may hold the dominating players, so they count towards n
+        kept = prune_players(slate, n + len(previous or ()), team_max, stack_penalty, overlap_max, avg_overlap_max)
+        if len(kept) < len(slate):
+            slate = compile_slate(kept)
+    if engine == 'native':
+        found = iter_top_k_lineups(slate, n, salary_cap, team_max, stack_penalty, overlap_max, avg_overlap_max)
+        for iteration in range(n):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            start = time.perf_counter()
+            objective, idx = next(found, (None, None))
+            solved = time.perf_counter()
+            lineup = {slate.ids[i]: slate.players[i] for i in idx} if idx is not None else None
+            event = None
+            if listening:
+                event = {
+                    'iteration': iteration,
+                    'engine': engine,
+                    'build_s': 0.0,
+                    'solve_s': solved - start,
+                    'extract_s': time.perf_counter() - solved,
+                    'constraints': 0,
+                    'variables': len(slate),
+                    'status': 'Optimal' if lineup else 'Infeasible',
+                    'proven': True,
+                    'objective': objective,
+                }
+                _emit(on_iteration, event)
+            if lineup is None:
+                break
+            yield lineup, event
+        return
+
+    from pulp import LpSolutionInfeasible, LpSolutionIntegerFeasible, LpSolutionOptimal, LpStatus
+
+    hints = _rescore_lineups(slate, warm_start, stack_penalty) if warm_start else []
+    if diversity == 'exposure':
+        yield from _iter_exposure_lineups(
+            slate, n, salary_cap, overlap_max, team_max, stack_penalty, avg_overlap_max, max_exposure,
+            exposure_penalty, solver, time_limit, threads, mip_gap, on_iteration, deadline, hints,
+        )
+        return
+
+    used_lineups: List[Tuple[int, ...]] = []  # slate indices of each lineup found, for the cuts
+    for ids in previous or ():
+        # Players pruned from the slate can not be picked again, so they drop out of the cuts
+        used = tuple(sorted(slate.index[pid] for pid in ids if pid in slate.index))
+        if used:
+            used_lineups.append(used)
+
+    prob = x = overlap_totals = None
+    for iteration in range(n):
+        limit = time_limit
+        if deadline is not None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            limit = remaining if limit is None else min(limit, remaining)
+        start = time.perf_counter()
+        if incremental and prob is not None:
+            # The previous incumbent is cut off by these rows, so it is no use as a MIP start
+            _add_lineup_cuts(prob, x, used_lineups[-1], len(used_lineups) - 1, overlap_max, overlap_totals)
+        else:
+            prob, x = _build_model(slate, salary_cap, team_max, stack_penalty, name=f"dk_opt_{iteration}")
+            overlap_totals = [] if avg_overlap_max is not None else None
+            for i, used in enumerate(used_lineups):
+                _add_lineup_cuts(prob, x, used, i, overlap_max, overlap_totals)
+
+        if overlap_totals:
+            _set_avg_overlap_bound(overlap_totals, avg_overlap_max)
+
+        hint = _pick_hint(slate, hints, used_lineups, salary_cap, team_max, overlap_max)
+        if hint is not None:
+            chosen_hint = set(hint)
+            for i, var in enumerate(x):
+                var.setInitialValue(1 if i in chosen_hint else 0)
+
+        # Solve
+        built = time.perf_counter()
+        prob.solve(make_solver(solver, limit, threads, mip_gap, warm_start=hint is not None))
+        solved = time.perf_counter()
+
+        # Check feasibility (an integer-feasible incumbent from a time-limited solve counts)
+        feasible = prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible)
+        # varValue is the raw attribute value() wraps; None when the solver set nothing
+        chosen = [i for i, var in enumerate(x) if (var.varValue or 0) > 0.5] if feasible else []
+        event = None
+        if listening:
+            event = {
+                'iteration': iteration,
+                'engine': engine,
+                'build_s': built - start,
+                'solve_s': solved - built,
+                'extract_s': time.perf_counter() - solved,
+                'constraints': len(prob.constraints),
+                'variables': prob.numVariables(),
+                'status': LpStatus[prob.status],
+                'proven': prob.sol_status in (LpSolutionOptimal, LpSolutionInfeasible),
+                'objective': prob.objective.value() if feasible else None,
+            }
+            _emit(on_iteration, event)
+        if not chosen:
+            break
+
+        used_lineups.append(tuple(chosen))
+        yield {slate.ids[i]: slate.players[i] for i in chosen}, event
+
+
+def _iter_exposure_lineups(
+    slate: CompiledSlate,
+    n: int,
+    salary_cap: int,
+    overlap_max: Optional[int],
+    team_max: Optional[int],
+    stack_penalty: float,
+    avg_overlap_max: Optional[float],
+    max_exposure: Optional[float],
+    exposure_penalty: float,
+    solver: str,
+    time_limit: Optional[float],
+    threads: Optional[int],
+    mip_gap: Optional[float],
+    on_iteration: Optional[Callable[[dict], None]],
+    deadline: Optional[float],
+    hints: List[Tuple[int, ...]],
+) -> Iterator[Tuple[Dict[str, Player], dict]]:
+    """The 'exposure' diversity mode of ``iter_lineups``: every solve sees a model of the same size."""
+    from pulp import LpSolutionInfeasible, LpSolutionIntegerFeasible, LpSolutionOptimal, LpStatus
+
+    counts = np.zeros(len(slate), dtype=np.int64)  # lineups each player is in so far
+    cap = max(1, int(np.ceil(max_exposure * n))) if max_exposure is not None else None
+    listening = _listening(on_iteration)
+    target = TOTAL_REQUIRED - 1 if overlap_max is None else min(overlap_max, TOTAL_REQUIRED - 1)
+    used: List[Tuple[int, ...]] = []
+    found = LineupArray(slate, np.empty((0, TOTAL_REQUIRED), dtype=np.int64))
 
     for iteration in range(n):
-        prob = LpProblem(f"dk_opt_{iteration}", LpMaximize)
-        x = {p.id: LpVariable(f"x_{p.id}", cat=LpBinary) for p in players}
-
-        # Teams and helper binary vars
-        teams = sorted({p.team for p in players if p.team})
-        z_wr = {t: LpVariable(f"z_wr_{t}", cat=LpBinary) for t in teams}
-        s_stack = {t: LpVariable(f"s_stack_{t}", cat=LpBinary) for t in teams}
-
-        # Objective: maximize projected points minus stacking penalties
-        prob += lpSum([p.proj * x[p.id] for p in players]) - stack_penalty * lpSum([s_stack[t] for t in teams])
-
-        # Salary cap
-        prob += lpSum([p.salary * x[p.id] for p in players]) <= salary_cap
-
-        # Position constraints (explicit flex assignment)
-        # QB and DST (use is_dst to be robust to position naming)
-        prob += lpSum([x[p.id] for p in players if p.position == 'QB']) == ROSTER_REQUIREMENTS['QB']
-        prob += lpSum([x[p.id] for p in players if getattr(p, 'is_dst', False)]) == ROSTER_REQUIREMENTS['DST']
-
-        # Create flex-type binary vars: which position supplies the FLEX (RB/WR/TE)
-        z_flex_rb = LpVariable('z_flex_rb', cat=LpBinary)
-        z_flex_wr = LpVariable('z_flex_wr', cat=LpBinary)
-        z_flex_te = LpVariable('z_flex_te', cat=LpBinary)
-        # Exactly one of these equals the FLEX requirement (usually 1)
-        prob += z_flex_rb + z_flex_wr + z_flex_te == ROSTER_REQUIREMENTS['FLEX']
-
-        # Enforce exact counts for RB/WR/TE including the flex slot when assigned
-        prob += lpSum([x[p.id] for p in players if p.position == 'RB']) == ROSTER_REQUIREMENTS['RB'] + z_flex_rb
-        prob += lpSum([x[p.id] for p in players if p.position == 'WR']) == ROSTER_REQUIREMENTS['WR'] + z_flex_wr
-        prob += lpSum([x[p.id] for p in players if p.position == 'TE']) == ROSTER_REQUIREMENTS['TE'] + z_flex_te
-
-        # Total players must equal roster size (defensive count uses is_dst above)
-        prob += lpSum([x[p.id] for p in players]) == total_required
-
-        # Team stacking / exposure constraints
-        if team_max is not None:
-            for t in teams:
-                prob += lpSum([x[p.id] for p in players if p.team == t]) <= team_max
-
-        # Soft QB-WR stack handling: define z_wr and s_stack relations
-        for t in teams:
-            wr_ids = [p.id for p in players if p.team == t and p.position == 'WR']
-            if wr_ids:
-                for pid in wr_ids:
-                    prob += z_wr[t] >= x[pid]
-                prob += z_wr[t] <= lpSum([x[pid] for pid in wr_ids])
+        banned = set() if cap is None else set(np.flatnonzero(counts >= cap).tolist())
+        proj = slate.proj - exposure_penalty * counts if exposure_penalty else None
+        best = None  # (max overlap, lineup, objective, status, proven) of the least overlapping candidate
+        build_s = solve_s = extract_s = 0.0
+        repairs = 0
+        prob = None
+        candidates: List[int] = []
+        required = set()
+        last_ban = None
+        while True:
+            limit = time_limit
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                limit = remaining if limit is None else min(limit, remaining)
+            start = time.perf_counter()
+            prob, x = _build_model(slate, salary_cap, team_max, stack_penalty, name=f"dk_opt_{iteration}", proj=proj)
+            if avg_overlap_max is not None and used:
+                # Overlap of the new lineup with every earlier one, summed, is its exposure-weighted size
+                xs = np.empty(len(x), dtype=object)
+                xs[:] = x
+                prob += _row(xs, np.flatnonzero(counts), counts) <= avg_overlap_max * len(used)
+            for i in banned:
+                x[i].upBound = 0
+            hint = _pick_hint(slate, hints, used, salary_cap, team_max, overlap_max) if repairs == 0 else None
+            if hint is not None and banned.isdisjoint(hint):
+                chosen_hint = set(hint)
+                for i, var in enumerate(x):
+                    var.setInitialValue(1 if i in chosen_hint else 0)
             else:
-                prob += z_wr[t] == 0
+                hint = None
+
+            built = time.perf_counter()
+            prob.solve(make_solver(solver, limit, threads, mip_gap, warm_start=hint is not None))
+            solved = time.perf_counter()
+
+            feasible = prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible)
+            chosen = tuple(i for i, var in enumerate(x) if (var.varValue or 0) > 0.5) if feasible else ()
+            build_s += built - start
+            solve_s += solved - built
+            status = LpStatus[prob.status]
+            proven = prob.sol_status in (LpSolutionOptimal, LpSolutionInfeasible)
+            if chosen:
+                overlaps = found.overlap(chosen)
+                worst = int(overlaps.max()) if len(overlaps) else 0
+                if worst < TOTAL_REQUIRED and (best is None or worst < best[0]):
+                    best = (worst, chosen, prob.objective.value(), status, proven)
+                if worst > target:
+                    # Candidates to ban: players shared with the closest earlier lineup, most used first
+                    shared = np.intersect1d(chosen, found.rows[int(overlaps.argmax())])
+                    candidates = shared[np.lexsort((slate.proj[shared], -counts[shared]))].tolist()
+            elif last_ban is not None:
+                # The last ban left no lineup at all: that player stays allowed
+                banned.discard(last_ban)
+                required.add(last_ban)
+            extract_s += time.perf_counter() - solved
+            if (chosen and worst <= target) or repairs >= MAX_REPAIRS:
+                break
+            last_ban = next((i for i in candidates if i not in required and i not in banned), None)
+            if last_ban is None:
+                break
+            banned.add(last_ban)
+            repairs += 1
+        if prob is None:
+            return  # time budget spent before this lineup's first solve
+
+        event = None
+        if listening:
+            event = {
+                'iteration': iteration,
+                'engine': 'milp',
+                'build_s': build_s,
+                'solve_s': solve_s,
+                'extract_s': extract_s,
+                'constraints': len(prob.constraints),
+                'variables': prob.numVariables(),
+                'status': best[3] if best is not None else status,
+                'proven': best[4] if best is not None else proven,
+                'objective': best[2] if best is not None else None,
+                'max_overlap': best[0] if best is not None else None,
+                'repairs': repairs,
+            }
+            _emit(on_iteration, event)
+        if best is None:
+            return
+
+        lineup = best[1]
+        used.append(lineup)
+        counts[list(lineup)] += 1
+        found = LineupArray(slate, np.vstack([found.rows, np.asarray(lineup)[None, :]]))
+        yield {slate.ids[i]: slate.players[i] for i in lineup}, event
 
-            qb_ids = [p.id for p in players if p.team == t and p.position == 'QB']
-            if qb_ids:
-                prob += s_stack[t] >= lpSum([x[pid] for pid in qb_ids]) - z_wr[t]
-                prob += s_stack[t] <= lpSum([x[pid] for pid in qb_ids])
-                prob += s_stack[t] <= 1
-            else:
-                prob += s_stack[t] == 0
 
-        # Exclude previously found exact lineups (force at least one different player)
-        for used in used_lineups:
-            prob += lpSum([x[player_id] for player_id in used]) <= total_required - 1
+def generate_n_lineups(
+    players: Union[List[Player], CompiledSlate],
+    n: int = 5,
+    salary_cap: int = DK_SALARY_CAP,
+    overlap_max: Optional[int] = None,
+    team_max: Optional[int] = 3,
+    prefer_qb_wr_stack: bool = False,
+    stack_penalty: float = 0.0,
+    avg_overlap_max: Optional[float] = None,
+    incremental: bool = False,
+    prune: bool = True,
+    engine: str = 'milp',
+    solver: str = 'cbc',
+    time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    on_iteration: Optional[Callable[[dict], None]] = None,
+    time_budget: Optional[float] = None,
+    warm_start: Optional[Sequence[Sequence[str]]] = None,
+    diversity: str = 'cuts',
+    max_exposure: Optional[float] = None,
+    exposure_penalty: float = 0.0,
+    previous: Optional[Sequence[Sequence[str]]] = None,
+) -> List[Dict[str, Player]]:
+    """Generate n lineups sequentially using integer programming.
 
-        # Overlap constraint vs previous lineups: limit number of shared players
-        if overlap_max is not None:
-            for used in used_lineups:
-                prob += lpSum([x[player_id] for player_id in used]) <= overlap_max
+    Strategy: solve for best lineup, then add a cut constraint forbidding that exact lineup (force selection sum <= 8) to get a different lineup, repeat.
 
-        # Average pairwise overlap: ensure average overlap between this candidate and previous lineups <= avg_overlap_max
-        if avg_overlap_max is not None and used_lineups:
-            for_used = lpSum([lpSum([x[player_id] for player_id in used]) for used in used_lineups])
-            prob += for_used <= avg_overlap_max * len(used_lineups)
+    ``players`` may be a list or an already compiled ``CompiledSlate``.
 
-        # Solve
-        solver = PULP_CBC_CMD(msg=False)
-        res = prob.solve(solver)
+    With ``incremental=True`` the model is built once; after each solve only the
+    cut rows for the new lineup are appended. Both modes solve the same model
+    and get a MIP start only from ``warm_start`` lineups that pass the cuts.
 
-        # Check feasibility
-        chosen = [p.id for p in players if x[p.id].value() == 1]
-        if not chosen:
-            break
+    With ``prune=True`` (the default) dominated players are removed first
+    (see ``pruning.prune_players``); the optimum of every iteration is kept.
 
-        lineup_players = {pid: player_map[pid] for pid in chosen}
-        lineups.append(lineup_players)
-        used_lineups.append(set(chosen))
+    ``solver`` picks the MILP backend (see ``solvers.SOLVER_BACKENDS``) and
+    ``time_limit`` (seconds per solve), ``threads`` and ``mip_gap`` are passed
+    on to it; a lineup found before the time limit is kept.
 
-    return lineups
+    ``engine='native'`` skips the MILP solver and enumerates the same lineups in process
+    (see ``enumerator.top_k_lineups``).
 
+    ``on_iteration`` is called with a timing event (a plain dict) after every
+    solve: ``iteration``, ``engine``, ``build_s``, ``solve_s``, ``extract_s``,
+    ``constraints``, ``variables``, ``status``, ``proven`` and ``objective``.
+    ``proven`` is False when a time limit stopped the solver before it proved
+    its lineup optimal (or the model infeasible); PuLP still reports such an
+    incumbent as 'Optimal'. The same events are logged at DEBUG level.
 
-def lineup_salary(lineup: Dict[str, Player]) -> int:
+    This collects ``iter_lineups``, which yields each lineup as it is solved;
+    see there for ``time_budget``, ``warm_start`` and ``previous``.
+    """
+    return [lineup for lineup, _ in iter_lineups(
+        players,
+        n=n,
+        salary_cap=salary_cap,
+        overlap_max=overlap_max,
+        team_max=team_max,
+        prefer_qb_wr_stack=prefer_qb_wr_stack,
+        stack_penalty=stack_penalty,
+        avg_overlap_max=avg_overlap_max,
+        incremental=incremental,
+        prune=prune,
+        engine=engine,
+        solver=solver,
+        time_limit=time_limit,
+        threads=threads,
+        mip_gap=mip_gap,
+        on_iteration=on_iteration,
+        time_budget=time_budget,
+        warm_start=warm_start,
+        diversity=diversity,
+        max_exposure=max_exposure,
+        exposure_penalty=exposure_penalty,
+        previous=previous,
+    )]
+
+
+def _rescore_lineups(slate: CompiledSlate, lineups: Sequence[Sequence[str]], stack_penalty: float) -> List[Tuple[int, ...]]:
+    """Earlier lineups as slate index tuples, best first by the current objective.
+
+    Lineups with a player that is no longer on the (pruned) slate are dropped.
+    """
+    scored = []
+    for ids in lineups:
+        if not all(pid in slate.index for pid in ids):
+            continue
+        idx = tuple(sorted(slate.index[pid] for pid in ids))
+        objective = float(slate.proj[list(idx)].sum())
+        if stack_penalty:
+            wr_teams = {slate.team_code[i] for i in idx if slate.pos_code[i] == POSITION_CODES['WR']}
+            objective -= stack_penalty * sum(1 for i in idx if slate.pos_code[i] == POSITION_CODES['QB'] and slate.team_code[i] not in wr_teams)
+        scored.append((objective, idx))
+    scored.sort(key=lambda item: -item[0])
+    return [idx for _, idx in scored]
+
+
+def _pick_hint(
+    slate: CompiledSlate,
+    hints: List[Tuple[int, ...]],
+    used: List[Tuple[int, ...]],
+    salary_cap: int,
+    team_max: Optional[int],
+    overlap_max: Optional[int],
+) -> Optional[Tuple[int, ...]]:
+    """Best warm-start lineup that is not taken and passes the salary, team and overlap cuts."""
+    taken = set(used)
+    for idx in hints:
+        rows = list(idx)
+        if idx in taken or int(slate.salary[rows].sum()) > salary_cap:
+            continue
+        teams = slate.team_code[rows]
+        teams = teams[teams >= 0]
+        if team_max is not None and len(teams) and np.bincount(teams).max() > team_max:
+            continue
+        if overlap_max is not None and any(len(set(idx) & set(u)) > overlap_max for u in used):
+            continue
+        return idx
+    return None
+
+
+def _listening(on_iteration: Optional[Callable[[dict], None]]) -> bool:
+    """Whether iteration events are wanted: a callback or DEBUG logging."""
+    return on_iteration is not None or logger.isEnabledFor(logging.DEBUG)
+
+
+def _emit(on_iteration: Optional[Callable[[dict], None]], event: dict):
+    logger.debug("iteration %(iteration)d: build %(build_s).4fs solve %(solve_s).4fs extract %(extract_s).4fs "
+                 "rows=%(constraints)d vars=%(variables)d status=%(status)s objective=%(objective)s", event)
+    if on_iteration is not None:
+        on_iteration(event)
+
+
+def lineup_salary(lineup: Dict[str, Player], slate: Optional[CompiledSlate] = None) -> int:
+    if slate is not None:
+        return slate.lineup_salary(lineup)
     return sum(p.salary for p in lineup.values())
 
 
-def lineup_proj(lineup: Dict[str, Player]) -> float:
+def lineup_proj(lineup: Dict[str, Player], slate: Optional[CompiledSlate] = None) -> float:
+    if slate is not None:
+        return slate.lineup_proj(lineup)
     return sum(p.proj for p in lineup.values())
@@ -0,0 +1,194 @@
+import logging
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .models import Player
+from .optimizer import DK_SALARY_CAP, generate_n_lineups
+
+logger = logging.getLogger(__name__)
+
+
+def _partition_key(p: Player, partition_by: str) -> bool:
+    if partition_by == 'DST':
+        return p.is_dst
+    return p.position == partition_by
+
+
+def _partitions(players: List[Player], partition_by: str) -> List[List[Player]]:
+    """Split the search space by fixing the player at ``partition_by``.
+
+    Every lineup has exactly one QB (or DST), so the subproblems are disjoint
+    and together cover every lineup.
+    """
+    fixed = [p for p in players if _partition_key(p, partition_by)]
+    rest = [p for p in players if not _partition_key(p, partition_by)]
+    return [rest + [p] for p in fixed]
+
+
+def _solve_partition(job: Tuple[List[Player], dict, bool]) -> Tuple[List[List[str]], List[dict]]:
+    """Process-pool entry point: solve one subproblem, return lineups as id lists plus its events."""
+    players, options, record = job
+    events: List[dict] = []
+    lineups = generate_n_lineups(players, on_iteration=events.append if record else None, **options)
+    return [sorted(lu) for lu in lineups], events
+
+
+def _objective(lineup: Dict[str, Player], stack_penalty: float) -> float:
+    """Same objective the MILP maximizes: projection minus the soft-stack penalty."""
+    total = sum(p.proj for p in lineup.values())
+    if stack_penalty:
+        wr_teams = {p.team for p in lineup.values() if p.position == 'WR'}
+        total -= stack_penalty * sum(1 for p in lineup.values() if p.position == 'QB' and p.team not in wr_teams)
+    return total
+
+
+def _select(
+    candidates: List[Dict[str, Player]],
+    n: int,
+    overlap_max: Optional[int],
+    avg_overlap_max: Optional[float],
+) -> List[Dict[str, Player]]:
+    """Greedy pick in rank order, applying the same cuts as the sequential chain."""
+    chosen: List[Dict[str, Player]] = []
+    chosen_sets: List[set] = []
+    for lineup in candidates:
+        ids = set(lineup)
+        overlaps = [len(ids & used) for used in chosen_sets]
+        if overlap_max is not None and any(o > overlap_max for o in overlaps):
+            continue
+        if avg_overlap_max is not None and chosen_sets and sum(overlaps) > avg_overlap_max * len(chosen_sets):
+            continue
+        chosen.append(lineup)
+        chosen_sets.append(ids)
+        if len(chosen) >= n:
+            break
+    return chosen
+
+
+def generate_n_lineups_parallel(
+    players: List[Player],
+    n: int = 5,
+    workers: int = 2,
+    seed: int = 0,
+    partition_by: str = 'QB',
+    per_partition: Optional[int] = None,
+    salary_cap: int = DK_SALARY_CAP,
+    overlap_max: Optional[int] = None,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    avg_overlap_max: Optional[float] = None,
+    engine: str = 'milp',
+    solver: str = 'cbc',
+    time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    prefer_qb_wr_stack: bool = False,
+    on_iteration: Optional[Callable[[dict], None]] = None,
+) -> List[Dict[str, Player]]:
+    """Generate n lineups by solving disjoint subproblems in a process pool.
+
+    The search space is split by fixing the QB (or DST), each subproblem is
+    solved for up to ``per_partition`` lineups, and the union is ranked by
+    objective, deduplicated and greedily filtered with ``overlap_max`` and
+    ``avg_overlap_max``, which also apply inside each subproblem. Ties are
+    broken with ``seed`` so the result does not depend on worker scheduling.
+    With no overlap limits and ``per_partition >= n`` the result is the
+    exact global top-n.
+
+    Under overlap limits the greedy pick can keep fewer than ``n`` of the
+    candidates, since lineups of different partitions may clash. With the
+    MILP engine every partition is then solved again, in parallel, for
+    lineups that keep the limits against the ones already picked, and the
+    pick is repeated. Such a round only runs while it takes no more solves
+    per worker than the lineups still missing (so it needs about as many workers
+    as partitions) and stops once one adds nothing. Anything still missing
+    is solved on the full slate, continuing the sequential chain.
+    If the slate cannot hold ``n`` such lineups, fewer are returned and a
+    warning is logged.
+
+    ``on_iteration`` receives the events of every solve (see
+    ``optimizer.iter_lineups``) in the parent process once a round is merged,
+    each with the ``round`` and ``partition`` it belongs to; the full-slate
+    solves have partition ``None``.
+    """
+    if not players:
+        raise ValueError("No players provided")
+    parts = _partitions(players, partition_by)
+    if not parts:
+        return []
+    if per_partition is None:
+        per_partition = min(n, max(3, math.ceil(3 * n / len(parts))))
+
+    options = {
+        'n': per_partition,
+        'salary_cap': salary_cap,
+        'overlap_max': overlap_max,
+        'team_max': team_max,
+        'stack_penalty': stack_penalty,
+        'avg_overlap_max': avg_overlap_max,
+        'prefer_qb_wr_stack': prefer_qb_wr_stack,
+        'incremental': True,
+        'engine': engine,
+        'solver': solver,
+        'time_limit': time_limit,
+        'threads': threads,
+        'mip_gap': mip_gap,
+    }
+    player_map = {p.id: p for p in players}
+    rng = random.Random(seed)
+
+    rounds = 0
+
+    def rank(results: List[Tuple[List[List[str]], List[dict]]]) -> List[Dict[str, Player]]:
+        # Merge: dedupe, then rank by objective with a seeded tie-break
+        nonlocal rounds
+        if on_iteration is not None:
+            for partition, (_, events) in enumerate(results):
+                for event in events:
+                    on_iteration(dict(event, round=rounds, partition=partition))
+        rounds += 1
+        keyed = []
+        for ids in sorted({tuple(ids) for part, _ in results for ids in part}):
+            lineup = {pid: player_map[pid] for pid in ids}
+            keyed.append((-round(_objective(lineup, stack_penalty), 6), rng.random(), lineup))
+        keyed.sort(key=lambda item: item[:2])
+        return [lineup for _, _, lineup in keyed]
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        def solve(round_options: dict) -> List[Tuple[List[List[str]], List[dict]]]:
+            jobs = [(part, round_options, on_iteration is not None) for part in parts]
+            if pool is None:
+                return [_solve_partition(job) for job in jobs]
+            return list(pool.map(_solve_partition, jobs))
+
+        chosen = _select(rank(solve(options)), n, overlap_max, avg_overlap_max)
+        # Candidates of different partitions can clash with each other. Solve
+        # another round in every partition, continuing its chain after the
+        # lineups picked so far, while that adds lineups and takes no more
+        # solves per worker than finishing the chain sequentially
+        batches = math.ceil(len(parts) / max(1, workers))
+        while 0 < len(chosen) < n and engine == 'milp':
+            missing = n - len(chosen)
+            if batches * min(per_partition, missing) > missing:
+                break
+            previous = [sorted(lu) for lu in chosen]
+            results = solve(dict(options, n=min(per_partition, missing), previous=previous))
+            picked = _select(chosen + rank(results), n, overlap_max, avg_overlap_max)
+            if len(picked) == len(chosen):
+                break
+            chosen = picked
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if len(chosen) < n:
+        rest = dict(options, n=n - len(chosen), engine='milp', previous=[list(lu) for lu in chosen])
+        if on_iteration is not None:
+            rest['on_iteration'] = lambda event: on_iteration(dict(event, round=rounds, partition=None))
+        chosen += generate_n_lineups(players, **rest)
+    if len(chosen) < n:
+        logger.warning("Only %d of %d lineups satisfy the overlap limits on this slate", len(chosen), n)
+    return chosen
@@ -0,0 +1,218 @@
+"""Binary lineup-pool files and the DraftKings bulk-upload CSV.
+
+A pool file is laid out as::
+
+    magic     8 bytes, b'DKPOOL1\\n'
+    length    4 bytes, little-endian uint32: size of the header
+    header    UTF-8 JSON: format version, row dtype and the slate's players
+    padding   up to the next 64-byte boundary
+    rows      fixed-width records: 9 sorted slate indices, salary (int32), projection (float32)
+
+Rows start at a known offset and all have the same width. ``open_pool``
+maps them with ``numpy.memmap``, and lineups are handed out as
+``LineupArray`` views of the mapped rows, so a pool of millions of lineups
+reloads without reading it into Python objects. The row count follows from
+the file size, which lets ``PoolWriter`` append chunk by chunk.
+"""
+import dataclasses
+import json
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+import numpy as np
+
+from .lineups import LineupArray, index_dtype
+from .models import Player
+from .roster import TOTAL_REQUIRED
+from .slate import POSITION_CODES, CompiledSlate, compile_slate
+
+MAGIC = b'DKPOOL1\n'
+FORMAT_VERSION = 1
+ALIGN = 64
+CHUNK_ROWS = 65536
+
+# Slot order of the DraftKings Classic bulk-upload template
+DK_SLOTS = ('QB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'FLEX', 'DST')
+
+_PLAYER_FIELDS = [f.name for f in dataclasses.fields(Player)]
+
+Lineups = Union[LineupArray, Iterable[Dict[str, Player]]]
+
+
+def row_dtype(slate: CompiledSlate) -> np.dtype:
+    return np.dtype([
+        ('players', index_dtype(slate).newbyteorder('<'), (TOTAL_REQUIRED,)),
+        ('salary', '<i4'),
+        ('proj', '<f4'),
+    ])
+
+
+def _data_offset(header_len: int) -> int:
+    end = len(MAGIC) + 4 + header_len
+    return -(-end // ALIGN) * ALIGN
+
+
+class PoolWriter:
+    """Append lineups to a new pool file; usable as a context manager."""
+
+    def __init__(self, path: str, slate: CompiledSlate):
+        self.path = path
+        self.slate = slate
+        self.dtype = row_dtype(slate)
+        self.count = 0
+        header = json.dumps({
+            'version': FORMAT_VERSION,
+            'dtype': self.dtype.descr,
+            'fields': _PLAYER_FIELDS,
+            'players': [[getattr(p, name) for name in _PLAYER_FIELDS] for p in slate.players],
+        }, separators=(',', ':')).encode('utf-8')
+        self._f = open(path, 'wb')
+        self._f.write(MAGIC + struct.pack('<I', len(header)) + header)
+        self._f.write(b'\0' * (_data_offset(len(header)) - self._f.tell()))
+
+    def write(self, lineups: Lineups):
+        """Append a LineupArray or lineup dicts (consumed in chunks)."""
+        if isinstance(lineups, LineupArray):
+            self._write_array(lineups)
+            return
+        chunk: List[Dict[str, Player]] = []
+        for lineup in lineups:
+            chunk.append(lineup)
+            if len(chunk) == CHUNK_ROWS:
+                self._write_array(LineupArray.from_dicts(self.slate, chunk))
+                chunk = []
+        if chunk:
+            self._write_array(LineupArray.from_dicts(self.slate, chunk))
+
+    def _write_array(self, lineups: LineupArray):
+        if lineups.slate is not self.slate:
+            # Same players under another slate's row order
+            remap = np.array([self.slate.index[pid] for pid in lineups.slate.ids], dtype=np.int64)
+            lineups = LineupArray(self.slate, remap[lineups.rows])
+        records = np.empty(len(lineups), dtype=self.dtype)
+        records['players'] = lineups.rows
+        records['salary'] = lineups.salary()
+        records['proj'] = lineups.proj()
+        self._f.write(records.tobytes())
+        self.count += len(lineups)
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self) -> 'PoolWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_pool(path: str, slate: CompiledSlate, lineups: Lineups) -> int:
+    """Write a pool file; returns the number of lineups."""
+    with PoolWriter(path, slate) as writer:
+        writer.write(lineups)
+        return writer.count
+
+
+class LineupPool:
+    """A pool file mapped read-only; ``records`` has the fields players, salary and proj."""
+
+    def __init__(self, path: str, slate: CompiledSlate, records: np.ndarray):
+        self.path = path
+        self.slate = slate
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def salary(self) -> np.ndarray:
+        return self.records['salary']
+
+    @property
+    def proj(self) -> np.ndarray:
+        return self.records['proj']
+
+    def lineups(self, start: int = 0, stop: Optional[int] = None) -> LineupArray:
+        """Rows ``start:stop`` as a LineupArray view (no copy)."""
+        return LineupArray(self.slate, self.records['players'][start:stop], presorted=True)
+
+    def chunks(self, size: int = CHUNK_ROWS) -> Iterator[LineupArray]:
+        for start in range(0, len(self), size):
+            yield self.lineups(start, start + size)
+
+
+def open_pool(path: str) -> LineupPool:
+    """Map a pool file written by ``PoolWriter``; raises ValueError for other files."""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a lineup pool file")
+        (header_len,) = struct.unpack('<I', f.read(4))
+        header = json.loads(f.read(header_len).decode('utf-8'))
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported pool file version {header.get('version')!r}")
+    fields = header['fields']
+    slate = compile_slate([Player(**dict(zip(fields, row))) for row in header['players']])
+    dtype = np.dtype([(name, fmt, tuple(shape[0]) if shape else ()) for name, fmt, *shape in header['dtype']])
+    offset = _data_offset(header_len)
+    count = (os.path.getsize(path) - offset) // dtype.itemsize
+    if count == 0:
+        records = np.empty(0, dtype=dtype)
+    else:
+        records = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+    return LineupPool(path, slate, records)
+
+
+def _flex_permutations() -> np.ndarray:
+    """Row f reorders a position-sorted lineup whose extra RB/WR/TE sits at column f into DK_SLOTS order."""
+    table = np.tile(np.arange(TOTAL_REQUIRED), (TOTAL_REQUIRED, 1))
+    for flex in (3, 6, 7):  # third RB, fourth WR, second TE
+        rest = [i for i in range(TOTAL_REQUIRED) if i != flex]
+        table[flex] = rest[:-1] + [flex, rest[-1]]
+    return table
+
+
+_FLEX_PERMUTATIONS = _flex_permutations()
+
+
+def dk_slots(lineups: LineupArray) -> np.ndarray:
+    """Slate indices of each lineup in ``DK_SLOTS`` order.
+
+    Players are grouped by position, most expensive first, and the cheapest
+    player of the position with an extra one goes to FLEX.
+    """
+    slate = lineups.slate
+    rows = lineups.rows.astype(np.int64)
+    codes = slate.pos_code[rows].astype(np.int64)
+    order = np.argsort(codes * 1_000_000 - slate.salary[rows], axis=1, kind='stable')
+    ordered = np.take_along_axis(rows, order, axis=1)
+    n_rb = (codes == POSITION_CODES['RB']).sum(axis=1)
+    n_wr = (codes == POSITION_CODES['WR']).sum(axis=1)
+    flex = np.where(n_rb > 2, 3, np.where(n_wr > 3, 6, 7))
+    return np.take_along_axis(ordered, _FLEX_PERMUTATIONS[flex], axis=1)
+
+
+def _csv_field(text: str) -> str:
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def write_dk_csv(f: TextIO, lineups: Union[LineupArray, Iterable[LineupArray]]) -> int:
+    """Stream lineups to ``f`` in the DraftKings bulk-upload layout; returns the number written.
+
+    Each cell is 'Name (id)'. ``lineups`` may be one LineupArray or an
+    iterable of chunks, such as ``LineupPool.chunks()``.
+    """
+    if isinstance(lineups, LineupArray):
+        lineups = [lineups]
+    f.write(','.join(DK_SLOTS) + '\n')
+    written = 0
+    labels, labelled = None, None
+    for chunk in lineups:
+        if chunk.slate is not labelled:
+            labelled = chunk.slate
+            labels = np.array([_csv_field(f"{p.name} ({p.id})") for p in labelled.players], dtype=object)
+        f.writelines(','.join(row) + '\n' for row in labels[dk_slots(chunk)].tolist())
+        written += len(chunk)
+    return written
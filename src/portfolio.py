@@ -0,0 +1,202 @@
+import dataclasses
+import logging
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .enumerator import top_k_lineups
+from .models import Player
+from .optimizer import generate_n_lineups
+from .pruning import prune_players
+from .roster import DK_SALARY_CAP, TOTAL_REQUIRED
+from .slate import compile_slate
+
+logger = logging.getLogger(__name__)
+
+Lineup = Dict[str, Player]
+
+
+def build_candidate_pool(
+    players: List[Player],
+    size: int = 2000,
+    seed: int = 0,
+    noise: float = 0.15,
+    per_round: int = 200,
+    salary_cap: int = DK_SALARY_CAP,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    max_rounds: Optional[int] = None,
+    on_iteration: Optional[Callable[[dict], None]] = None,
+) -> List[Lineup]:
+    """Collect up to ``size`` distinct lineups from cheap perturbed solves.
+
+    Each round multiplies every projection by ``1 + noise * N(0, 1)`` and
+    takes the ``per_round`` best lineups of the perturbed slate from the
+    native enumerator (the first round is unperturbed). Lineups point at the
+    original players, so they carry the real projections. ``on_iteration``
+    gets one event per round with its timings and how many new lineups it
+    added.
+    """
+    if not players:
+        raise ValueError("No players provided")
+    rng = random.Random(seed)
+    player_map = {p.id: p for p in players}
+    if max_rounds is None:
+        max_rounds = 3 * max(1, -(-size // per_round))
+
+    seen = set()
+    pool: List[Lineup] = []
+    for round_no in range(max_rounds):
+        start = time.perf_counter()
+        if round_no == 0:
+            perturbed = list(players)
+        else:
+            perturbed = [dataclasses.replace(p, proj=p.proj * (1 + noise * rng.gauss(0, 1))) for p in players]
+        slate = compile_slate(prune_players(perturbed, per_round, team_max, stack_penalty))
+        built = time.perf_counter()
+        before = len(pool)
+        for _, idx in top_k_lineups(slate, per_round, salary_cap, team_max, stack_penalty):
+            key = frozenset(slate.ids[i] for i in idx)
+            if key not in seen:
+                seen.add(key)
+                pool.append({pid: player_map[pid] for pid in sorted(key)})
+        if on_iteration is not None:
+            on_iteration({
+                'iteration': round_no,
+                'engine': 'native',
+                'stage': 'pool',
+                'build_s': built - start,
+                'solve_s': time.perf_counter() - built,
+                'variables': len(slate),
+                'lineups': len(pool) - before,
+            })
+        if len(pool) >= size:
+            break
+    logger.info("Candidate pool: %d lineups from %d rounds", min(len(pool), size), round_no + 1)
+    return pool[:size]
+
+
+def select_portfolio(
+    candidates: List[Lineup],
+    n: int,
+    overlap_max: Optional[int] = None,
+    avg_overlap_max: Optional[float] = None,
+    team_max: Optional[int] = None,
+    scores: Optional[Sequence[float]] = None,
+) -> List[Lineup]:
+    """Greedily pick n lineups from ``candidates`` in descending score order.
+
+    A candidate is taken when it repeats no chosen lineup, shares at most
+    ``overlap_max`` players with each chosen one, keeps the average overlap
+    within ``avg_overlap_max`` and has at most ``team_max`` players from one
+    team -- the same rules the sequential chain applies. Candidates are held
+    as a (k, 9) index array; after each pick the overlap with every candidate
+    is one gather through a player lookup table, with no k x players matrix.
+    ``scores`` defaults to the projection.
+    """
+    if not candidates or n <= 0:
+        return []
+    column: Dict[str, int] = {}
+    rows = np.array([[column.setdefault(pid, len(column)) for pid in lu] for lu in candidates], dtype=np.int32)
+
+    if scores is None:
+        scores = [sum(p.proj for p in lu.values()) for lu in candidates]
+    order = np.argsort(-np.asarray(scores, dtype=float), kind='stable')
+
+    valid = np.ones(len(candidates), dtype=bool)
+    if team_max is not None:
+        for i, lu in enumerate(candidates):
+            counts: Dict[str, int] = {}
+            for p in lu.values():
+                if p.team:
+                    counts[p.team] = counts.get(p.team, 0) + 1
+            valid[i] = max(counts.values(), default=0) <= team_max
+    max_overlap = np.zeros(len(candidates), dtype=np.int64)
+    sum_overlap = np.zeros(len(candidates), dtype=np.int64)
+
+    chosen: List[int] = []
+    while len(chosen) < n:
+        ok = valid & (max_overlap < TOTAL_REQUIRED)
+        if overlap_max is not None:
+            ok &= max_overlap <= overlap_max
+        if avg_overlap_max is not None and chosen:
+            ok &= sum_overlap <= avg_overlap_max * len(chosen)
+        ranked_ok = ok[order]
+        if not ranked_ok.any():
+            break
+        pick = int(order[ranked_ok.argmax()])
+        chosen.append(pick)
+        valid[pick] = False
+        picked = np.zeros(len(column), dtype=np.int8)
+        picked[rows[pick]] = 1
+        overlap = picked[rows].sum(axis=1, dtype=np.int64)
+        np.maximum(max_overlap, overlap, out=max_overlap)
+        sum_overlap += overlap
+    return [candidates[i] for i in chosen]
+
+
+def generate_portfolio(
+    players: List[Player],
+    n: int = 5,
+    pool_size: int = 2000,
+    seed: int = 0,
+    salary_cap: int = DK_SALARY_CAP,
+    overlap_max: Optional[int] = None,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    avg_overlap_max: Optional[float] = None,
+    score: Optional[Callable[[List[Lineup]], Sequence[float]]] = None,
+    solver: str = 'cbc',
+    time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    on_iteration: Optional[Callable[[dict], None]] = None,
+) -> List[Lineup]:
+    """Pool-then-select: build a candidate pool, then pick the final n from it.
+
+    ``score`` receives the whole pool and returns one number per lineup
+    (for example the top-1% frequency from ``simulation.simulate_lineups``);
+    by default lineups are ranked by projection.
+
+    Under tight overlap limits the pool can run out before n lineups are
+    picked. The rest then come from the MILP chain continued after the
+    picked ones (``previous`` of ``optimizer.iter_lineups``), ranked by
+    projection; ``solver``, ``time_limit``, ``threads`` and ``mip_gap``
+    apply to those solves. A warning is logged when even that falls short.
+    ``on_iteration`` gets the pool rounds' events (``stage`` 'pool') and
+    then those of the MILP solves.
+    """
+    pool = build_candidate_pool(
+        players,
+        size=max(pool_size, n),
+        seed=seed,
+        salary_cap=salary_cap,
+        team_max=team_max,
+        stack_penalty=stack_penalty,
+        on_iteration=on_iteration,
+    )
+    scores = score(pool) if score is not None else None
+    chosen = select_portfolio(pool, n, overlap_max, avg_overlap_max, team_max, scores)
+    if len(chosen) < n:
+        logger.info("Candidate pool gave %d of %d lineups; solving the rest", len(chosen), n)
+        chosen += generate_n_lineups(
+            players,
+            n=n - len(chosen),
+            salary_cap=salary_cap,
+            overlap_max=overlap_max,
+            team_max=team_max,
+            stack_penalty=stack_penalty,
+            avg_overlap_max=avg_overlap_max,
+            incremental=True,
+            solver=solver,
+            time_limit=time_limit,
+            threads=threads,
+            mip_gap=mip_gap,
+            on_iteration=on_iteration,
+            previous=[list(lu) for lu in chosen],
+        )
+    if len(chosen) < n:
+        logger.warning("Only %d of %d lineups satisfy the overlap limits on this slate", len(chosen), n)
+    return chosen
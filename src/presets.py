@@ -0,0 +1,8 @@
+"""Strategy presets shared by the CLI, the GUI and batch runs."""
+
+PRESET_CONFIGS = {
+    'default': {},
+    'heavy_stacking': {'prefer_qb_wr_stack': True, 'team_max': 4, 'stack_penalty': 0.0},
+    'contrarian': {'overlap_max': 3, 'team_max': 2, 'stack_penalty': 5.0},
+    'cash': {'overlap_max': 5, 'team_max': 3, 'stack_penalty': 1.0},
+}
@@ -0,0 +1,112 @@
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+from .models import Player
+from .roster import MAX_FILL, TOTAL_REQUIRED
+from .slate import CompiledSlate, compile_slate
+
+logger = logging.getLogger(__name__)
+
+# Positions whose team affects the soft QB-WR stack penalty
+_STACK_POSITIONS = ('QB', 'WR')
+
+
+def _required_dominators(pos: str, n: int, cut_overlap: bool) -> int:
+    """How many dominators make a player safe to drop for an n-lineup chain.
+
+    A dropped player p in lineup L can be swapped for a dominator q that is
+    not in L (at most MAX_FILL - 1 others share p's position). With only the
+    exact-lineup exclusion cuts, the n - 1 earlier lineups can block at most
+    n - 1 such swaps. With overlap limits q must also avoid every earlier
+    lineup, each of which can hold MAX_FILL players of the position.
+    """
+    k = MAX_FILL[pos]
+    if cut_overlap:
+        return k * n
+    return k + n - 1
+
+
+def _effective_count(team_counts: np.ndarray, own_team: int, capped_teams: int) -> int:
+    """Dominators that stay usable when other teams already sit at team_max.
+
+    Dominators on the player's own team keep team counts unchanged. From the
+    other teams, the ``capped_teams`` largest groups are discounted since
+    those teams could already be full in the lineup being repaired.
+    """
+    own = int(team_counts[own_team])
+    others = team_counts.copy()
+    others[own_team] = 0
+    if capped_teams > 0:
+        blocked = int(np.sort(others)[::-1][:capped_teams].sum())
+    else:
+        blocked = 0
+    return own + int(others.sum()) - blocked
+
+
+def prune_players(
+    players,
+    n: int = 1,
+    team_max: Optional[int] = 3,
+    stack_penalty: float = 0.0,
+    overlap_max: Optional[int] = None,
+    avg_overlap_max: Optional[float] = None,
+) -> List[Player]:
+    """Drop players that can never be needed in the next ``n`` lineups.
+
+    A player is dominated when enough other players at the same position cost
+    no more and project no less (ties broken by slate order, so identical
+    players do not knock each other out). The count required grows with
+    ``n`` and with overlap limits, and a dominator only counts when swapping
+    it in cannot break ``team_max`` or increase the stack penalty. Rows with
+    no positive projection are dropped as long as their position keeps as
+    many positive rows as a dominated player needs dominators.
+    """
+    slate: CompiledSlate = compile_slate(players)
+    cut_overlap = overlap_max is not None or avg_overlap_max is not None
+    capped_teams = (TOTAL_REQUIRED - 1) // team_max if team_max else 0
+    n_teams = len(slate.teams)
+    team_code = np.where(slate.team_code < 0, n_teams, slate.team_code)
+
+    keep = np.ones(len(slate), dtype=bool)
+    zero_rows = 0
+    for pos, idx in slate.by_position.items():
+        need = _required_dominators(pos, n, cut_overlap)
+        sal = slate.salary[idx]
+        proj = slate.proj[idx]
+        teams = team_code[idx]
+        if len(idx) > need:
+            order = np.arange(len(idx))
+            # dominates[i, j]: player j can stand in for player i
+            dominates = (sal[None, :] <= sal[:, None]) & (proj[None, :] >= proj[:, None])
+            dominates &= (sal[None, :] < sal[:, None]) | (proj[None, :] > proj[:, None]) | (order[None, :] < order[:, None])
+            if stack_penalty > 0 and pos in _STACK_POSITIONS:
+                # A teammate swap leaves the stack untouched; otherwise the gain must cover the penalty
+                dominates &= (teams[None, :] == teams[:, None]) | (proj[None, :] >= proj[:, None] + stack_penalty)
+            # Visit dominators before the players they dominate and only count
+            # dominators that survived, so every dropped player keeps enough
+            # stand-ins in the reduced pool
+            kept = np.zeros(len(idx), dtype=bool)
+            for i in np.lexsort((order, -proj, sal)):
+                team_counts = np.bincount(teams[dominates[i] & kept], minlength=n_teams + 1)
+                kept[i] = _effective_count(team_counts, teams[i], capped_teams) < need
+            keep[idx] = kept
+
+        # Rows without a positive projection only go when enough positive rows
+        # remain to stand in for them across the n lineups and overlap limits
+        positive = (proj > 0) & keep[idx]
+        if positive.sum() >= need:
+            dropped = idx[~positive & keep[idx]]
+            zero_rows += len(dropped)
+            keep[dropped] = False
+
+    # Anything outside the roster positions can never be picked
+    keep[slate.pos_code < 0] = False
+
+    kept = [p for p, k in zip(slate.players, keep) if k]
+    logger.info(
+        "Dominance pruning removed %d of %d players (%d without a positive projection)",
+        len(slate) - len(kept), len(slate), zero_rows,
+    )
+    return kept
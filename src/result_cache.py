@@ -0,0 +1,170 @@
+"""Persistent cache of generated lineups keyed by slate content and options.
+
+An entry is stored per (slate hash, options hash), where the slate hash
+covers every player's id, salary, projection, position and team. An exact
+repeat of a request is answered from disk without solving. When the same
+players come back with different projections (same structure hash), the
+newest entry for those options is passed to the optimizer as warm starts.
+
+Entries are small JSON files; the least recently used ones are evicted once
+the directory holds more than ``max_entries``.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .models import Player
+from .optimizer import iter_lineups
+
+DEFAULT_RESULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ai-fantasy-football-creator', 'results')
+DEFAULT_MAX_ENTRIES = 200
+
+# Options that only change how fast a run goes (or how it reports), not its result
+_IGNORED_OPTIONS = ('on_iteration', 'time_budget', 'threads', 'warm_start')
+
+
+def _digest(rows) -> str:
+    h = hashlib.sha256()
+    for row in rows:
+        h.update(json.dumps(row, separators=(',', ':')).encode('utf-8'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+def slate_key(players: Sequence[Player]) -> str:
+    """Content hash of the player list (order independent)."""
+    return _digest(sorted((p.id, p.salary, p.proj, p.position, p.team, p.is_dst) for p in players))
+
+
+def structure_key(players: Sequence[Player]) -> str:
+    """Like ``slate_key`` but without projections, so projection updates keep the same key."""
+    return _digest(sorted((p.id, p.salary, p.position, p.team, p.is_dst) for p in players))
+
+
+def options_key(options: dict) -> str:
+    kept = {k: v for k, v in options.items() if k not in _IGNORED_OPTIONS}
+    return _digest([sorted(kept.items())])
+
+
+def run_finished(events: Sequence[dict], found: int, n: int) -> bool:
+    """Whether a run's lineups are what the same request would always get.
+
+    The run must have ended on its own (``n`` lineups found, or the model
+    ran out of lineups) and every solve must be ``proven``: a solve that a
+    time limit stopped at an incumbent may not be optimal.
+    """
+    if not all(event.get('proven', False) for event in events):
+        return False
+    return found == n or (bool(events) and events[-1]['status'] == 'Infeasible')
+
+
+class ResultCache:
+    def __init__(self, directory: str = DEFAULT_RESULT_CACHE_DIR, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+
+    def _path(self, slate: str, options: str) -> str:
+        return os.path.join(self.directory, f"{options[:16]}-{slate[:32]}.json")
+
+    def _read(self, path: str) -> Optional[dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, players: Sequence[Player], options: dict) -> Optional[List[Dict[str, Player]]]:
+        """Lineups of an identical earlier request, or None."""
+        path = self._path(slate_key(players), options_key(options))
+        entry = self._read(path)
+        if entry is None:
+            return None
+        by_id = {p.id: p for p in players}
+        if not all(pid in by_id for ids in entry['lineups'] for pid in ids):
+            return None
+        os.utime(path)
+        return [{pid: by_id[pid] for pid in ids} for ids in entry['lineups']]
+
+    def similar(self, players: Sequence[Player], options: dict) -> Optional[List[List[str]]]:
+        """Lineups (as id lists) of the newest entry with the same players and options but other projections."""
+        prefix = options_key(options)[:16]
+        structure = structure_key(players)
+        newest: Tuple[float, Optional[List[List[str]]]] = (-1.0, None)
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return None
+        for name in names:
+            if not name.startswith(prefix + '-'):
+                continue
+            path = os.path.join(self.directory, name)
+            entry = self._read(path)
+            if entry and entry.get('structure') == structure and entry['created'] > newest[0]:
+                newest = (entry['created'], entry['lineups'])
+        return newest[1]
+
+    def put(self, players: Sequence[Player], options: dict, lineups: List[Dict[str, Player]]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(slate_key(players), options_key(options))
+        entry = {'structure': structure_key(players), 'created': time.time(), 'lineups': [list(lu) for lu in lineups]}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    continue
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def iter_lineups_cached(
+    cache: ResultCache,
+    players: List[Player],
+    preset: Optional[str] = None,
+    **options,
+) -> Iterator[Tuple[Dict[str, Player], Optional[dict]]]:
+    """``optimizer.iter_lineups`` through the result cache.
+
+    A cache hit yields the stored lineups with ``None`` stats. Otherwise the
+    run is warm-started from the closest earlier entry and stored once it
+    has finished (see ``run_finished``). Runs cut short (time budget, a time
+    limit stopping any solve, consumer stopping) are not stored. ``preset``
+    is only part of the key.
+    """
+    key_options = dict(options, preset=preset)
+    cached = cache.get(players, key_options)
+    if cached is not None:
+        for lineup in cached:
+            yield lineup, None
+        return
+
+    found: List[Dict[str, Player]] = []
+    events: List[dict] = []
+    on_iteration = options.pop('on_iteration', None)
+
+    def record(event: dict):
+        events.append(event)
+        if on_iteration is not None:
+            on_iteration(event)
+
+    warm_start = options.pop('warm_start', None) or cache.similar(players, key_options)
+    for lineup, stats in iter_lineups(players, on_iteration=record, warm_start=warm_start, **options):
+        found.append(lineup)
+        yield lineup, stats
+    if run_finished(events, len(found), options.get('n', 5)):
+        cache.put(players, key_options, found)
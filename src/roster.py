@@ -0,0 +1,23 @@
+"""DraftKings Classic roster rules shared by the optimizer and its helpers."""
+
+DK_SALARY_CAP = 50000
+ROSTER_REQUIREMENTS = {
+    'QB': 1,
+    'RB': 2,
+    'WR': 3,
+    'TE': 1,
+    'FLEX': 1,  # FLEX can be RB/WR/TE
+    'DST': 1,
+}
+
+FLEX_ELIGIBLE = {'RB', 'WR', 'TE'}
+
+# Precompute roster size
+TOTAL_REQUIRED = sum(ROSTER_REQUIREMENTS.values())
+
+# Most players a position can fill in one lineup, counting FLEX
+MAX_FILL = {
+    pos: count + (ROSTER_REQUIREMENTS['FLEX'] if pos in FLEX_ELIGIBLE else 0)
+    for pos, count in ROSTER_REQUIREMENTS.items()
+    if pos != 'FLEX'
+}
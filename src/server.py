@@ -0,0 +1,389 @@
+"""Local optimizer service: an HTTP/JSON API that keeps slates warm between requests.
+
+Tools that ask for lineups many times per slate pay interpreter startup,
+imports and CSV parsing once instead of on every call. Loaded slates stay
+in memory, compiled to a ``CompiledSlate``, together with:
+- their pruned player pools, one per set of pruning options;
+- the lineups of every finished run (see ``result_cache.run_finished``).
+
+PuLP models are not kept: every run builds its own, since the model depends
+on the request's options.
+
+An exact repeat of a request is answered from memory. A run on a slate that
+was reloaded with new projections is warm-started from the newest run with
+the same players and options.
+
+Endpoints (all bodies are JSON)::
+
+    GET    /health                      {"status": "ok", "slates": 1, "workers": 2}
+    GET    /slates                      loaded slates
+    POST   /slates                      {"source": "fftoolbox", "path": "week5.csv"} -> {"slate": id, ...}
+    DELETE /slates/<id>
+    POST   /slates/<id>/lineups         {"preset": "cash", "count": 20, "options": {"engine": "native"}}
+
+``source`` is fftoolbox (with ``path`` or ``csv`` text), merge (``path``
+to a salary CSV plus ``projections``: FFToolbox CSVs merged onto it, see
+``data_sources.pipeline``), mock, or players (``players``: a list of
+``Player`` fields).
+The slate id is a hash of the slate's content, so loading the same slate
+twice returns the same id. ``options`` take any ``optimizer.iter_lineups``
+option and win over the preset.
+
+Lineups stream back as newline-delimited JSON while they are solved::
+
+    {"lineup": ["id1", ...], "salary": 49800, "proj": 151.2, "event": {...}}
+    ...
+    {"done": true, "lineups": 20, "cached": false, "seconds": 1.52}
+
+Solves run on a thread pool of ``workers`` threads, so the warm state is
+shared rather than copied into each worker. The MILP solver runs as a
+subprocess, so MILP solves of concurrent requests overlap; a client that
+disconnects stops its run after the lineup being solved.
+
+Usage: python -m src.server [--host 127.0.0.1] [--port 8765] [--workers N]
+"""
+import argparse
+import dataclasses
+import inspect
+import json
+import queue
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .data_sources import fftoolbox, mock, pipeline
+from .data_sources.ingest import FFTOOLBOX_SCHEMA, read_csv_text
+from .models import Player
+from .optimizer import exposure_breaks_pruning, iter_lineups
+from .presets import PRESET_CONFIGS
+from .pruning import prune_players
+from .result_cache import options_key, run_finished, slate_key, structure_key
+from .slate import CompiledSlate, compile_slate
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_RESULTS = 256  # finished runs kept in memory; least recently used are dropped
+
+_LOADERS = {
+    'fftoolbox': lambda body: fftoolbox.parse_csv_file(body['path']) if 'path' in body else read_csv_text(body['csv'], FFTOOLBOX_SCHEMA),
+    'merge': lambda body: pipeline.load_players(body.get('path'), list(body['projections']), strict=True).players,
+    'mock': lambda body: mock.fetch_players_for_week(),
+    'players': lambda body: [Player(**row) for row in body['players']],
+}
+
+# Options that are not part of a request: the service sets them itself
+_RESERVED_OPTIONS = ('n', 'on_iteration', 'warm_start')
+
+_DEFAULTS = {name: p.default for name, p in inspect.signature(iter_lineups).parameters.items() if p.default is not p.empty}
+
+_DONE = object()
+
+
+class RequestError(Exception):
+    """A request the service rejects; ``status`` is the HTTP status to answer with."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclasses.dataclass
+class SlateEntry:
+    id: str
+    source: str
+    slate: CompiledSlate
+    structure: str
+    loaded: float
+    # Pruned slates by (n, team_max, stack_penalty, overlap_max, avg_overlap_max)
+    pruned: Dict[tuple, CompiledSlate] = dataclasses.field(default_factory=dict)
+
+    def describe(self) -> dict:
+        return {'slate': self.id, 'source': self.source, 'players': len(self.slate), 'loaded': self.loaded}
+
+
+class OptimizerService:
+    """The in-memory state behind the HTTP API; usable directly from Python."""
+
+    def __init__(self, workers: int = 1, max_results: int = MAX_RESULTS):
+        self.workers = workers
+        self.max_results = max_results
+        self.slates: Dict[str, SlateEntry] = {}
+        # (slate id, options key) -> lineups as id lists, in LRU order
+        self.results: 'OrderedDict[Tuple[str, str], List[List[str]]]' = OrderedDict()
+        # (structure key, options key) -> newest lineups, for warm starts after projection updates
+        self.latest: Dict[Tuple[str, str], List[List[str]]] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='solve')
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def load_slate(self, body: dict) -> SlateEntry:
+        source = body.get('source', 'fftoolbox')
+        loader = _LOADERS.get(source)
+        if loader is None:
+            raise RequestError(400, f"Unknown source {source!r}; expected one of {sorted(_LOADERS)}")
+        try:
+            players = loader(body)
+        except KeyError as e:
+            raise RequestError(400, f"Source {source!r} needs {e.args[0]!r}")
+        except (OSError, ValueError, TypeError) as e:
+            raise RequestError(400, f"Could not load slate: {type(e).__name__}: {e}")
+        if not players:
+            raise RequestError(400, 'Slate has no players')
+        slate_id = slate_key(players)[:16]
+        with self._lock:
+            entry = self.slates.get(slate_id)
+            if entry is None:
+                entry = SlateEntry(slate_id, source, compile_slate(players), structure_key(players), time.time())
+                self.slates[slate_id] = entry
+        return entry
+
+    def drop_slate(self, slate_id: str):
+        with self._lock:
+            if self.slates.pop(slate_id, None) is None:
+                raise RequestError(404, f"No slate {slate_id!r}")
+            for key in [key for key in self.results if key[0] == slate_id]:
+                del self.results[key]
+
+    def _entry(self, slate_id: str) -> SlateEntry:
+        entry = self.slates.get(slate_id)
+        if entry is None:
+            raise RequestError(404, f"No slate {slate_id!r}")
+        return entry
+
+    def _options(self, body: dict) -> dict:
+        preset = body.get('preset', 'default')
+        if preset not in PRESET_CONFIGS:
+            raise RequestError(400, f"Unknown preset {preset!r}; expected one of {sorted(PRESET_CONFIGS)}")
+        overrides = body.get('options') or {}
+        unknown = [k for k in overrides if k not in _DEFAULTS or k in _RESERVED_OPTIONS]
+        if unknown:
+            raise RequestError(400, f"Unknown options {unknown}")
+        count = body.get('count', 5)
+        if not isinstance(count, int) or count < 1:
+            raise RequestError(400, f"count must be a positive integer, got {count!r}")
+        return dict(PRESET_CONFIGS[preset], **overrides, n=count)
+
+    def _slate_for(self, entry: SlateEntry, options: dict) -> Tuple[CompiledSlate, dict]:
+        """The entry's slate pruned for ``options``, reusing an earlier pruning with the same inputs."""
+        merged = dict(_DEFAULTS, **options)
+        if not merged['prune'] or exposure_breaks_pruning(
+            merged['engine'], merged['diversity'], merged['max_exposure'], merged['exposure_penalty'],
+        ):
+            # Exposure caps and penalties change what pruning may drop; leave that to iter_lineups
+            return entry.slate, options
+        key = (merged['n'], merged['team_max'], merged['stack_penalty'], merged['overlap_max'], merged['avg_overlap_max'])
+        slate = entry.pruned.get(key)
+        if slate is None:
+            kept = prune_players(entry.slate, *key)
+            slate = compile_slate(kept) if len(kept) < len(entry.slate) else entry.slate
+            with self._lock:
+                entry.pruned[key] = slate
+        return slate, dict(options, prune=False)
+
+    def _remember(self, entry: SlateEntry, key: str, lineups: List[List[str]]):
+        with self._lock:
+            self.results[(entry.id, key)] = lineups
+            self.results.move_to_end((entry.id, key))
+            while len(self.results) > self.max_results:
+                self.results.popitem(last=False)
+            self.latest[(entry.structure, key)] = lineups
+
+    def lineups(self, slate_id: str, body: dict, cancel: Optional[threading.Event] = None) -> Iterator[dict]:
+        """Validate a lineups request, then yield its stream records (see the module docstring).
+
+        Validation errors raise ``RequestError`` before the first record;
+        errors while solving end the stream with an ``{"error": ...}`` record.
+        """
+        start = time.perf_counter()
+        entry = self._entry(slate_id)
+        options = self._options(body)
+        key = options_key(options)
+        with self._lock:
+            done = self.results.get((entry.id, key))
+            if done is not None:
+                self.results.move_to_end((entry.id, key))
+        if done is not None:
+            for ids in done:
+                yield self._record(entry.slate, ids, None)
+            yield {'done': True, 'lineups': len(done), 'cached': True, 'seconds': time.perf_counter() - start}
+            return
+
+        cancel = cancel or threading.Event()
+        records: 'queue.Queue' = queue.Queue()
+        self._pool.submit(self._run, entry, options, key, records, cancel)
+        count = 0
+        while True:
+            record = records.get()
+            if record is _DONE:
+                break
+            if 'lineup' in record:
+                count += 1
+            yield record
+        yield {'done': True, 'lineups': count, 'cached': False, 'seconds': time.perf_counter() - start}
+
+    def _run(self, entry: SlateEntry, options: dict, key: str, records: 'queue.Queue', cancel: threading.Event):
+        try:
+            if cancel.is_set():
+                return
+            slate, solve_options = self._slate_for(entry, options)
+            events: List[dict] = []
+            found: List[List[str]] = []
+            run = iter_lineups(
+                slate,
+                on_iteration=events.append,
+                warm_start=self.latest.get((entry.structure, key)),
+                **solve_options,
+            )
+            for lineup, event in run:
+                ids = list(lineup)
+                found.append(ids)
+                records.put(self._record(slate, ids, event))
+                if cancel.is_set():
+                    run.close()
+                    return
+            if run_finished(events, len(found), options['n']):
+                self._remember(entry, key, found)
+        except Exception as e:
+            records.put({'error': f"{type(e).__name__}: {e}"})
+        finally:
+            records.put(_DONE)
+
+    @staticmethod
+    def _record(slate: CompiledSlate, ids: List[str], event: Optional[dict]) -> dict:
+        return {'lineup': ids, 'salary': slate.lineup_salary(ids), 'proj': round(slate.lineup_proj(ids), 4), 'event': event}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: '_Server'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError as e:
+            raise RequestError(400, f"Body is not JSON: {e}")
+        if not isinstance(body, dict):
+            raise RequestError(400, 'Body must be a JSON object')
+        return body
+
+    def _send_json(self, status: int, payload):
+        data = json.dumps(payload, default=_jsonable).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, records: Iterator[dict], cancel: threading.Event):
+        first = next(records)  # raises RequestError before any header is sent
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for record in _chain(first, records):
+                line = json.dumps(record, default=_jsonable).encode('utf-8') + b'\n'
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            cancel.set()
+            records.close()
+            self.close_connection = True
+
+    def _dispatch(self, method: str):
+        service = self.server.service
+        path = self.path.split('?', 1)[0].rstrip('/')
+        try:
+            if method == 'GET' and path == '/health':
+                return self._send_json(200, {'status': 'ok', 'slates': len(service.slates), 'workers': service.workers})
+            if method == 'GET' and path == '/slates':
+                return self._send_json(200, [entry.describe() for entry in list(service.slates.values())])
+            if method == 'POST' and path == '/slates':
+                start = time.perf_counter()
+                entry = service.load_slate(self._body())
+                return self._send_json(200, dict(entry.describe(), seconds=time.perf_counter() - start))
+            match = re.fullmatch(r'/slates/([0-9a-f]+)(/lineups)?', path)
+            if match and method == 'DELETE' and not match.group(2):
+                service.drop_slate(match.group(1))
+                return self._send_json(200, {'deleted': match.group(1)})
+            if match and method == 'POST' and match.group(2):
+                cancel = threading.Event()
+                return self._send_stream(service.lineups(match.group(1), self._body(), cancel), cancel)
+            raise RequestError(404, f"No route for {method} {path or '/'}")
+        except RequestError as e:
+            self._send_json(e.status, {'error': str(e)})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+def _chain(first: dict, rest: Iterator[dict]) -> Iterator[dict]:
+    yield first
+    yield from rest
+
+
+def _jsonable(value):
+    # NumPy scalars in solver events
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: OptimizerService, verbose: bool = False):
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1, verbose: bool = False) -> _Server:
+    """A server bound to ``host:port`` (port 0 picks a free one); call ``serve_forever`` to run it."""
+    return _Server((host, port), OptimizerService(workers), verbose)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Serve the optimizer over a local HTTP/JSON API')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help='Interface to bind (default: localhost only)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=1, help='Runs solved at the same time')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.workers, args.verbose)
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port} with {args.workers} workers; Ctrl+C to stop", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Player
+
+# Coefficient of variation (sd / projection) per position
+DEFAULT_CV = {'QB': 0.35, 'RB': 0.5, 'WR': 0.6, 'TE': 0.65, 'DST': 0.8}
+
+# Pairwise outcome correlations keyed by (position, position, relation), where
+# relation is 'team' for teammates and 'opp' for players facing each other
+DEFAULT_CORRELATIONS = {
+    ('QB', 'WR', 'team'): 0.45,
+    ('QB', 'TE', 'team'): 0.35,
+    ('QB', 'RB', 'team'): 0.1,
+    ('RB', 'DST', 'team'): 0.15,
+    ('WR', 'WR', 'team'): 0.05,
+    ('QB', 'QB', 'opp'): 0.2,
+    ('QB', 'WR', 'opp'): 0.15,
+    ('WR', 'WR', 'opp'): 0.1,
+    ('QB', 'DST', 'opp'): -0.4,
+    ('RB', 'DST', 'opp'): -0.2,
+    ('WR', 'DST', 'opp'): -0.25,
+    ('TE', 'DST', 'opp'): -0.2,
+}
+
+
+@dataclass
+class SimulationResult:
+    """Per-lineup outcome statistics; every array is indexed like the input lineups."""
+    n_sims: int
+    mean: np.ndarray
+    std: np.ndarray
+    percentiles: Dict[float, np.ndarray]
+    top_frequency: np.ndarray  # share of sims in which the lineup lands in the top fraction
+
+
+def _position(p: Player) -> str:
+    return 'DST' if p.is_dst else p.position
+
+
+def _pair_correlation(a: Player, b: Player, correlations: Dict[Tuple[str, str, str], float]) -> float:
+    if a.team and a.team == b.team:
+        relation = 'team'
+    elif (a.opponent and a.opponent == b.team) or (b.opponent and b.opponent == a.team):
+        relation = 'opp'
+    else:
+        return 0.0
+    pa, pb = _position(a), _position(b)
+    return correlations.get((pa, pb, relation), correlations.get((pb, pa, relation), 0.0))
+
+
+def _game_blocks(players: List[Player]) -> List[np.ndarray]:
+    """Group players by game (team joined with opponent); outcomes only correlate within a block."""
+    parent: Dict[str, str] = {}
+
+    def root(team: str) -> str:
+        while parent.setdefault(team, team) != team:
+            team = parent[team]
+        return team
+
+    for p in players:
+        if p.team and p.opponent:
+            parent[root(p.team)] = root(p.opponent)
+    blocks: Dict[str, List[int]] = {}
+    for i, p in enumerate(players):
+        key = root(p.team) if p.team else f"#{i}"
+        blocks.setdefault(key, []).append(i)
+    return [np.array(idx) for idx in blocks.values()]
+
+
+def _cholesky(corr: np.ndarray) -> np.ndarray:
+    """Cholesky factor, clipping negative eigenvalues when the matrix is not positive definite."""
+    try:
+        return np.linalg.cholesky(corr)
+    except np.linalg.LinAlgError:
+        vals, vecs = np.linalg.eigh(corr)
+        fixed = vecs @ np.diag(np.clip(vals, 1e-6, None)) @ vecs.T
+        d = np.sqrt(np.diag(fixed))
+        return np.linalg.cholesky(fixed / np.outer(d, d))
+
+
+def simulate_lineups(
+    lineups: Sequence[Dict[str, Player]],
+    n_sims: int = 10000,
+    chunk_size: int = 5000,
+    seed: Optional[int] = None,
+    percentiles: Sequence[float] = (10, 25, 50, 75, 90, 99),
+    top_fraction: float = 0.01,
+    cv: Optional[Dict[str, float]] = None,
+    correlations: Optional[Dict[Tuple[str, str, str], float]] = None,
+    bin_width: float = 0.1,
+) -> SimulationResult:
+    """Monte Carlo score distribution of each lineup under correlated player outcomes.
+
+    Player scores are normal around ``proj`` with sd ``proj * cv[position]``,
+    correlated through teammates and opponents, and floored at zero except
+    for DST. Simulations are drawn ``chunk_size`` at a time and every lineup
+    is scored with one matrix product per chunk; means come from running
+    sums and percentiles from a fixed-width histogram, so memory does not
+    grow with ``n_sims``.
+    """
+    if not lineups:
+        raise ValueError("No lineups provided")
+    cv = DEFAULT_CV if cv is None else cv
+    correlations = DEFAULT_CORRELATIONS if correlations is None else correlations
+    rng = np.random.default_rng(seed)
+
+    # Only players that appear in some lineup are simulated
+    players: List[Player] = []
+    column: Dict[str, int] = {}
+    for lu in lineups:
+        for pid, p in lu.items():
+            if pid not in column:
+                column[pid] = len(players)
+                players.append(p)
+    m, n_lineups = len(players), len(lineups)
+    incidence = np.zeros((m, n_lineups))
+    for j, lu in enumerate(lineups):
+        incidence[[column[pid] for pid in lu], j] = 1.0
+
+    proj = np.array([p.proj for p in players])
+    sd = np.abs(proj) * np.array([cv.get(_position(p), 0.5) for p in players])
+    floor = np.array([-np.inf if p.is_dst else 0.0 for p in players])
+    factors = []
+    for block in _game_blocks(players):
+        corr = np.eye(len(block))
+        for a in range(len(block)):
+            for b in range(a + 1, len(block)):
+                corr[a, b] = corr[b, a] = _pair_correlation(players[block[a]], players[block[b]], correlations)
+        factors.append((block, _cholesky(corr).T))
+
+    # Histogram range wide enough for any realistic lineup score
+    top = float((incidence.T @ (proj + 6 * sd)).max())
+    n_bins = int(np.ceil(top / bin_width)) + 2
+    hist = np.zeros(n_lineups * n_bins, dtype=np.int64)
+    total = np.zeros(n_lineups)
+    total_sq = np.zeros(n_lineups)
+    top_hits = np.zeros(n_lineups, dtype=np.int64)
+    top_k = max(1, int(np.ceil(top_fraction * n_lineups)))
+    offsets = np.arange(n_lineups) * n_bins
+
+    done = 0
+    while done < n_sims:
+        size = min(chunk_size, n_sims - done)
+        z = rng.standard_normal((size, m))
+        for block, upper in factors:
+            z[:, block] = z[:, block] @ upper
+        outcomes = np.maximum(proj + sd * z, floor)
+        scores = outcomes @ incidence  # (size, n_lineups)
+
+        total += scores.sum(axis=0)
+        total_sq += np.square(scores).sum(axis=0)
+        bins = np.clip((scores / bin_width).astype(np.int64) + 1, 0, n_bins - 1)
+        hist += np.bincount((bins + offsets).ravel(), minlength=hist.size)
+        if top_k < n_lineups:
+            best = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        else:
+            best = np.broadcast_to(np.arange(n_lineups), (size, n_lineups))
+        top_hits += np.bincount(best.ravel(), minlength=n_lineups)
+        done += size
+
+    mean = total / n_sims
+    std = np.sqrt(np.maximum(total_sq / n_sims - mean ** 2, 0.0))
+    cumulative = np.cumsum(hist.reshape(n_lineups, n_bins), axis=1)
+    result_pct = {}
+    for q in percentiles:
+        rank = np.ceil(q / 100 * n_sims)
+        first_bin = (cumulative >= rank).argmax(axis=1)
+        # Report the bin midpoint; bin 0 collects anything below zero
+        result_pct[q] = (first_bin - 0.5) * bin_width
+    return SimulationResult(n_sims=n_sims, mean=mean, std=std, percentiles=result_pct, top_frequency=top_hits / n_sims)
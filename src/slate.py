@@ -0,0 +1,83 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .models import Player
+
+
+# Position codes used in the columnar arrays; anything unrecognised gets OTHER
+POSITIONS = ('QB', 'RB', 'WR', 'TE', 'DST')
+POSITION_CODES = {pos: code for code, pos in enumerate(POSITIONS)}
+OTHER = -1
+
+
+def _group_indices(codes: np.ndarray) -> Dict[int, np.ndarray]:
+    """Map each distinct code to the (sorted) row indices carrying it."""
+    if len(codes) == 0:
+        return {}
+    order = np.argsort(codes, kind='stable')
+    uniq, starts = np.unique(codes[order], return_index=True)
+    bounds = list(starts[1:]) + [len(order)]
+    return {int(code): order[start:end] for code, start, end in zip(uniq, starts, bounds)}
+
+
+class CompiledSlate:
+    """Columnar view of a player list with precomputed index groups.
+
+    Row ``i`` of every array describes ``players[i]``. Groups hold index arrays
+    so optimizer rows and lineup totals can be built with NumPy fancy indexing
+    instead of scanning the player list.
+    """
+
+    def __init__(self, players: List[Player]):
+        self.players = list(players)
+        self.ids = [p.id for p in self.players]
+        self.index = {pid: i for i, pid in enumerate(self.ids)}
+        n = len(self.players)
+
+        self.salary = np.fromiter((p.salary for p in self.players), dtype=np.int64, count=n)
+        self.proj = np.fromiter((p.proj for p in self.players), dtype=np.float64, count=n)
+        # DST membership follows is_dst to stay robust to position naming
+        self.pos_code = np.fromiter(
+            (POSITION_CODES['DST'] if p.is_dst else POSITION_CODES.get(p.position, OTHER) for p in self.players),
+            dtype=np.int8,
+            count=n,
+        )
+        self.teams = sorted({p.team for p in self.players if p.team})
+        team_codes = {t: code for code, t in enumerate(self.teams)}
+        self.team_code = np.fromiter((team_codes.get(p.team, OTHER) for p in self.players), dtype=np.int32, count=n)
+
+        self.by_position = {POSITIONS[code]: idx for code, idx in _group_indices(self.pos_code).items() if code != OTHER}
+        self.by_team = {self.teams[code]: idx for code, idx in _group_indices(self.team_code).items() if code != OTHER}
+        # Combined key keeps the team x position grouping a single sort
+        combined = self.team_code.astype(np.int64) * len(POSITIONS) + self.pos_code
+        self.by_team_position: Dict[Tuple[str, str], np.ndarray] = {}
+        mask = np.flatnonzero((self.team_code != OTHER) & (self.pos_code != OTHER))
+        for key, idx in _group_indices(combined[mask]).items():
+            team, pos = divmod(key, len(POSITIONS))
+            self.by_team_position[(self.teams[team], POSITIONS[pos])] = mask[idx]
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def position(self, pos: str) -> np.ndarray:
+        return self.by_position.get(pos, np.empty(0, dtype=np.int64))
+
+    def team_position(self, team: str, pos: str) -> np.ndarray:
+        return self.by_team_position.get((team, pos), np.empty(0, dtype=np.int64))
+
+    def indices(self, player_ids: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.index[pid] for pid in player_ids), dtype=np.int64)
+
+    def lineup_salary(self, player_ids: Iterable[str]) -> int:
+        return int(self.salary[self.indices(player_ids)].sum())
+
+    def lineup_proj(self, player_ids: Iterable[str]) -> float:
+        return float(self.proj[self.indices(player_ids)].sum())
+
+
+def compile_slate(players) -> CompiledSlate:
+    """Return ``players`` as a CompiledSlate, compiling a plain list if needed."""
+    if isinstance(players, CompiledSlate):
+        return players
+    return CompiledSlate(players)
@@ -0,0 +1,58 @@
+import importlib.util
+from typing import Callable, Dict, List, Optional
+
+
+def _cbc_cmd(time_limit: Optional[float], threads: Optional[int], mip_gap: Optional[float], warm_start: bool):
+    # Bundled CBC binary: writes the model to a temp file and runs a subprocess per solve
+    import pulp
+    return pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit, threads=threads, gapRel=mip_gap, warmStart=warm_start)
+
+
+def _highs(time_limit: Optional[float], threads: Optional[int], mip_gap: Optional[float], warm_start: bool):
+    # In-process HiGHS through highspy: the model is handed over in memory, no file round-trip.
+    # PuLP's HiGHS interface takes no initial solution, so ``warm_start`` is ignored here.
+    if importlib.util.find_spec('highspy') is None:
+        raise ValueError("Solver backend 'highs' needs the optional highspy package (pip install highspy)")
+    import pulp
+    return pulp.HiGHS(msg=False, timeLimit=time_limit, threads=threads, gapRel=mip_gap)
+
+
+SOLVER_BACKENDS: Dict[str, Callable] = {
+    'cbc': _cbc_cmd,
+    'highs': _highs,
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the registered backends whose solver is installed."""
+    names = []
+    for name, factory in SOLVER_BACKENDS.items():
+        try:
+            if factory(None, None, None, False).available():
+                names.append(name)
+        except Exception:
+            continue
+    return names
+
+
+def make_solver(
+    backend: str = 'cbc',
+    time_limit: Optional[float] = None,
+    threads: Optional[int] = None,
+    mip_gap: Optional[float] = None,
+    warm_start: bool = False,
+):
+    """Build a PuLP solver for ``backend`` with the given limits.
+
+    ``time_limit`` is in seconds and ``mip_gap`` is a relative gap; ``None``
+    leaves the solver default. ``warm_start`` hands the variables' initial
+    values to the solver as a starting incumbent; only CBC uses it, HiGHS
+    solves from scratch. Raises ValueError for unknown or missing backends.
+    """
+    factory = SOLVER_BACKENDS.get(backend)
+    if factory is None:
+        raise ValueError(f"Unknown solver backend {backend!r}; expected one of {sorted(SOLVER_BACKENDS)}")
+    solver = factory(time_limit, threads, mip_gap, warm_start)
+    if not solver.available():
+        raise ValueError(f"Solver backend {backend!r} is not installed")
+    return solver
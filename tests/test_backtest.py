@@ -0,0 +1,117 @@
+import csv
+import os
+import sys
+
+import pytest
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src import backtest
+from src.data_sources import mock
+from src.presets import PRESET_CONFIGS
+from src.result_cache import ResultCache
+
+OPTIONS = dict(count=3, field_size=20, overrides={'engine': 'native'})
+
+
+def _write_week(archive, name, seed, proj_bump=0.0):
+    players = mock.generate_slate(n_teams=8, seed=seed)
+    with open(archive / f"{name}.csv", 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Pos', 'Team', 'Salary', 'Proj'])
+        for i, p in enumerate(players):
+            proj = p.proj + (proj_bump if i == 0 else 0.0)
+            writer.writerow([p.name, 'DEF' if p.is_dst else p.position, p.team, f"${p.salary:,}", proj])
+    with open(archive / f"{name}_actuals.csv", 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Pos', 'Team', 'Points'])
+        for i, p in enumerate(players):
+            writer.writerow([p.name, 'DEF' if p.is_dst else p.position, p.team, round(p.proj * (0.5 + (i % 5) / 4), 2)])
+
+
+def _archive(tmp_path):
+    archive = tmp_path / 'archive'
+    archive.mkdir()
+    for week in range(1, 4):
+        _write_week(archive, f"w{week}", seed=week)
+    (archive / 'notes.csv').write_text('no actuals for this one\n')
+    return archive
+
+
+def test_find_weeks_pairs_slates_with_actuals(tmp_path):
+    archive = _archive(tmp_path)
+    weeks = backtest.find_weeks(str(archive))
+    assert [os.path.basename(s) for s, _ in weeks] == ['w1.csv', 'w2.csv', 'w3.csv']
+    assert all(a.endswith('_actuals.csv') for _, a in weeks)
+
+
+def test_load_week_matches_actual_points(tmp_path):
+    archive = _archive(tmp_path)
+    week = backtest.load_week(str(archive / 'w1.csv'), str(archive / 'w1_actuals.csv'))
+    assert not week.unmatched
+    assert len(week.players) == len(week.actual_players) == len(week.actual)
+    assert [p.id for p in week.players] == [p.id for p in week.actual_players]
+
+
+
+def test_negative_actual_points_keep_their_sign(tmp_path):
+    archive = _archive(tmp_path)
+    players = mock.generate_slate(n_teams=8, seed=1)
+    with open(archive / 'w1_actuals.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Name', 'Pos', 'Team', 'Points'])
+        for p in players:
+            writer.writerow([p.name, 'DEF' if p.is_dst else p.position, p.team, -2 if p.is_dst else '-1.5' if p.position == 'QB' else 10])
+    week = backtest.load_week(str(archive / 'w1.csv'), str(archive / 'w1_actuals.csv'))
+    positions = {p.id: p.position for p in week.players}
+    for p, points in zip(week.players, week.actual):
+        assert points == (-2.0 if p.is_dst else -1.5 if positions[p.id] == 'QB' else 10.0)
+    assert min(p.proj for p in week.actual_players) == -2.0
+    assert backtest.parse_points('1,024.5') == 1024.5 and backtest.parse_points('-3 pts') == -3.0
+
+def test_backtest_reports_every_preset_and_week(tmp_path):
+    archive = _archive(tmp_path)
+    report = backtest.run_backtest(str(archive), **OPTIONS)
+    assert not report['errors']
+    assert sorted(report['weeks']) == ['w1', 'w2', 'w3']
+    assert sorted(report['summary']) == sorted(PRESET_CONFIGS)
+    for presets in report['weeks'].values():
+        for m in presets.values():
+            assert m['lineups'] == 3
+            assert 0.0 <= m['cash_rate'] <= 1.0 and 0.0 <= m['top_rate'] <= 1.0
+            assert 0.0 < m['efficiency'] <= 1.0 + 1e-9
+            assert m['cash_roi'] == m['cash_rate'] * backtest.DOUBLE_UP_PAYOUT - 1
+    assert report['summary']['default']['weeks'] == 3
+    assert 'all weeks' in backtest.format_report(report)
+
+
+def test_backtest_reruns_only_changed_weeks(tmp_path):
+    archive = _archive(tmp_path)
+    cache = ResultCache(str(tmp_path / 'cache'), max_entries=500)
+    first = backtest.run_backtest(str(archive), presets=['default', 'contrarian'], cache=cache, **OPTIONS)
+    assert first['jobs'] == 3 * 4 and first['cached'] == 0
+
+    second = backtest.run_backtest(str(archive), presets=['default', 'contrarian'], cache=cache, **OPTIONS)
+    assert second['jobs'] == 0 and second['cached'] == 12
+    assert second['summary'] == first['summary']
+
+    # New projections for one week: its field and presets are re-solved, its actual optimum is not
+    _write_week(archive, 'w2', seed=2, proj_bump=5.0)
+    third = backtest.run_backtest(str(archive), presets=['default', 'contrarian'], cache=cache, **OPTIONS)
+    assert third['jobs'] == 3 and third['cached'] == 9
+
+
+def test_backtest_workers_match_serial(tmp_path):
+    archive = _archive(tmp_path)
+    serial = backtest.run_backtest(str(archive), presets=['default'], **OPTIONS)
+    pooled = backtest.run_backtest(str(archive), presets=['default'], workers=2, **OPTIONS)
+    assert pooled['weeks'] == serial['weeks']
+
+
+def test_unknown_preset_is_rejected(tmp_path):
+    archive = _archive(tmp_path)
+    with pytest.raises(ValueError, match='nope'):
+        backtest.run_backtest(str(archive), presets=['nope'], **OPTIONS)
@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src import batch
+from src.data_sources import mock
+
+
+def _write_slate(tmp_path):
+    # A salary file plus an FFToolbox projection file, merged by the 'merge' source
+    with open(tmp_path / 'week.csv', 'w', encoding='utf-8') as f:
+        f.write('Name,Salary,Position,Team\n')
+        for p in mock.fetch_players_for_week():
+            f.write(f"{p.name},{p.salary},{p.position},{p.team}\n")
+    with open(tmp_path / 'proj.csv', 'w', encoding='utf-8') as f:
+        f.write('Player,Pos,Team,FPTS\n')
+        for p in mock.fetch_players_for_week():
+            f.write(f"{p.name},{p.position},{p.team},{p.proj}\n")
+
+
+def _write_config(tmp_path, runs, defaults=None):
+    path = tmp_path / 'runs.json'
+    path.write_text(json.dumps({'defaults': defaults or {}, 'runs': runs}))
+    return str(path)
+
+
+def test_load_config_applies_defaults_and_paths(tmp_path):
+    config = _write_config(tmp_path, [{'slate': 'a.csv', 'output': 'out/a.txt', 'projections': ['p.csv']}, {'name': 'b', 'count': 2}], defaults={'source': 'merge', 'count': 7})
+    first, second = batch.load_config(config)
+    assert first['name'] == 'run1' and first['count'] == 7 and first['source'] == 'merge'
+    assert first['slate'] == str(tmp_path / 'a.csv') and first['output'] == str(tmp_path / 'out' / 'a.txt')
+    assert first['projections'] == [str(tmp_path / 'p.csv')] and second['projections'] == []
+    assert second['name'] == 'b' and second['count'] == 2
+
+
+def test_slates_parsed_once(tmp_path, monkeypatch):
+    _write_slate(tmp_path)
+    calls = []
+    real = batch._LOADERS['merge']
+    monkeypatch.setitem(batch._LOADERS, 'merge', lambda path, projections: calls.append(path) or real(path, projections))
+    runs = batch.load_config(_write_config(tmp_path, [{'preset': 'cash'}, {'preset': 'contrarian'}], defaults={'slate': 'week.csv', 'source': 'merge', 'projections': ['proj.csv']}))
+    slates, errors = batch.load_slates(runs)
+    assert len(calls) == 1 and len(slates) == 1 and errors == {}
+    expected = {p.name: p.proj for p in mock.fetch_players_for_week()}
+    (players,) = slates.values()
+    assert {p.name: p.proj for p in players} == expected and all(proj > 0 for proj in expected.values())
+
+
+def test_failures_do_not_stop_other_jobs(tmp_path):
+    _write_slate(tmp_path)
+    runs = batch.load_config(_write_config(tmp_path, [
+        {'name': 'cash', 'preset': 'cash', 'overrides': {'overlap_max': 7}, 'output': 'out/cash.txt'},
+        {'name': 'bad-preset', 'preset': 'nope'},
+        {'name': 'missing', 'slate': 'missing.csv'},
+        {'name': 'stacks', 'preset': 'heavy_stacking', 'overrides': {'team_max': 3}, 'count': 2, 'output': 'out/stacks.txt'},
+        {'name': 'no-projections', 'source': 'merge', 'projections': ['missing.csv']},
+    ], defaults={'slate': 'week.csv', 'source': 'merge', 'projections': ['proj.csv'], 'count': 3}))
+    results = {r['name']: r for r in batch.run_batch(runs, workers=2)}
+    assert results['cash']['status'] == 'ok' and results['cash']['lineups'] == 3
+    assert results['stacks']['status'] == 'ok' and results['stacks']['lineups'] == 2
+    assert 'Unknown preset' in results['bad-preset']['error']
+    assert results['missing']['status'] == 'error'
+    assert results['no-projections']['status'] == 'error' and 'projections[0]' in results['no-projections']['error']
+    text = (tmp_path / 'out' / 'cash.txt').read_text()
+    assert text.count('Lineup') == 3
+    assert 'cash' in batch.format_summary(list(results.values()))
+
+
+def test_main_writes_summary(tmp_path):
+    config = _write_config(tmp_path, [{'name': 'mock', 'source': 'mock', 'count': 1}])
+    summary = tmp_path / 'summary.json'
+    assert batch.main([config, '--workers', '1', '--summary', str(summary)]) == 0
+    assert json.loads(summary.read_text())[0]['status'] == 'ok'
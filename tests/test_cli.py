@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src import cli
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['src.cli', '--source', 'mock', *args])
+    cli.main()
+
+
+@pytest.mark.parametrize('option', [
+    ['--time-budget', '5'],
+    ['--diversity', 'exposure'],
+    ['--max-exposure', '0.5'],
+    ['--exposure-penalty', '1'],
+    ['--result-cache'],
+])
+def test_parallel_rejects_options_it_cannot_honour(monkeypatch, capsys, option):
+    with pytest.raises(SystemExit) as exc:
+        _run(monkeypatch, '--count', '2', '--workers', '2', *option)
+    assert exc.value.code == 2
+    assert option[0] in capsys.readouterr().err
+
+
+def test_parallel_profile_records_partition_events(monkeypatch, tmp_path, capsys):
+    trace_path = tmp_path / 'trace.json'
+    _run(monkeypatch, '--count', '2', '--workers', '2', '--profile', str(trace_path))
+    trace = json.loads(trace_path.read_text())
+    assert trace['mode'] == 'parallel' and trace['lineups'] == 2
+    assert trace['iterations'] and all('partition' in event for event in trace['iterations'])
+
+
+@pytest.mark.parametrize('option', [
+    ['--engine', 'native'],
+    ['--workers', '2'],
+    ['--time-budget', '5'],
+    ['--diversity', 'exposure'],
+    ['--result-cache'],
+])
+def test_pool_mode_rejects_options_it_cannot_honour(monkeypatch, capsys, option):
+    with pytest.raises(SystemExit) as exc:
+        _run(monkeypatch, '--count', '2', '--mode', 'pool', *option)
+    assert exc.value.code == 2
+    assert option[0] in capsys.readouterr().err
+
+
+def test_pool_mode_profile_records_pool_rounds(monkeypatch, tmp_path, capsys):
+    trace_path = tmp_path / 'trace.json'
+    _run(monkeypatch, '--count', '2', '--mode', 'pool', '--pool-size', '20', '--solver', 'cbc', '--time-limit', '5', '--profile', str(trace_path))
+    trace = json.loads(trace_path.read_text())
+    assert trace['mode'] == 'pool' and trace['lineups'] == 2
+    assert trace['iterations'] and trace['iterations'][0]['stage'] == 'pool'
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.optimizer import generate_n_lineups, lineup_proj, lineup_salary
+
+
+@pytest.mark.parametrize('opts', [
+    dict(n=5),
+    dict(n=4, team_max=2, stack_penalty=3.0),
+    dict(n=4, overlap_max=7),
+    dict(n=4, avg_overlap_max=7.0, team_max=None),
+])
+def test_native_engine_matches_cbc(opts):
+    players = mock.fetch_players_for_week()
+    cbc = generate_n_lineups(players, **opts)
+    native = generate_n_lineups(players, engine='native', **opts)
+    assert [round(lineup_proj(lu), 4) for lu in native] == [round(lineup_proj(lu), 4) for lu in cbc]
+    for lu in native:
+        assert len(lu) == 9
+        assert lineup_salary(lu) <= 50000
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        generate_n_lineups(mock.fetch_players_for_week(), engine='gurobi')
@@ -0,0 +1,120 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import fetch
+from src.data_sources.ingest import SALARY_SCHEMA, read_csv_url
+
+SALARY_CSV = 'Name,Salary,Position,Team\nA B,5000,WR,GB\nC D,7000,QB,KC\n'
+# Stand-in server latency, so cold and warm fetches are clearly apart
+DELAY = 0.2
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        self.hits.append((self.path, self.headers.get('If-None-Match')))
+        time.sleep(DELAY)
+        if self.path == '/missing':
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = SALARY_CSV.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv; charset=utf-8')
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    _Handler.hits = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    previous_dir = fetch._config.cache_dir
+    fetch.configure(cache_dir=str(tmp_path / 'cache'), ttl=3600, max_bytes=10 * 1024 * 1024, offline=False, refresh=False)
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    fetch.configure(cache_dir=previous_dir, ttl=fetch.DEFAULT_TTL, max_bytes=fetch.DEFAULT_MAX_BYTES, offline=False, refresh=False)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def test_cold_then_warm(server):
+    url = server + '/salaries.csv'
+    cold, cold_s = _timed(lambda: fetch.fetch(url))
+    warm, warm_s = _timed(lambda: fetch.fetch(url))
+    assert not cold.from_cache and warm.from_cache
+    assert warm.text == SALARY_CSV
+    assert len(_Handler.hits) == 1
+    assert cold_s >= DELAY > warm_s
+    assert [p.name for p in read_csv_url(url, SALARY_SCHEMA)] == ['A B', 'C D']
+    assert len(_Handler.hits) == 1
+
+
+def test_revalidation_and_refresh(server):
+    url = server + '/salaries.csv'
+    fetch.fetch(url)
+    fetch.configure(ttl=0)
+    again = fetch.fetch(url)
+    assert again.from_cache and again.text == SALARY_CSV
+    assert _Handler.hits == [('/salaries.csv', None), ('/salaries.csv', '"v1"')]
+
+    fetch.configure(ttl=3600, refresh=True)
+    fetch.fetch(url)
+    assert len(_Handler.hits) == 3
+
+
+def test_offline(server):
+    url = server + '/salaries.csv'
+    fetch.fetch(url)
+    fetch.configure(offline=True, ttl=0)
+    assert fetch.fetch(url).text == SALARY_CSV
+    with pytest.raises(fetch.CacheMiss):
+        fetch.fetch(server + '/other.csv')
+    assert len(_Handler.hits) == 1
+
+
+def test_errors_not_cached(server):
+    with pytest.raises(requests.HTTPError):
+        fetch.fetch(server + '/missing')
+    with pytest.raises(requests.HTTPError):
+        fetch.fetch(server + '/missing')
+    assert len(_Handler.hits) == 2
+
+
+def test_size_bounded_eviction(server, tmp_path):
+    fetch.configure(max_bytes=len(SALARY_CSV) * 2)
+    for i in range(4):
+        fetch.fetch(f"{server}/s{i}.csv")
+        time.sleep(0.01)
+    bodies = [name for name in os.listdir(tmp_path / 'cache') if name.endswith('.body')]
+    assert len(bodies) == 2
+    assert fetch.fetch(f"{server}/s3.csv").from_cache
+    assert not fetch.fetch(f"{server}/s0.csv").from_cache
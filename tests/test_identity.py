@@ -0,0 +1,65 @@
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources.identity import IdentityIndex, canonical_key, load_aliases, normalize_name, normalize_team, save_aliases
+from src.data_sources.mock import generate_slate
+from src.models import Player
+
+
+def _player(pid, name, team, position='WR'):
+    return Player(id=pid, name=name, position=position, team=team, opponent=None, proj=0.0, salary=0, is_dst=position == 'DST')
+
+
+def test_normalization():
+    assert normalize_name('A.J. Brown Jr.') == 'aj brown'
+    assert normalize_name("Ja'Marr  Chase") == 'jamarr chase'
+    assert normalize_name('Amon-Ra St. Brown') == 'amon ra st brown'
+    assert normalize_name('Kenneth Walker III') == 'kenneth walker'
+    assert normalize_name('José Núñez') == 'jose nunez'
+    assert normalize_team('jac') == 'JAX' and normalize_team('KC') == 'KC'
+    assert canonical_key(_player('a', 'Chiefs D/ST', 'KC', 'DST')) == canonical_key(_player('b', 'Kansas City', 'kan', 'DST'))
+
+
+def test_resolve_exact_fuzzy_and_unmatched():
+    base = [
+        _player('CSV_PHI_A.J._Brown', 'A.J. Brown', 'PHI'),
+        _player('CSV_SEA_Kenneth_Walker_III', 'Kenneth Walker III', 'SEA', 'RB'),
+        _player('CSV_DET_Amon-Ra_St._Brown', 'Amon-Ra St. Brown', 'DET'),
+    ]
+    other = [
+        _player('FT_PHI_AJ_Brown', 'AJ Brown', 'PHI'),
+        _player('FT_SEA_Ken_Walker', 'Ken Walker', 'SEA', 'RB'),
+        _player('FT_DET_Amon-Ra_Brown', 'Amon-Ra Brown', 'DET'),
+        _player('FT_DET_Unknown', 'Someone Else', 'DET', 'TE'),
+    ]
+    index = IdentityIndex(base)
+    result = index.resolve(other)
+    assert result.matches == {0: 0, 1: 1, 2: 2}
+    assert set(result.fuzzy) == {1, 2}
+    assert [p.name for p in result.unmatched] == ['Someone Else']
+    assert index.aliases[canonical_key(other[1])] == canonical_key(base[1])
+
+
+def test_aliases_round_trip(tmp_path):
+    path = str(tmp_path / 'aliases.json')
+    assert load_aliases(path) == {}
+    base = [_player('a', 'Gabe Davis', 'JAX')]
+    # Too different for the fuzzy pass, so only the alias table can join them
+    nickname = _player('b', 'Gabriel Davis', 'JAX')
+    save_aliases(path, {canonical_key(nickname): canonical_key(base[0])})
+    assert IdentityIndex(base).resolve([nickname]).unmatched == [nickname]
+    result = IdentityIndex(base, aliases=load_aliases(path)).resolve([nickname])
+    assert result.matches == {0: 0} and not result.fuzzy
+
+
+def test_large_exact_join():
+    base = generate_slate(players_per_position={'QB': 20, 'RB': 40, 'WR': 60, 'TE': 30, 'DST': 1}, seed=1)
+    renamed = [_player(f"FT_{p.id}", p.name.upper() + ' Jr.', p.team.lower(), 'DST' if p.is_dst else p.position) for p in reversed(base)]
+    result = IdentityIndex(base).resolve(renamed)
+    assert len(result.matches) == len(base) and not result.fuzzy and not result.unmatched
+    assert all(base[i].id == renamed[j].id[3:] for j, i in result.matches.items())
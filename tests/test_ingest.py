@@ -0,0 +1,48 @@
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import fftoolbox, web
+from src.data_sources.ingest import normalize_position, parse_proj, parse_salary
+
+
+FFT_CSV = (
+    'Player,Name,Pos,Team,DK Salary,FPTS\n'
+    '"  Josh   Allen ",,QB,buf,"$8,100",24.5\n'
+    ',Backup Name,Def,kc,3000,7 pts\n'
+    ',,WR,ne,4000,9\n'
+    'Short Row,,TE\n'
+)
+
+
+def test_fftoolbox_rows():
+    players = fftoolbox._parse_csv_text(FFT_CSV)
+    assert [p.name for p in players] == ['Josh Allen', 'Backup Name', 'Short Row']
+    allen, dst, short = players
+    assert (allen.id, allen.team, allen.salary, allen.proj, allen.position) == ('FT_BUF_Josh_Allen', 'BUF', 8100, 24.5, 'QB')
+    assert dst.is_dst and dst.position == 'DST' and dst.proj == 7.0
+    assert (short.salary, short.proj, short.team) == (0, 0.0, '')
+
+
+def test_parse_csv_file_streams(tmp_path):
+    path = tmp_path / 'fft.csv'
+    path.write_text('\ufeff' + FFT_CSV, encoding='utf-8')
+    assert fftoolbox.parse_csv_file(str(path)) == fftoolbox._parse_csv_text(FFT_CSV)
+    assert fftoolbox.parse_csv_file(str(tmp_path / 'missing.csv')) == []
+
+
+def test_salary_csv():
+    players = web._parse_salary_csv('Name,Salary,Position,Team\nA B,"$5,000",wr,gb\n,4000,RB,KC\nDef,2500,DST,kc\n')
+    assert [(p.id, p.salary, p.position, p.is_dst) for p in players] == [('CSV_GB_A_B', 5000, 'WR', False), ('CSV_KC_Def', 2500, 'DST', True)]
+    with_proj = web._parse_salary_csv('Name,Salary,Position,Team,Proj\nA B,5000,WR,GB,14.2\n')
+    assert [p.proj for p in players + with_proj] == [0.0, 0.0, 0.0]
+
+
+def test_value_parsers():
+    assert parse_salary('7300') == 7300 and parse_salary('$7,300') == 7300 and parse_salary('n/a') == 0
+    assert parse_proj('12.5') == 12.5 and parse_proj('1.2.3') == 0.0
+    assert [normalize_position(p) for p in ('qb', 'WR/FLEX', 'D/ST', 'DEF', 'K')] == ['QB', 'WR', 'DST', 'DST', 'K']
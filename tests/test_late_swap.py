@@ -0,0 +1,53 @@
+import os
+import sys
+from collections import Counter
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.late_swap import late_swap
+from src.optimizer import generate_n_lineups, lineup_salary
+from src.roster import DK_SALARY_CAP
+
+
+def _setup():
+    players = mock.generate_slate(n_teams=8, seed=5)
+    lineups = [sorted(lu) for lu in generate_n_lineups(players, n=6, overlap_max=6)]
+    teams = sorted({p.team for p in players})
+    locked = {p.id for p in players if p.team in teams[:3]}
+    open_in_lineups = sorted({pid for lu in lineups for pid in lu} - locked)
+    return players, lineups, locked, set(open_in_lineups[:2])
+
+
+def test_late_swap_keeps_locks_and_rules():
+    players, lineups, locked, unavailable = _setup()
+    positions = {p.id: ('DST' if p.is_dst else p.position) for p in players}
+    teams = {p.id: p.team for p in players}
+    events = []
+    swapped = late_swap(lineups, players, locked=locked, unavailable=unavailable, team_max=3, on_iteration=events.append)
+    assert len(swapped) == len(lineups)
+    assert [e['iteration'] for e in events] == list(range(len(lineups)))
+    for before, after, event in zip(lineups, swapped, events):
+        assert event['status'] == 'Optimal'
+        assert len(after) == 9 and lineup_salary(after) <= DK_SALARY_CAP
+        assert {pid for pid in before if pid in locked} == {pid for pid in after if pid in locked}
+        assert not unavailable & set(after)
+        assert max(Counter(teams[pid] for pid in after).values()) <= 3
+        counts = Counter(positions[pid] for pid in after)
+        assert counts['QB'] == 1 and counts['DST'] == 1 and counts['RB'] >= 2 and counts['WR'] >= 3 and counts['TE'] >= 1
+        assert event['locked'] == sum(pid in locked for pid in before)
+        assert event['variables'] < len(players)
+
+
+def test_late_swap_parallel_and_fully_locked():
+    players, lineups, locked, unavailable = _setup()
+    sequential = late_swap(lineups, players, locked=locked, unavailable=unavailable)
+    parallel = late_swap(lineups, players, locked=locked, unavailable=unavailable, workers=2)
+    assert [sorted(lu) for lu in parallel] == [sorted(lu) for lu in sequential]
+    events = []
+    everyone = {p.id for p in players}
+    assert [sorted(lu) for lu in late_swap(lineups[:2], players, locked=everyone, on_iteration=events.append)] == lineups[:2]
+    assert [e['status'] for e in events] == ['Locked', 'Locked']
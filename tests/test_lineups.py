@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.lineups import LineupArray, overlap_report
+from src.optimizer import generate_n_lineups, lineup_proj, lineup_salary
+from src.slate import compile_slate
+
+
+def test_lineup_array_matches_dicts():
+    slate = compile_slate(mock.fetch_players_for_week())
+    lineups = generate_n_lineups(slate, n=3)
+    array = LineupArray.from_dicts(slate, lineups)
+    assert len(array) == 3 and array.rows.dtype == np.uint16 and array.nbytes == 3 * 9 * 2
+    assert array.salary().tolist() == [lineup_salary(lu) for lu in lineups]
+    assert np.allclose(array.proj(), [lineup_proj(lu) for lu in lineups])
+    assert array.to_dicts() == lineups
+    expected = [len(set(lu) & set(lineups[0])) for lu in lineups]
+    assert array.overlap(array[0]).tolist() == expected
+    assert list(array)[1] == array[1] == tuple(sorted(slate.index[pid] for pid in lineups[1]))
+
+
+def test_player_is_slotted():
+    player = mock.fetch_players_for_week()[0]
+    assert not hasattr(player, '__dict__')
+
+
+def test_overlap_report():
+    slate = compile_slate(mock.fetch_players_for_week())
+    lineups = generate_n_lineups(slate, n=3, overlap_max=7)
+    array = LineupArray.from_dicts(slate, lineups)
+    shared = [len(set(a) & set(b)) for i, a in enumerate(lineups) for b in lineups[:i]]
+    report = overlap_report(array, overlap_max=6, avg_overlap_max=6.5)
+    assert report['lineups'] == 3 and report['max_overlap'] == max(shared) == 7
+    assert report['overlap_excess'] == 1 and report['pairs_over'] == sum(s > 6 for s in shared)
+    assert report['avg_overlap_excess'] == max(0.0, report['max_avg_overlap'] - 6.5)
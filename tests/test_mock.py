@@ -0,0 +1,30 @@
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources.mock import generate_slate
+from src.optimizer import generate_n_lineups, lineup_salary
+
+
+def test_generate_slate_is_reproducible():
+    a = generate_slate(n_teams=4, seed=7)
+    b = generate_slate(n_teams=4, seed=7)
+    assert [(p.id, p.salary, p.proj) for p in a] == [(p.id, p.salary, p.proj) for p in b]
+    assert [p.proj for p in generate_slate(n_teams=4, seed=8)] != [p.proj for p in a]
+
+
+def test_generate_slate_shape():
+    players = generate_slate(n_teams=6, players_per_position={'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1, 'DST': 1},
+                             salary_ranges={'QB': (6000, 6000), 'RB': (4000, 5000), 'WR': (3000, 5000), 'TE': (2500, 4000), 'DST': (2000, 3000)})
+    assert len(players) == 6 * 8
+    assert all(p.salary == 6000 for p in players if p.position == 'QB')
+    assert all(p.is_dst == (p.position == 'DST') for p in players)
+    opponents = {p.team: p.opponent for p in players}
+    assert all(opponents[opp] == team for team, opp in opponents.items())
+    lineups = generate_n_lineups(players, n=2)
+    assert len(lineups) == 2
+    assert all(lineup_salary(lu) <= 50000 for lu in lineups)
@@ -1,14 +1,19 @@
 # Overwrite malformed file: ensure project root is on sys.path then import src
+import importlib.util
 import os
 import sys
 
+import pytest
+
 # Ensure repo root is on sys.path so `src` package can be imported during tests
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from src.data_sources import mock
-from src.optimizer import generate_n_lineups, lineup_salary, lineup_proj
+from src.models import Player
+from src.optimizer import generate_n_lineups, iter_lineups, lineup_salary, lineup_proj
+from src.solvers import available_backends, make_solver
 
 
 def test_generate_three_lineups():
@@ -19,3 +24,102 @@ def test_generate_three_lineups():
         assert lineup_salary(lu) <= 50000
         assert abs(lineup_proj(lu)) >= 0
 
+
+
+def test_incremental_matches_rebuild():
+    players = mock.fetch_players_for_week()
+    opts = dict(n=4, overlap_max=7, avg_overlap_max=6.5)
+    rebuilt = generate_n_lineups(players, **opts)
+    incremental = generate_n_lineups(players, incremental=True, **opts)
+    assert [round(lineup_proj(lu), 4) for lu in rebuilt] == [round(lineup_proj(lu), 4) for lu in incremental]
+    for lu in incremental:
+        assert len(lu) == 9
+        assert lineup_salary(lu) <= 50000
+
+
+def test_solver_backends():
+    with pytest.raises(ValueError):
+        make_solver('nope')
+    players = mock.fetch_players_for_week()
+    expected = [round(lineup_proj(lu), 4) for lu in generate_n_lineups(players, n=2)]
+    for backend in available_backends():
+        lineups = generate_n_lineups(players, n=2, solver=backend, time_limit=30, threads=1, mip_gap=0.0)
+        assert [round(lineup_proj(lu), 4) for lu in lineups] == expected
+
+
+@pytest.mark.skipif(importlib.util.find_spec('highspy') is not None, reason='highspy is installed')
+def test_highs_without_highspy_is_a_clear_error():
+    assert 'highs' not in available_backends()
+    with pytest.raises(ValueError, match='highspy'):
+        make_solver('highs')
+
+
+@pytest.mark.skipif(importlib.util.find_spec('highspy') is None, reason='needs the optional highspy package')
+def test_highs_matches_cbc():
+    players = mock.fetch_players_for_week()
+    expected = [round(lineup_proj(lu), 4) for lu in generate_n_lineups(players, n=3)]
+    lineups = generate_n_lineups(players, n=3, solver='highs', warm_start=[[p.id for p in generate_n_lineups(players, n=1)[0]]])
+    assert [round(lineup_proj(lu), 4) for lu in lineups] == expected
+
+
+def test_iteration_events():
+    players = mock.fetch_players_for_week()
+    for engine in ('milp', 'native'):
+        events = []
+        lineups = generate_n_lineups(players, n=3, incremental=True, engine=engine, on_iteration=events.append)
+        assert events
+        for event in events:
+            assert event['engine'] == engine
+            assert event['status'] == 'Optimal'
+            assert min(event['build_s'], event['solve_s'], event['extract_s']) >= 0
+        if engine == 'milp':
+            assert [e['iteration'] for e in events] == [0, 1, 2]
+            assert [round(e['objective'], 4) for e in events] == [round(lineup_proj(lu), 4) for lu in lineups]
+            assert events[1]['constraints'] > events[0]['constraints']
+
+
+def test_iter_lineups_streams():
+    players = mock.fetch_players_for_week()
+    expected = [round(lineup_proj(lu), 4) for lu in generate_n_lineups(players, n=3, incremental=True)]
+    for engine in ('milp', 'native'):
+        events = []
+        stream = iter_lineups(players, n=3, incremental=True, engine=engine, overlap_max=8, on_iteration=events.append)
+        lineup, stats = next(stream)
+        assert round(lineup_proj(lineup), 4) == expected[0]
+        assert stats is events[0] and stats['iteration'] == 0 and stats['engine'] == engine
+        assert [round(lineup_proj(lu), 4) for lu, _ in stream] == expected[1:]
+        # Nobody listening: no events are built
+        assert [stats for _, stats in iter_lineups(players, n=3, engine=engine, overlap_max=8)] == [None] * 3
+    assert generate_n_lineups(players, n=3, time_budget=0) == []
+
+
+def test_exposure_diversity_keeps_model_size():
+    players = mock.generate_slate(n_teams=8, seed=3)
+    events = []
+    lineups = generate_n_lineups(players, n=12, overlap_max=6, avg_overlap_max=4, diversity='exposure',
+                                 max_exposure=0.5, exposure_penalty=0.5, on_iteration=events.append)
+    assert len(lineups) == 12
+    assert len({frozenset(lu) for lu in lineups}) == 12
+    # One aggregated avg-overlap row from the second lineup on, nothing per earlier lineup
+    assert len({e['constraints'] for e in events[1:]}) == 1
+    assert all(sum(pid in lu for lu in lineups) <= 6 for pid in {pid for lu in lineups for pid in lu})
+    for k, lu in enumerate(lineups[1:], start=1):
+        shared = [len(set(lu) & set(prev)) for prev in lineups[:k]]
+        assert max(shared) == events[k]['max_overlap']
+        assert sum(shared) <= 4 * k
+    with pytest.raises(ValueError):
+        generate_n_lineups(players, n=1, diversity='random')
+
+
+def test_exposure_penalty_is_not_pruned_away():
+    # Equal salaries and slowly falling projections: the penalty should walk down the depth charts
+    players = [
+        Player(id=f"{pos}{i}", name=f"{pos}{i}", position=pos, team=f"T{i}", opponent=None,
+               proj=20.0 - 0.1 * i, salary=5000, is_dst=(pos == 'DST'))
+        for pos in ('QB', 'RB', 'WR', 'TE', 'DST') for i in range(20)
+    ]
+    opts = dict(n=6, diversity='exposure', exposure_penalty=5.0, team_max=None)
+    pruned = generate_n_lineups(players, **opts)
+    full = generate_n_lineups(players, prune=False, **opts)
+    assert [round(lineup_proj(lu), 4) for lu in pruned] == [round(lineup_proj(lu), 4) for lu in full]
+    assert [round(lineup_proj(lu), 1) for lu in full][-3:] == [173.8, 171.9, 170.0]
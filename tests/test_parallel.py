@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.optimizer import generate_n_lineups, lineup_proj
+from src import parallel
+from src.parallel import generate_n_lineups_parallel
+
+
+def test_parallel_matches_sequential_top_n():
+    players = mock.fetch_players_for_week()
+    sequential = generate_n_lineups(players, n=4)
+    parallel = generate_n_lineups_parallel(players, n=4, workers=2, per_partition=4)
+    assert [round(lineup_proj(lu), 4) for lu in parallel] == [round(lineup_proj(lu), 4) for lu in sequential]
+
+
+def test_parallel_is_deterministic_and_respects_overlap():
+    players = mock.fetch_players_for_week()
+    first = generate_n_lineups_parallel(players, n=3, workers=2, seed=7, overlap_max=7)
+    second = generate_n_lineups_parallel(players, n=3, workers=1, seed=7, overlap_max=7)
+    assert [sorted(lu) for lu in first] == [sorted(lu) for lu in second]
+    for i, lu in enumerate(first):
+        for other in first[:i]:
+            assert len(set(lu) & set(other)) <= 7
+
+
+def test_parallel_fills_n_under_overlap_limits():
+    players = mock.generate_slate(n_teams=6, seed=0)
+    for limits in ({'overlap_max': 4}, {'avg_overlap_max': 2.0}):
+        lineups = generate_n_lineups_parallel(players, n=8, workers=1, **limits)
+        assert len(lineups) == 8
+        for i, lu in enumerate(lineups):
+            overlaps = [len(set(lu) & set(other)) for other in lineups[:i]]
+            if 'overlap_max' in limits:
+                assert max(overlaps, default=0) <= 4
+            else:
+                assert sum(overlaps) <= 2.0 * i
+
+
+def test_parallel_rounds_fill_n_without_sequential_backfill(monkeypatch):
+    players = mock.generate_slate(n_teams=4, seed=0)
+    full_slate = []
+    real = parallel.generate_n_lineups
+    # Partition solves run in the worker processes; only the full-slate backfill runs here
+    monkeypatch.setattr(parallel, 'generate_n_lineups', lambda ps, **kw: full_slate.append(kw) or real(ps, **kw))
+    lineups = generate_n_lineups_parallel(players, n=8, workers=4, partition_by='DST', per_partition=1, overlap_max=4)
+    assert len(lineups) == 8 and full_slate == []
+    for i, lu in enumerate(lineups):
+        assert all(len(set(lu) & set(other)) <= 4 for other in lineups[:i])
+
+
+def test_previous_lineups_continue_the_chain():
+    players = mock.generate_slate(n_teams=6, seed=0)
+    chain = generate_n_lineups(players, n=4, overlap_max=5)
+    rest = generate_n_lineups(players, n=2, overlap_max=5, previous=[list(lu) for lu in chain[:2]])
+    assert [sorted(lu) for lu in rest] == [sorted(lu) for lu in chain[2:]]
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import pipeline
+from src.models import Player
+
+
+def _player(name, team, proj=0.0, salary=0, position='WR'):
+    is_dst = position == 'DST'
+    return Player(id=f"X_{team}_{name}", name=name, position=position, team=team, opponent=None, proj=proj, salary=salary, is_dst=is_dst)
+
+
+def test_fetch_all_runs_concurrently():
+    def slow(players, delay):
+        def load():
+            time.sleep(delay)
+            return players
+        return load
+
+    def broken():
+        raise RuntimeError('down')
+
+    sources = {f"s{i}": slow([_player(f"P{i}", 'KC')], 0.3) for i in range(3)}
+    sources['broken'] = broken
+    by_source, timings, errors = pipeline.fetch_all(sources)
+    assert timings['total'] < 0.6
+    assert all(timings[f"s{i}"] >= 0.3 for i in range(3))
+    assert by_source['broken'] == [] and 'down' in errors['broken']
+
+
+def test_merge_players():
+    salaries = [_player('Josh Allen', 'BUF', salary=8100, position='QB'), _player('Bills D/ST', 'BUF', salary=3000, position='DST'), _player('Nobody', 'NE', salary=4000)]
+    first = [_player('josh  allen', 'BUF', proj=24.0, position='QB'), _player('Buffalo', 'BUF', proj=8.0, position='DST'), _player('Extra', 'KC', proj=10.0)]
+    second = [_player('Josh Allen', 'BUF', proj=22.0, position='QB')]
+    merged, unmatched = pipeline.merge_players(salaries, [first, second])
+    assert [(p.name, p.salary, p.proj) for p in merged] == [('Josh Allen', 8100, 23.0), ('Bills D/ST', 3000, 8.0), ('Nobody', 4000, 0.0)]
+    assert [[p.name for p in missing] for missing in unmatched] == [['Extra'], []]
+
+
+def test_load_players_from_files(tmp_path):
+    salary_path = tmp_path / 'salaries.csv'
+    salary_path.write_text('Name,Salary,Position,Team\nA B,5000,WR,GB\nC D,7000,QB,KC\n', encoding='utf-8')
+    proj_path = tmp_path / 'proj.csv'
+    proj_path.write_text('Name,Pos,Team,Salary,Proj\nA B,WR,GB,$4800,15.5\n', encoding='utf-8')
+    result = pipeline.load_players(str(salary_path), [str(proj_path)])
+    assert [(p.name, p.salary, p.proj) for p in result.players] == [('A B', 5000, 15.5), ('C D', 7000, 0.0)]
+    assert set(result.timings) == {'salaries', 'projections[0]', 'total', 'merge'}
+    assert not result.errors
@@ -0,0 +1,75 @@
+import csv
+import dataclasses
+import io
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.lineups import LineupArray
+from src.optimizer import generate_n_lineups, lineup_proj, lineup_salary
+from src.pool_file import DK_SLOTS, PoolWriter, open_pool, write_dk_csv, write_pool
+from src.slate import compile_slate
+
+
+def _lineups():
+    slate = compile_slate(mock.generate_slate(n_teams=8, seed=2))
+    return slate, generate_n_lineups(slate, n=6, overlap_max=6)
+
+
+def test_pool_round_trip(tmp_path):
+    slate, lineups = _lineups()
+    path = str(tmp_path / 'pool.dkpool')
+    assert write_pool(path, slate, lineups) == 6
+    pool = open_pool(path)
+    assert len(pool) == 6 and pool.slate.players == slate.players
+    assert isinstance(pool.records, np.memmap)
+    array = pool.lineups()
+    assert np.shares_memory(array.rows, pool.records)
+    assert [sorted(lu) for lu in array.to_dicts()] == [sorted(lu) for lu in lineups]
+    assert pool.salary.tolist() == [lineup_salary(lu) for lu in lineups]
+    assert np.allclose(pool.proj, [lineup_proj(lu) for lu in lineups], atol=1e-3)
+    assert [sorted(lu) for lu in pool.lineups(2, 4).to_dicts()] == [sorted(lu) for lu in lineups[2:4]]
+
+
+def test_pool_writer_appends_chunks_from_other_slates(tmp_path):
+    slate, lineups = _lineups()
+    # Same players in another row order, as the optimizer's pruned slates have
+    other = compile_slate(list(reversed(slate.players)))
+    path = str(tmp_path / 'pool.dkpool')
+    with PoolWriter(path, slate) as writer:
+        writer.write(LineupArray.from_dicts(other, lineups[:3]))
+        writer.write(iter(lineups[3:]))
+    assert [sorted(lu) for lu in open_pool(path).lineups().to_dicts()] == [sorted(lu) for lu in lineups]
+    empty = str(tmp_path / 'empty.dkpool')
+    write_pool(empty, slate, [])
+    assert len(open_pool(empty)) == 0
+    (tmp_path / 'bad.dkpool').write_bytes(b'not a pool')
+    with pytest.raises(ValueError):
+        open_pool(str(tmp_path / 'bad.dkpool'))
+
+
+def test_dk_csv_slots():
+    slate, lineups = _lineups()
+    # A name that needs CSV quoting, on a player the first lineup uses
+    quoted = slate.index[next(iter(lineups[0]))]
+    slate = compile_slate([dataclasses.replace(p, name='Smith, "Jr"') if i == quoted else p for i, p in enumerate(slate.players)])
+    lineups = [{pid: slate.players[slate.index[pid]] for pid in lu} for lu in lineups]
+    buf = io.StringIO()
+    assert write_dk_csv(buf, [LineupArray.from_dicts(slate, lineups[:2]), LineupArray.from_dicts(slate, lineups[2:])]) == 6
+    rows = list(csv.reader(io.StringIO(buf.getvalue())))
+    assert tuple(rows[0]) == DK_SLOTS
+    by_label = {f"{p.name} ({p.id})": p for p in slate.players}
+    for row, lineup in zip(rows[1:], lineups):
+        players = [by_label[cell] for cell in row]
+        assert sorted(p.id for p in players) == sorted(lineup)
+        for slot, p in zip(DK_SLOTS, players):
+            position = 'DST' if p.is_dst else p.position
+            assert position in ('RB', 'WR', 'TE') if slot == 'FLEX' else position == slot
@@ -0,0 +1,58 @@
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.models import Player
+from src.optimizer import generate_n_lineups, lineup_proj
+from src.pruning import prune_players
+from src.roster import MAX_FILL
+
+
+def _wr(i, team, salary, proj):
+    return Player(id=f"W{i}", name=f"W{i}", position='WR', team=team, opponent=None, proj=proj, salary=salary)
+
+
+def test_prune_drops_dominated_and_zero_rows():
+    wrs = [_wr(i, f"T{i}", 5000, 20.0 - i) for i in range(5)]
+    wrs.append(_wr(9, 'T9', 6000, 10.0))  # dominated by all five above
+    wrs.append(_wr(10, 'T10', 2500, 0.0))  # cheap but never scores
+    kept = {p.id for p in prune_players(wrs, n=1, team_max=None)}
+    assert 'W9' not in kept
+    assert 'W10' not in kept
+    assert {'W0', 'W1', 'W2', 'W3'} <= kept
+
+
+def test_prune_keeps_ties_and_respects_team_max():
+    # Identical players must not knock each other out
+    twins = [_wr(i, 'T0', 5000, 10.0) for i in range(4)]
+    assert len(prune_players(twins, n=1, team_max=None)) == 4
+    # With team_max, dominators on teams that may be full do not count
+    wrs = [_wr(i, 'A', 4000, 20.0) for i in range(4)] + [_wr(9, 'B', 6000, 10.0)]
+    assert 'W9' in {p.id for p in prune_players(wrs, n=1, team_max=3)}
+    assert 'W9' not in {p.id for p in prune_players(wrs, n=1, team_max=None)}
+
+
+def test_zero_rows_kept_when_overlap_limits_need_them():
+    # Exactly enough 10-point players to fill one lineup; the rest score 0
+    players = []
+    for pos, k in MAX_FILL.items():
+        for i in range(k + 6):
+            players.append(Player(
+                id=f"{pos}{i}", name=f"{pos}{i}", position=pos, team=f"{pos}{i}", opponent=None,
+                proj=10.0 if i < k else 0.0, salary=4000, is_dst=(pos == 'DST'),
+            ))
+    opts = dict(n=5, overlap_max=6, team_max=None)
+    assert len(generate_n_lineups(players, **opts)) == len(generate_n_lineups(players, prune=False, **opts)) == 5
+
+
+def test_pruning_keeps_optimum():
+    players = mock.fetch_players_for_week()
+    opts = dict(n=3, overlap_max=7, stack_penalty=2.0)
+    full = generate_n_lineups(players, prune=False, **opts)
+    pruned = generate_n_lineups(players, **opts)
+    assert [round(lineup_proj(lu), 4) for lu in full] == [round(lineup_proj(lu), 4) for lu in pruned]
@@ -0,0 +1,102 @@
+import dataclasses
+import os
+import sys
+import time
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.optimizer import generate_n_lineups, lineup_proj
+from src.result_cache import ResultCache, iter_lineups_cached, options_key, run_finished, slate_key, structure_key
+
+
+def _run(cache, players, events=None, **options):
+    return [lu for lu, _ in iter_lineups_cached(cache, players, on_iteration=events.append if events is not None else None, **options)]
+
+
+def test_keys():
+    players = mock.fetch_players_for_week()
+    bumped = [dataclasses.replace(p, proj=p.proj + 1) if i == 0 else p for i, p in enumerate(players)]
+    assert slate_key(players) == slate_key(list(reversed(players)))
+    assert slate_key(players) != slate_key(bumped)
+    assert structure_key(players) == structure_key(bumped)
+    assert options_key({'n': 3, 'time_budget': 5}) == options_key({'n': 3})
+    assert options_key({'n': 3}) != options_key({'n': 3, 'team_max': 2})
+
+
+def test_hit_and_warm_start(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    players = mock.fetch_players_for_week()
+    events = []
+    first = _run(cache, players, events, n=3, overlap_max=7, preset='cash')
+    assert len(events) == 3
+    events.clear()
+    assert _run(cache, players, events, n=3, overlap_max=7, preset='cash') == first
+    assert events == []
+    # Another preset is another entry
+    _run(cache, players, events, n=3, overlap_max=7)
+    assert len(events) == 3
+
+    bumped = [dataclasses.replace(p, proj=p.proj + 2) if p.position == 'WR' else p for p in players]
+    assert cache.get(bumped, {'n': 3, 'overlap_max': 7, 'preset': 'cash'}) is None
+    assert cache.similar(bumped, {'n': 3, 'overlap_max': 7, 'preset': 'cash'}) == [list(lu) for lu in first]
+    warm = _run(cache, bumped, n=3, overlap_max=7, preset='cash')
+    cold = generate_n_lineups(bumped, n=3, overlap_max=7)
+    assert [round(lineup_proj(lu), 4) for lu in warm] == [round(lineup_proj(lu), 4) for lu in cold]
+
+
+def test_partial_runs_not_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    players = mock.fetch_players_for_week()
+    stream = iter_lineups_cached(cache, players, n=3)
+    next(stream)
+    stream.close()
+    assert _run(cache, players, n=3, time_budget=0) == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_entries=2)
+    players = mock.fetch_players_for_week()
+    for n in (1, 2, 3):
+        _run(cache, players, n=n)
+        time.sleep(0.01)
+    assert len(os.listdir(tmp_path)) == 2
+    assert cache.get(players, {'n': 1, 'preset': None}) is None
+    assert cache.get(players, {'n': 3, 'preset': None}) is not None
+
+
+def test_runs_with_unproven_solves_not_stored(tmp_path, monkeypatch):
+    from src import result_cache
+
+    real = result_cache.iter_lineups
+
+    def time_limited(players, on_iteration=None, **options):
+        # As CBC reports a time-limited incumbent: status 'Optimal', not proven
+        def record(event):
+            on_iteration(dict(event, proven=event['iteration'] != 1))
+        return real(players, on_iteration=record, **options)
+
+    cache = ResultCache(str(tmp_path))
+    players = mock.fetch_players_for_week()
+    monkeypatch.setattr(result_cache, 'iter_lineups', time_limited)
+    assert len(_run(cache, players, n=3, overlap_max=7, time_limit=1)) == 3
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setattr(result_cache, 'iter_lineups', real)
+    events = []
+    _run(cache, players, events, n=3, overlap_max=7, time_limit=1)
+    assert all(e['proven'] for e in events)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_run_finished():
+    done = {'status': 'Optimal', 'proven': True}
+    assert run_finished([done, done], 2, 2)
+    assert not run_finished([done, dict(done, proven=False)], 2, 2)
+    assert run_finished([done, {'status': 'Infeasible', 'proven': True}], 1, 5)
+    assert not run_finished([done, {'status': 'Not Solved', 'proven': False}], 1, 5)
+    assert not run_finished([done], 1, 5)
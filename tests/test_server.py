@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src import server
+from src.data_sources import mock
+from src.models import Player
+from src.optimizer import generate_n_lineups
+
+
+def _players(seed=3):
+    return [
+        {'id': p.id, 'name': p.name, 'position': p.position, 'team': p.team, 'opponent': p.opponent,
+         'proj': p.proj, 'salary': p.salary, 'is_dst': p.is_dst}
+        for p in mock.generate_slate(n_teams=8, seed=seed)
+    ]
+
+
+@pytest.fixture
+def base_url():
+    httpd = server.make_server(port=0, workers=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    httpd.service.close()
+
+
+def _call(base_url, method, path, body=None):
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    req = urllib.request.Request(base_url + path, data=data, method=method, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            text = resp.read().decode('utf-8')
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read().decode('utf-8'))
+    if resp.headers.get('Content-Type') == 'application/x-ndjson':
+        return status, [json.loads(line) for line in text.splitlines()]
+    return status, json.loads(text)
+
+
+def test_load_slate_is_idempotent(base_url):
+    status, loaded = _call(base_url, 'POST', '/slates', {'source': 'players', 'players': _players()})
+    assert status == 200 and loaded['players'] == len(_players())
+    _, again = _call(base_url, 'POST', '/slates', {'source': 'players', 'players': _players()})
+    assert again['slate'] == loaded['slate']
+    _, health = _call(base_url, 'GET', '/health')
+    assert health == {'status': 'ok', 'slates': 1, 'workers': 2}
+    _, listed = _call(base_url, 'GET', '/slates')
+    assert [s['slate'] for s in listed] == [loaded['slate']]
+
+
+def test_lineups_stream_and_repeat_from_memory(base_url):
+    _, loaded = _call(base_url, 'POST', '/slates', {'source': 'players', 'players': _players()})
+    request = {'preset': 'default', 'count': 4, 'options': {'overlap_max': 6}}
+    status, records = _call(base_url, 'POST', f"/slates/{loaded['slate']}/lineups", request)
+    assert status == 200
+    *lineups, done = records
+    assert done['done'] and done['lineups'] == 4 and not done['cached']
+    assert all(len(r['lineup']) == 9 and r['event']['status'] == 'Optimal' for r in lineups)
+
+    expected = generate_n_lineups([Player(**row) for row in _players()], n=4, overlap_max=6)
+    assert [sorted(r['lineup']) for r in lineups] == [sorted(lu) for lu in expected]
+
+    _, repeat = _call(base_url, 'POST', f"/slates/{loaded['slate']}/lineups", request)
+    assert repeat[-1]['cached'] and [r['lineup'] for r in repeat[:-1]] == [r['lineup'] for r in lineups]
+
+
+def test_concurrent_requests(base_url):
+    _, loaded = _call(base_url, 'POST', '/slates', {'source': 'players', 'players': _players()})
+    results = {}
+
+    def request(preset):
+        results[preset] = _call(base_url, 'POST', f"/slates/{loaded['slate']}/lineups",
+                                {'preset': preset, 'count': 3, 'options': {'engine': 'native', 'overlap_max': 7}})
+
+    threads = [threading.Thread(target=request, args=(p,)) for p in ('default', 'contrarian', 'cash')]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for status, records in results.values():
+        assert status == 200 and records[-1]['lineups'] == 3
+
+
+def test_request_errors(base_url):
+    assert _call(base_url, 'POST', '/slates/0123/lineups', {})[0] == 404
+    _, loaded = _call(base_url, 'POST', '/slates', {'source': 'mock'})
+    path = f"/slates/{loaded['slate']}/lineups"
+    assert _call(base_url, 'POST', path, {'preset': 'nope'})[0] == 400
+    status, error = _call(base_url, 'POST', path, {'options': {'n': 3, 'bogus': 1}})
+    assert status == 400 and 'bogus' in error['error']
+    assert _call(base_url, 'POST', '/slates', {'source': 'salary'})[0] == 400
+    status, error = _call(base_url, 'POST', '/slates', {'source': 'merge', 'path': 'week.csv'})
+    assert status == 400 and 'projections' in error['error']
+    assert _call(base_url, 'DELETE', f"/slates/{loaded['slate']}")[0] == 200
+    assert _call(base_url, 'DELETE', f"/slates/{loaded['slate']}")[0] == 404
+
+
+def test_merge_source_carries_projections(tmp_path):
+    players = mock.fetch_players_for_week()
+    (tmp_path / 'salaries.csv').write_text(
+        'Name,Salary,Position,Team\n' + ''.join(f"{p.name},{p.salary},{p.position},{p.team}\n" for p in players), encoding='utf-8')
+    (tmp_path / 'proj.csv').write_text(
+        'Player,Pos,Team,FPTS\n' + ''.join(f"{p.name},{p.position},{p.team},{p.proj}\n" for p in players), encoding='utf-8')
+    service = server.OptimizerService(workers=1)
+    try:
+        entry = service.load_slate({'source': 'merge', 'path': str(tmp_path / 'salaries.csv'), 'projections': [str(tmp_path / 'proj.csv')]})
+        assert sorted(entry.slate.proj) == sorted(p.proj for p in players) and min(entry.slate.proj) > 0
+        with pytest.raises(server.RequestError):
+            service.load_slate({'source': 'merge', 'path': str(tmp_path / 'salaries.csv'), 'projections': [str(tmp_path / 'missing.csv')]})
+    finally:
+        service.close()
+
+
+def test_projection_update_reuses_earlier_run_as_warm_start():
+    service = server.OptimizerService(workers=1)
+    try:
+        first = service.load_slate({'source': 'players', 'players': _players()})
+        list(service.lineups(first.id, {'count': 2, 'options': {'overlap_max': 6}}))
+        updated = _players()
+        updated[0]['proj'] += 3.0
+        second = service.load_slate({'source': 'players', 'players': updated})
+        assert second.id != first.id and second.structure == first.structure
+        *lineups, done = service.lineups(second.id, {'count': 2, 'options': {'overlap_max': 6}})
+        assert done['lineups'] == 2 and not done['cached']
+        assert len(service.results) == 2 and len(service.latest) == 1
+    finally:
+        service.close()
+
+
+def test_exposure_options_skip_pruning():
+    service = server.OptimizerService(workers=1)
+    try:
+        entry = service.load_slate({'source': 'players', 'players': _players()})
+        slate, options = service._slate_for(entry, {'n': 4, 'diversity': 'exposure', 'exposure_penalty': 2.0})
+        assert slate is entry.slate and options['exposure_penalty'] == 2.0
+        slate, options = service._slate_for(entry, {'n': 4, 'exposure_penalty': 2.0})
+        assert len(slate) < len(entry.slate) and not options['prune']
+    finally:
+        service.close()
+
+
+def test_runs_with_unproven_solves_are_not_remembered(monkeypatch):
+    real = server.iter_lineups
+
+    def time_limited(slate, on_iteration=None, **options):
+        return real(slate, on_iteration=lambda event: on_iteration(dict(event, proven=False)), **options)
+
+    monkeypatch.setattr(server, 'iter_lineups', time_limited)
+    service = server.OptimizerService(workers=1)
+    try:
+        entry = service.load_slate({'source': 'players', 'players': _players()})
+        *lineups, done = service.lineups(entry.id, {'count': 2, 'options': {'overlap_max': 6, 'time_limit': 1}})
+        assert len(lineups) == 2 and not done['cached']
+        assert not service.results
+    finally:
+        service.close()
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.optimizer import generate_n_lineups, lineup_proj
+from src.simulation import simulate_lineups
+
+
+def test_simulation_stats_are_chunk_invariant():
+    lineups = generate_n_lineups(mock.fetch_players_for_week(), n=3)
+    whole = simulate_lineups(lineups, n_sims=4000, chunk_size=4000, seed=3)
+    chunked = simulate_lineups(lineups, n_sims=4000, chunk_size=700, seed=3)
+    assert np.allclose(whole.mean, chunked.mean)
+    assert np.array_equal(whole.top_frequency, chunked.top_frequency)
+    assert np.array_equal(whole.percentiles[50], chunked.percentiles[50])
+
+
+def test_simulation_summary():
+    lineups = generate_n_lineups(mock.fetch_players_for_week(), n=3)
+    result = simulate_lineups(lineups, n_sims=20000, seed=1)
+    for j, lu in enumerate(lineups):
+        # Flooring at zero only nudges the mean up
+        assert result.mean[j] == pytest.approx(lineup_proj(lu), rel=0.05)
+        assert result.percentiles[10][j] < result.percentiles[50][j] < result.percentiles[90][j]
+    # One lineup out of three is "top 1%" in every simulation
+    assert result.top_frequency.sum() == pytest.approx(1.0)
+
+
+def test_teammate_correlation_widens_distribution():
+    lineups = generate_n_lineups(mock.fetch_players_for_week(), n=1)
+    independent = simulate_lineups(lineups, n_sims=20000, seed=2, correlations={})
+    correlated = simulate_lineups(lineups, n_sims=20000, seed=2, correlations={('QB', 'WR', 'team'): 0.9, ('QB', 'DST', 'team'): 0.9, ('WR', 'DST', 'team'): 0.9})
+    assert correlated.std[0] > independent.std[0]
@@ -0,0 +1,32 @@
+import os
+import sys
+
+# Ensure repo root is on sys.path so `src` package can be imported during tests
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.data_sources import mock
+from src.optimizer import generate_n_lineups, lineup_salary, lineup_proj
+from src.slate import compile_slate
+
+
+def test_compiled_slate_groups():
+    players = mock.fetch_players_for_week()
+    slate = compile_slate(players)
+    assert len(slate) == len(players)
+    assert sorted(slate.ids[i] for i in slate.position('DST')) == ['DST1', 'DST2']
+    assert sorted(slate.ids[i] for i in slate.position('RB')) == ['FLEX_RB', 'RB1', 'RB2', 'RB3']
+    assert sorted(slate.ids[i] for i in slate.by_team['KC']) == ['DST2', 'QB2', 'TE1', 'WR2']
+    assert [slate.ids[i] for i in slate.team_position('NE', 'WR')] == ['WR3']
+    assert len(slate.team_position('MIA', 'QB')) == 0
+    assert compile_slate(slate) is slate
+
+
+def test_lineup_totals_from_slate():
+    slate = compile_slate(mock.fetch_players_for_week())
+    lineups = generate_n_lineups(slate, n=2)
+    assert len(lineups) == 2
+    for lu in lineups:
+        assert lineup_salary(lu, slate) == lineup_salary(lu)
+        assert abs(lineup_proj(lu, slate) - lineup_proj(lu)) < 1e-9
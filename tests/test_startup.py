@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+RUNS = 3
+
+# Seconds over a bare interpreter start, for the fastest of RUNS fresh
+# interpreters. They leave room for slow machines; the module checks catch a
+# heavy import creeping back in even while it still fits the budget.
+HELP_BUDGET_S = 0.5
+MOCK_RUN_BUDGET_S = 1.0
+
+_PROBE = """
+import json, runpy, sys
+sys.argv = ['src.cli'] + json.loads(sys.argv[1])
+try:
+    runpy.run_module('src.cli', run_name='__main__')
+except SystemExit:
+    pass
+print(json.dumps(sorted(m for m in ('requests', 'bs4', 'pulp') if m in sys.modules)), file=sys.stderr)
+"""
+
+
+def _fastest(cmd):
+    best, result = None, None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        assert result.returncode == 0, result.stderr
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+@pytest.fixture(scope='module')
+def bare_start():
+    return _fastest([sys.executable, '-c', 'pass'])[0]
+
+
+@pytest.mark.parametrize('args, budget, allowed', [
+    (['--help'], HELP_BUDGET_S, []),
+    (['--source', 'mock', '--count', '2', '--engine', 'native'], MOCK_RUN_BUDGET_S, []),
+    (['--source', 'mock', '--count', '2'], MOCK_RUN_BUDGET_S, ['pulp']),
+])
+def test_cli_startup_budget(bare_start, args, budget, allowed):
+    elapsed, result = _fastest([sys.executable, '-c', _PROBE, json.dumps(args)])
+    loaded = json.loads(result.stderr.strip().splitlines()[-1])
+    assert loaded == allowed, f"{' '.join(args)} imported {loaded}"
+    assert elapsed - bare_start <= budget, f"{' '.join(args)} took {elapsed - bare_start:.3f}s over interpreter start (budget {budget}s)"